@@ -15,14 +15,22 @@ from agentlang.chat_history.chat_history_models import (
     format_duration_to_str,
     parse_duration_from_str,
 )
+from agentlang.chat_history.chat_history_store import (
+    ChatHistoryStore,
+    JournaledChatHistoryStore,
+    JsonFileChatHistoryStore,
+)
 from agentlang.llms.token_usage.models import TokenUsage
 
 __all__ = [
     'AssistantMessage',
+    'ChatHistoryStore',
     'ChatMessage',
     'CompressionConfig',
     'CompressionInfo',
     'FunctionCall',
+    'JournaledChatHistoryStore',
+    'JsonFileChatHistoryStore',
     'SystemMessage',
     'TokenUsage',
     'ToolCall',
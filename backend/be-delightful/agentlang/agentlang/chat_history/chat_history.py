@@ -3,11 +3,12 @@
 This module defines classes for managing chat history.
 """
 
+import hashlib
 import json
 import os
 from dataclasses import asdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import tiktoken
 
@@ -26,11 +27,27 @@ from agentlang.chat_history.chat_history_models import (
     format_duration_to_str,
     parse_duration_from_str,
 )
+from agentlang.chat_history.chat_history_store import ChatHistoryStore, JournaledChatHistoryStore
 from agentlang.llms.token_usage.models import TokenUsage
 from agentlang.logger import get_logger
 
 logger = get_logger(__name__)
 
+_encoding = None
+_encoding_failed = False
+
+
+def _get_encoding():
+    """Get the shared tiktoken encoder, or None if it cannot be loaded"""
+    global _encoding, _encoding_failed
+    if _encoding is None and not _encoding_failed:
+        try:
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            _encoding_failed = True
+            logger.warning(f"Failed to load tiktoken encoder: {e!s}, will use fallback calculation method for messages without token_usage")
+    return _encoding
+
 # ==============================================================================
 # ChatHistory class
 # ==============================================================================
@@ -42,7 +59,8 @@ class ChatHistory:
     """
 
     def __init__(self, agent_name: str, agent_id: str, chat_history_dir: str,
-                 compression_config: Optional[CompressionConfig] = None):
+                 compression_config: Optional[CompressionConfig] = None,
+                 store_factory: Optional[Callable[[str], ChatHistoryStore]] = None):
         """
         Initialize ChatHistory.
 
@@ -51,6 +69,8 @@ class ChatHistory:
             agent_id (str): Agent unique ID, used to construct filename.
             chat_history_dir (str): Directory to store chat history files.
             compression_config (Optional[CompressionConfig]): Compression config, uses default if not provided.
+            store_factory (Optional[Callable[[str], ChatHistoryStore]]): Builds the persistence backend from the
+                history file path, defaults to JournaledChatHistoryStore.
         """
         if not agent_name:
             raise ValueError("agent_name cannot be empty")
@@ -73,8 +93,20 @@ class ChatHistory:
         self._last_compression_message_count = 0
         self._last_compression_token_count = 0
 
+        # Per-message token counts, parallel to self.messages; None means not calculated yet
+        self._message_tokens: Optional[List[int]] = None
+        self._tokens_total = 0
+
+        # Messages converted to LLM API format, parallel to a prefix of self.messages
+        # (None entries are messages not sent to the LLM); extended by get_messages_for_llm()
+        self._llm_messages: Optional[List[Optional[Dict[str, Any]]]] = None
+
+        # Hash of the tools list last written to (or found in) the .tools.json file
+        self._saved_tools_hash: Optional[str] = None
+
         os.makedirs(self.chat_history_dir, exist_ok=True) # Ensure directory exists
         self._history_file_path = self._build_chat_history_filename()
+        self._store = (store_factory or JournaledChatHistoryStore)(self._history_file_path)
         self.load() # Try loading history on initialization
 
         # Instantiate compressor
@@ -93,117 +125,154 @@ class ChatHistory:
     @property
     def tokens_count(self) -> int:
         """
-        Calculate total token count consumed in chat history.
-        Prioritizes using existing token_usage data in messages, for messages without token_usage,
-        uses tiktoken to calculate token count and saves to message's token_usage attribute.
+        Get total token count consumed in chat history.
+        Per-message counts are cached when messages are added and kept in a running total,
+        so this is O(1) unless the cache was invalidated by replace() or load().
 
         Returns:
             int: Total token count
         """
-        encoding = None
-        try:
-            # Try to load encoder, if failed then handle in subsequent steps
-            encoding = tiktoken.get_encoding("cl100k_base")
-        except Exception as e:
-            logger.warning(f"Failed to load tiktoken encoder: {e!s}, will use fallback calculation method for messages without token_usage")
+        if self._message_tokens is None or len(self._message_tokens) != len(self.messages):
+            self._rebuild_token_cache()
+        return self._tokens_total
+
+    def _rebuild_token_cache(self) -> None:
+        """Recalculate token counts of all messages and persist any token_usage estimates"""
+        self._message_tokens = []
+        self._tokens_total = 0
+        for i in range(len(self.messages)):
+            tokens, usage_updated = self._calculate_message_tokens(i)
+            self._message_tokens.append(tokens)
+            self._tokens_total += tokens
+            if usage_updated:
+                self._persist_update(i)
+
+    def _invalidate_token_cache(self) -> None:
+        """Drop cached token counts; they are rebuilt on next tokens_count access"""
+        self._message_tokens = None
+        self._tokens_total = 0
+
+    def _cache_message_tokens(self, index: int) -> None:
+        """
+        Calculate and cache token count for a newly inserted message.
+        Must be called before the message is persisted, so a token_usage estimate is stored with it.
+        """
+        if self._message_tokens is None or len(self._message_tokens) != len(self.messages) - 1:
+            self._invalidate_token_cache()
+            return
+        tokens, _ = self._calculate_message_tokens(index)
+        self._message_tokens.insert(index, tokens)
+        self._tokens_total += tokens
+
+    def _uncache_last_message_tokens(self) -> None:
+        """Remove cached token count of a message just popped from the end"""
+        if self._message_tokens is None or len(self._message_tokens) != len(self.messages) + 1:
+            self._invalidate_token_cache()
+            return
+        self._tokens_total -= self._message_tokens.pop()
 
-        total_tokens = 0
-        history_updated = False
-
-        for i, msg in enumerate(self.messages):
-            msg_tokens = 0
-
-            # 1. Prioritize using existing token_usage data
-            if isinstance(msg, AssistantMessage) and msg.token_usage is not None:
-                # For AssistantMessage use token_usage object (unified as TokenUsage type)
-                # If total_tokens exists, use it; otherwise use output_tokens or input_tokens
-                if hasattr(msg.token_usage, "total_tokens") and msg.token_usage.total_tokens > 0:
-                    msg_tokens = msg.token_usage.total_tokens
-                elif hasattr(msg.token_usage, "output_tokens") and msg.token_usage.output_tokens > 0:
-                    msg_tokens = msg.token_usage.output_tokens
-                elif hasattr(msg.token_usage, "input_tokens") and msg.token_usage.input_tokens > 0:
-                    msg_tokens = msg.token_usage.input_tokens
-
-                if msg_tokens > 0:
-                    total_tokens += msg_tokens
-                    continue  # Valid token_usage data exists, skip tiktoken calculation
-
-            # 2. No valid token_usage data, use tiktoken calculation
-            if encoding:
-                try:
-                    # Calculate tokens of message content
-                    content = getattr(msg, 'content', '') or ''
-                    content_tokens = len(encoding.encode(content))
-
-                    # Estimate message metadata tokens (role, etc.)
-                    metadata_tokens = 4  # Approximately 4 tokens per message for basic metadata like role
-
-                    # Handle tool call messages
-                    if isinstance(msg, AssistantMessage) and msg.tool_calls:
-                        tool_tokens = 0
-                        for tc in msg.tool_calls:
-                            # Calculate tokens of tool name and parameters
-                            tool_name = tc.function.name
-                            tool_args = tc.function.arguments
-
-                            # Calculate tokens for tool call
-                            tool_tokens += len(encoding.encode(tool_name)) + len(encoding.encode(tool_args)) + 10
-                        content_tokens += tool_tokens
-
-                    # Handle tool result message
-                    if isinstance(msg, ToolMessage):
-                        metadata_tokens += 4  # Extra token for tool result message
-
-                    msg_tokens = content_tokens + metadata_tokens
-
-                    # 3. Save calculation result to message's token_usage attribute
-                    if isinstance(msg, AssistantMessage):
-                        if msg.token_usage is None:
-                            # Use new TokenUsage class to create object
-                            # As estimate, allocate all msg_tokens to output_tokens
-                            msg.token_usage = TokenUsage(
-                                input_tokens=0,
-                                output_tokens=msg_tokens,
-                                total_tokens=msg_tokens
-                            )
-                            history_updated = True
-
-                    total_tokens += msg_tokens
-
-                except Exception as e:
-                    logger.warning(f"Failed to calculate token for message {i+1} using tiktoken: {e!s}")
-                    # Use fallback plan when calculation fails: estimate based on content length
-                    try:
-                        content = getattr(msg, 'content', '') or ''
-                        # Rough estimate: 1 token ≈ 4 characters
-                        estimated_tokens = len(content) // 4 + 5  # 5 is base overhead
-                        total_tokens += estimated_tokens
-                        logger.warning(f"Using length estimation method to calculate token: {estimated_tokens}")
-                    except Exception as est_err:
-                        logger.error(f"Fallback token estimation also failed: {est_err!s}")
-                        # If even estimation fails, add minimum value
-                        total_tokens += 5
+    def _recache_message_tokens(self, index: int) -> None:
+        """Recalculate cached token count of a message changed in place"""
+        if self._message_tokens is None or len(self._message_tokens) != len(self.messages):
+            self._invalidate_token_cache()
+            return
+        tokens, _ = self._calculate_message_tokens(index)
+        self._tokens_total += tokens - self._message_tokens[index]
+        self._message_tokens[index] = tokens
 
-            else:
-                # If no encoding available, use character length estimation
+    def _calculate_message_tokens(self, index: int) -> Tuple[int, bool]:
+        """
+        Calculate token count of a single message.
+        Prioritizes using existing token_usage data, for messages without token_usage,
+        uses tiktoken to calculate token count and saves to message's token_usage attribute.
+
+        Args:
+            index (int): Index of the message in self.messages
+
+        Returns:
+            Tuple[int, bool]: Token count, and whether the message's token_usage was filled in
+        """
+        msg = self.messages[index]
+        msg_tokens = 0
+
+        # 1. Prioritize using existing token_usage data
+        if isinstance(msg, AssistantMessage) and msg.token_usage is not None:
+            # For AssistantMessage use token_usage object (unified as TokenUsage type)
+            # If total_tokens exists, use it; otherwise use output_tokens or input_tokens
+            if hasattr(msg.token_usage, "total_tokens") and msg.token_usage.total_tokens > 0:
+                msg_tokens = msg.token_usage.total_tokens
+            elif hasattr(msg.token_usage, "output_tokens") and msg.token_usage.output_tokens > 0:
+                msg_tokens = msg.token_usage.output_tokens
+            elif hasattr(msg.token_usage, "input_tokens") and msg.token_usage.input_tokens > 0:
+                msg_tokens = msg.token_usage.input_tokens
+
+            if msg_tokens > 0:
+                return msg_tokens, False  # Valid token_usage data exists, skip tiktoken calculation
+
+        # 2. No valid token_usage data, use tiktoken calculation
+        encoding = _get_encoding()
+        if encoding:
+            try:
+                # Calculate tokens of message content
+                content = getattr(msg, 'content', '') or ''
+                content_tokens = len(encoding.encode(content))
+
+                # Estimate message metadata tokens (role, etc.)
+                metadata_tokens = 4  # Approximately 4 tokens per message for basic metadata like role
+
+                # Handle tool call messages
+                if isinstance(msg, AssistantMessage) and msg.tool_calls:
+                    tool_tokens = 0
+                    for tc in msg.tool_calls:
+                        # Calculate tokens of tool name and parameters
+                        tool_name = tc.function.name
+                        tool_args = tc.function.arguments
+
+                        # Calculate tokens for tool call
+                        tool_tokens += len(encoding.encode(tool_name)) + len(encoding.encode(tool_args)) + 10
+                    content_tokens += tool_tokens
+
+                # Handle tool result message
+                if isinstance(msg, ToolMessage):
+                    metadata_tokens += 4  # Extra token for tool result message
+
+                msg_tokens = content_tokens + metadata_tokens
+
+                # 3. Save calculation result to message's token_usage attribute
+                if isinstance(msg, AssistantMessage) and msg.token_usage is None:
+                    # Use new TokenUsage class to create object
+                    # As estimate, allocate all msg_tokens to output_tokens
+                    msg.token_usage = TokenUsage(
+                        input_tokens=0,
+                        output_tokens=msg_tokens,
+                        total_tokens=msg_tokens
+                    )
+                    return msg_tokens, True
+
+                return msg_tokens, False
+
+            except Exception as e:
+                logger.warning(f"Failed to calculate token for message {index+1} using tiktoken: {e!s}")
+                # Use fallback plan when calculation fails: estimate based on content length
                 try:
                     content = getattr(msg, 'content', '') or ''
                     # Rough estimate: 1 token ≈ 4 characters
                     estimated_tokens = len(content) // 4 + 5  # 5 is base overhead
-                    total_tokens += estimated_tokens
+                    logger.warning(f"Using length estimation method to calculate token: {estimated_tokens}")
+                    return estimated_tokens, False
                 except Exception as est_err:
-                    logger.error(f"Fallback token estimation failed: {est_err!s}")
-                    total_tokens += 5
+                    logger.error(f"Fallback token estimation also failed: {est_err!s}")
+                    # If even estimation fails, add minimum value
+                    return 5, False
 
-        # If token_usage was updated, save chat history
-        if history_updated:
-            try:
-                self.save()
-                logger.debug("Updated message token_usage data and saved chat history")
-            except Exception as e:
-                logger.warning(f"Failed to save updated token_usage data: {e!s}")
-
-        return total_tokens
+        # If no encoding available, use character length estimation
+        try:
+            content = getattr(msg, 'content', '') or ''
+            # Rough estimate: 1 token ≈ 4 characters
+            return len(content) // 4 + 5, False  # 5 is base overhead
+        except Exception as est_err:
+            logger.error(f"Fallback token estimation failed: {est_err!s}")
+            return 5, False
 
     def _build_chat_history_filename(self) -> str:
         """Build complete file path for chat history"""
@@ -217,22 +286,23 @@ class ChatHistory:
 
     def exists(self) -> bool:
         """Check if history record file exists"""
-        return os.path.exists(self._history_file_path)
+        return self._store.exists()
 
     def load(self) -> None:
         """
-        Load chat history from JSON file.
+        Load chat history from the history store (JSON snapshot plus journal, if any).
         Will look for 'duration' string field and try to parse as duration_ms (float).
         Will look for 'show_in_ui' field, default to True if not present.
         """
+        self._invalidate_token_cache()
+        self._invalidate_llm_message_cache()
         if not self.exists():
             logger.info(f"Chat history file does not exist: {self._history_file_path}, will initialize as empty history.")
             self.messages = []
             return
 
         try:
-            with open(self._history_file_path, "r", encoding='utf-8') as f:
-                history_data = json.load(f)
+            history_data = self._store.load()
 
             loaded_messages = []
             if isinstance(history_data, list):
@@ -321,77 +391,121 @@ class ChatHistory:
 
     def save(self) -> None:
         """
-        Save current chat history to JSON file.
+        Save current chat history as a full snapshot (and compact the journal, if any).
         For Assistant and Tool messages, converts duration_ms (float) to 'duration' (str) for storage.
         Includes show_in_ui field.
         Optional fields equal to None or default values will be omitted to reduce redundancy.
         """
         try:
-            history_to_save = []
-            for message in self.messages:
-                # Convert dataclass to dict (use to_dict method to ensure model-layer logic is applied)
-                if hasattr(message, 'to_dict') and callable(message.to_dict):
-                    msg_dict = message.to_dict()
-                else:
-                    # Fallback (should not execute in theory, since all message types have to_dict)
-                    msg_dict = asdict(message)
-                    logger.warning(f"Message object missing to_dict method: {type(message)}")
-
-                # 1. Handle duration (remove duration_ms, add duration str)
-                if isinstance(message, (AssistantMessage, ToolMessage)):
-                    duration_ms = msg_dict.pop('duration_ms', None) # Always remove ms field
-                    if duration_ms is not None:
-                        duration_str = format_duration_to_str(duration_ms)
-                        if duration_str:
-                            msg_dict['duration'] = duration_str
-                # Ensure other types also don't have duration_ms
-                elif 'duration_ms' in msg_dict:
-                     msg_dict.pop('duration_ms')
-
-                # 2. Remove optional fields with default values (show_in_ui, content, tool_calls, system already handled in to_dict)
-                # Here we additionally check for None values that to_dict may still retain (e.g., failed token_usage conversion)
-                # And ensure compression_info is removed when None
-                keys_to_remove = []
-                for key, value in msg_dict.items():
-                    # Remove fields with None value (unless it's content or tool_calls which can be None)
-                    if value is None and key not in ['content', 'tool_calls']:
-                        keys_to_remove.append(key)
-                    # Special handling for compression_info, also remove if it's None
-                    elif key == 'compression_info' and value is None:
-                         keys_to_remove.append(key)
-                    # Check if token_usage is None or empty dict
-                    elif key == 'token_usage' and (value is None or (isinstance(value, dict) and not value)):
-                        keys_to_remove.append(key)
-
-                for key in keys_to_remove:
-                    msg_dict.pop(key)
-
-                # Remove ID field from message dict, as it's only for runtime
-                msg_dict.pop('id', None)
-
-                history_to_save.append(msg_dict)
-
-            # Use indent for pretty JSON output
-            history_json = json.dumps(history_to_save, indent=4, ensure_ascii=False)
-            with open(self._history_file_path, "w", encoding='utf-8') as f:
-                f.write(history_json)
+            self._store.write_snapshot(self._build_storage_snapshot())
             # logger.debug(f"Chat history saved to: {self._history_file_path}")
         except Exception as e:
             logger.error(f"Error saving chat history to {self._history_file_path}: {e}", exc_info=True)
 
-    def save_tools_list(self, tools_list: List[Dict[str, Any]]) -> None:
+    def _persist_append(self) -> None:
+        """Persist the last message as an append"""
+        try:
+            self._store.append(self._to_storage_dict(self.messages[-1]), self._build_storage_snapshot)
+        except Exception as e:
+            logger.error(f"Error appending chat history to {self._history_file_path}: {e}", exc_info=True)
+
+    def _persist_insert(self, index: int) -> None:
+        """Persist the message at index as an insert"""
+        try:
+            self._store.insert(index, self._to_storage_dict(self.messages[index]), self._build_storage_snapshot)
+        except Exception as e:
+            logger.error(f"Error inserting chat history entry into {self._history_file_path}: {e}", exc_info=True)
+
+    def _persist_update(self, index: int) -> None:
+        """Persist an in-place change of the message at index"""
+        try:
+            self._store.update(index, self._to_storage_dict(self.messages[index]), self._build_storage_snapshot)
+        except Exception as e:
+            logger.error(f"Error updating chat history entry in {self._history_file_path}: {e}", exc_info=True)
+
+    def _persist_pop(self) -> None:
+        """Persist removal of the last message"""
+        try:
+            self._store.pop(self._build_storage_snapshot)
+        except Exception as e:
+            logger.error(f"Error removing chat history entry from {self._history_file_path}: {e}", exc_info=True)
+
+    def _build_storage_snapshot(self) -> List[Dict[str, Any]]:
+        """Serialize all messages for storage"""
+        return [self._to_storage_dict(message) for message in self.messages]
+
+    def _to_storage_dict(self, message: ChatMessage) -> Dict[str, Any]:
+        """Convert a message to its stored dict form"""
+        # Convert dataclass to dict (use to_dict method to ensure model-layer logic is applied)
+        if hasattr(message, 'to_dict') and callable(message.to_dict):
+            msg_dict = message.to_dict()
+        else:
+            # Fallback (should not execute in theory, since all message types have to_dict)
+            msg_dict = asdict(message)
+            logger.warning(f"Message object missing to_dict method: {type(message)}")
+
+        # 1. Handle duration (remove duration_ms, add duration str)
+        if isinstance(message, (AssistantMessage, ToolMessage)):
+            duration_ms = msg_dict.pop('duration_ms', None) # Always remove ms field
+            if duration_ms is not None:
+                duration_str = format_duration_to_str(duration_ms)
+                if duration_str:
+                    msg_dict['duration'] = duration_str
+        # Ensure other types also don't have duration_ms
+        elif 'duration_ms' in msg_dict:
+             msg_dict.pop('duration_ms')
+
+        # 2. Remove optional fields with default values (show_in_ui, content, tool_calls, system already handled in to_dict)
+        # Here we additionally check for None values that to_dict may still retain (e.g., failed token_usage conversion)
+        # And ensure compression_info is removed when None
+        keys_to_remove = []
+        for key, value in msg_dict.items():
+            # Remove fields with None value (unless it's content or tool_calls which can be None)
+            if value is None and key not in ['content', 'tool_calls']:
+                keys_to_remove.append(key)
+            # Special handling for compression_info, also remove if it's None
+            elif key == 'compression_info' and value is None:
+                 keys_to_remove.append(key)
+            # Check if token_usage is None or empty dict
+            elif key == 'token_usage' and (value is None or (isinstance(value, dict) and not value)):
+                keys_to_remove.append(key)
+
+        for key in keys_to_remove:
+            msg_dict.pop(key)
+
+        # Remove ID field from message dict, as it's only for runtime
+        msg_dict.pop('id', None)
+
+        return msg_dict
+
+    def save_tools_list(self, tools_list: List[Dict[str, Any]], tools_hash: Optional[str] = None) -> None:
         """
         Save tools list to a .tools.json file with the same name as the chat history file.
+        The file is only written when the tools list changed since the last save.
 
         Args:
             tools_list (List[Dict[str, Any]]): The tools list to save.
+            tools_hash (Optional[str]): Hash identifying the tools list, computed from the list if not given.
         """
+        tools_file_path = self._build_tools_list_filename()
         try:
-            tools_file_path = self._build_tools_list_filename()
             # Use indent for pretty JSON output
             tools_json = json.dumps(tools_list, indent=4, ensure_ascii=False)
+            if tools_hash is None:
+                tools_hash = hashlib.sha256(tools_json.encode("utf-8")).hexdigest()
+            if tools_hash == self._saved_tools_hash:
+                return
+
+            # First save of this process: a previous run may already have written the same list
+            if self._saved_tools_hash is None and os.path.exists(tools_file_path):
+                with open(tools_file_path, "r", encoding="utf-8") as f:
+                    if f.read() == tools_json:
+                        self._saved_tools_hash = tools_hash
+                        return
+
             with open(tools_file_path, "w", encoding="utf-8") as f:
                 f.write(tools_json)
+            self._saved_tools_hash = tools_hash
             logger.debug(f"Tools list saved to: {tools_file_path}")
         except Exception as e:
             logger.error(f"Error saving tools list to {tools_file_path}: {e}", exc_info=True)
@@ -509,7 +623,8 @@ class ChatHistory:
                 return False
 
             self.messages.append(validated_message)
-            self.save()
+            self._cache_message_tokens(len(self.messages) - 1)
+            self._persist_append()
 
             # Asynchronously check and perform compression
             compressed = await self.check_and_compress_if_needed()
@@ -675,92 +790,124 @@ class ChatHistory:
         Build a whitelist-safe message list for LLM APIs (dict format).
         Only includes fields the API understands; internal fields (show_in_ui, duration_ms,
         token_usage, created_at, system/tool flags) are excluded.
+        Converted messages are cached, so only messages added since the previous call are converted.
+        The returned dicts are shared with the cache and must not be modified.
+
+        Returns:
+            List[Dict[str, Any]]: Messages in LLM API format.
         """
-        llm_messages = []
-        # Iterate all stored messages
-        for message in self.messages:
-            # Whitelist mode: only include fields required by the API
-            llm_msg: Dict[str, Any] = {"role": message.role}
-
-            role = message.role
-
-            if role == "system":
-                # System messages only need role and content
-                content = getattr(message, 'content', ' ')  # Ensure content exists
-                llm_msg["content"] = content if content and content.strip() else " "
-
-            elif role == "user":
-                # User message only needs role and content
-                content = getattr(message, 'content', ' ')
-                llm_msg["content"] = content if content and content.strip() else " "
-
-            elif role == "assistant":
-                # Assistant message can have content, tool_calls, or both
-                has_content = False
-                content = getattr(message, 'content', None)
-                # Only add content when it exists and is non-empty
-                if content and content.strip():
-                    llm_msg["content"] = content
-                    has_content = True
-
-                tool_calls = getattr(message, 'tool_calls', None)
-                has_tool_calls = False
-                if tool_calls:
-                    # Format tool_calls
-                    formatted_tool_calls = []
-                    for tc in tool_calls:
-                         # Ensure tc is ToolCall object and structure is valid
-                         if isinstance(tc, ToolCall) and isinstance(tc.function, FunctionCall) and tc.id and tc.function.name:
-                             arguments_str = tc.function.arguments
-                             # Ensure arguments is string
-                             if not isinstance(arguments_str, str):
-                                  try:
-                                      arguments_str = json.dumps(arguments_str, ensure_ascii=False)
-                                  except Exception:
-                                       logger.warning(f"Cannot serialize assistant tool_call arguments in get_messages_for_llm: {arguments_str}. Will use empty JSON object string.")
-                                       arguments_str = "{}"
-
-                             formatted_tool_calls.append({
-                                "id": tc.id,
-                                "type": tc.type,
-                                "function": {
-                                    "name": tc.function.name,
-                                    "arguments": arguments_str
-                                }
-                             })
-                         else:
-                              logger.warning(f"Skipping invalid assistant tool_call structure in get_messages_for_llm: {tc}")
-
-                    if formatted_tool_calls:
-                        llm_msg["tool_calls"] = formatted_tool_calls
-                        has_tool_calls = True
-
-                # Sanity check: Assistant message must have at least content or tool_calls
-                # If neither, force add space content to avoid API error
-                if not has_content and not has_tool_calls:
-                    logger.warning(f"Assistant message prepared for LLM has neither valid content nor tool calls: {message}. Forcing addition of space content.")
-                    llm_msg["content"] = " "
-
-            elif role == "tool":
-                # Tool message needs role, content, and tool_call_id
-                content = getattr(message, 'content', ' ')
-                llm_msg["content"] = content if content and content.strip() else " "
-                tool_call_id = getattr(message, 'tool_call_id', None)
-                if tool_call_id:
-                    llm_msg["tool_call_id"] = tool_call_id
-                else:
-                    logger.error(f"Tool message prepared for LLM is missing tool_call_id: {message}. This may cause API error.")
-                    # Continue adding message even if id is missing, let API layer handle the error
+        self._sync_llm_message_cache()
+        return [llm_msg for llm_msg in self._llm_messages if llm_msg is not None]
+
+    def _sync_llm_message_cache(self) -> None:
+        """Convert messages appended since the last call and add them to the LLM message cache"""
+        if self._llm_messages is None or len(self._llm_messages) > len(self.messages):
+            self._invalidate_llm_message_cache()
+        for message in self.messages[len(self._llm_messages):]:
+            self._llm_messages.append(self._to_llm_message(message))
+
+    def _invalidate_llm_message_cache(self, from_index: int = 0) -> None:
+        """
+        Drop cached LLM messages from an index on; they are converted again on next access.
 
-            # Other role types should not appear here, ignore if they do
+        Args:
+            from_index (int): Index of the first changed message, 0 drops the whole cache.
+        """
+        if from_index <= 0 or self._llm_messages is None:
+            self._llm_messages = []
+            return
+        del self._llm_messages[from_index:]
+
+    def _to_llm_message(self, message: ChatMessage) -> Optional[Dict[str, Any]]:
+        """
+        Convert a stored message to LLM API format.
+
+        Args:
+            message (ChatMessage): Message to convert.
+
+        Returns:
+            Optional[Dict[str, Any]]: Message dict, or None if the message must not be sent.
+        """
+        # Whitelist mode: only include fields required by the API
+        llm_msg: Dict[str, Any] = {"role": message.role}
+
+        role = message.role
+
+        if role == "system":
+            # System messages only need role and content
+            content = getattr(message, 'content', ' ')  # Ensure content exists
+            llm_msg["content"] = content if content and content.strip() else " "
+
+        elif role == "user":
+            # User message only needs role and content
+            content = getattr(message, 'content', ' ')
+            llm_msg["content"] = content if content and content.strip() else " "
+
+        elif role == "assistant":
+            # Assistant message can have content, tool_calls, or both
+            has_content = False
+            content = getattr(message, 'content', None)
+            # Only add content when it exists and is non-empty
+            if content and content.strip():
+                llm_msg["content"] = content
+                has_content = True
+
+            tool_calls = getattr(message, 'tool_calls', None)
+            has_tool_calls = False
+            if tool_calls:
+                # Format tool_calls
+                formatted_tool_calls = []
+                for tc in tool_calls:
+                     # Ensure tc is ToolCall object and structure is valid
+                     if isinstance(tc, ToolCall) and isinstance(tc.function, FunctionCall) and tc.id and tc.function.name:
+                         arguments_str = tc.function.arguments
+                         # Ensure arguments is string
+                         if not isinstance(arguments_str, str):
+                              try:
+                                  arguments_str = json.dumps(arguments_str, ensure_ascii=False)
+                              except Exception:
+                                   logger.warning(f"Cannot serialize assistant tool_call arguments in _to_llm_message: {arguments_str}. Will use empty JSON object string.")
+                                   arguments_str = "{}"
+
+                         formatted_tool_calls.append({
+                            "id": tc.id,
+                            "type": tc.type,
+                            "function": {
+                                "name": tc.function.name,
+                                "arguments": arguments_str
+                            }
+                         })
+                     else:
+                          logger.warning(f"Skipping invalid assistant tool_call structure in _to_llm_message: {tc}")
+
+                if formatted_tool_calls:
+                    llm_msg["tool_calls"] = formatted_tool_calls
+                    has_tool_calls = True
+
+            # Sanity check: Assistant message must have at least content or tool_calls
+            # If neither, force add space content to avoid API error
+            if not has_content and not has_tool_calls:
+                logger.warning(f"Assistant message prepared for LLM has neither valid content nor tool calls: {message}. Forcing addition of space content.")
+                llm_msg["content"] = " "
+
+        elif role == "tool":
+            # Tool message needs role, content, and tool_call_id
+            content = getattr(message, 'content', ' ')
+            llm_msg["content"] = content if content and content.strip() else " "
+            tool_call_id = getattr(message, 'tool_call_id', None)
+            if tool_call_id:
+                llm_msg["tool_call_id"] = tool_call_id
             else:
-                logger.warning(f"Encountered unknown role in get_messages_for_llm: {role}, skipped.")
-                continue # Skip this message
+                logger.error(f"Tool message prepared for LLM is missing tool_call_id: {message}. This may cause API error.")
+                # Continue adding message even if id is missing, let API layer handle the error
 
-            # --- Whitelist construction complete, no need to pop any fields --- #
-            llm_messages.append(llm_msg)
+        # Other role types should not appear here, ignore if they do
+        else:
+            logger.warning(f"Encountered unknown role in _to_llm_message: {role}, skipped.")
+            return None # Skip this message
 
-        return llm_messages
+        # --- Whitelist construction complete, no need to pop any fields --- #
+        return llm_msg
 
     def get_last_messages(self, n: int = 1) -> Union[Optional[ChatMessage], List[ChatMessage]]:
         """
@@ -817,7 +964,9 @@ class ChatHistory:
         """
         if self.messages:
             removed_message = self.messages.pop()
-            self.save()
+            self._uncache_last_message_tokens()
+            self._invalidate_llm_message_cache(len(self.messages))
+            self._persist_pop()
             logger.debug(f"Removed last message: {removed_message}")
             return removed_message
         logger.debug("Tried to remove last message, but history is empty.")
@@ -836,12 +985,15 @@ class ChatHistory:
             if len(self.messages) > 0:
                  insert_index = len(self.messages) - 1
                  self.messages.insert(insert_index, validated_message)
+                 self._cache_message_tokens(insert_index)
+                 self._invalidate_llm_message_cache(insert_index)
+                 self._persist_insert(insert_index)
                  logger.debug(f"Inserted message at index {insert_index}: {validated_message}")
             else:
                  self.messages.append(validated_message)
+                 self._cache_message_tokens(len(self.messages) - 1)
+                 self._persist_append()
                  logger.debug(f"History too short, appended message: {validated_message}")
-
-            self.save()
         except ValueError as e:
              logger.error(f"Failed to insert invalid message: {e}")
              raise
@@ -869,6 +1021,8 @@ class ChatHistory:
             # Replace messages
             self.messages.clear()
             self.messages.extend(validated_messages)
+            self._invalidate_token_cache()
+            self._invalidate_llm_message_cache()
 
             # Save updated history
             self.save()
@@ -1017,8 +1171,10 @@ class ChatHistory:
             if self.messages[i].role == "user":
             # Found user message; replace content
                 self.messages[i].content = new_content
+                self._recache_message_tokens(i)
+                self._invalidate_llm_message_cache(i)
                 # Persist change
-                self.save()
+                self._persist_update(i)
                 logger.debug(f"Replaced last user message content with: {new_content}")
                 return True
 
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+This module defines persistence backends for chat history.
+
+A store only deals with already-serialized message dicts; conversion between
+ChatMessage objects and dicts stays in ChatHistory.
+"""
+
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+
+from agentlang.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Lazily produces the full serialized message list; only called when a backend needs a full rewrite
+SnapshotProvider = Callable[[], List[Dict[str, Any]]]
+
+# ==============================================================================
+# Store interface
+# ==============================================================================
+
+class ChatHistoryStore(ABC):
+    """
+    Abstract persistence backend for ChatHistory.
+
+    Every mutating method also receives a provider for the full message list after the change,
+    so simple backends can ignore the incremental information and rewrite everything.
+    """
+
+    def __init__(self, history_file_path: str):
+        """
+        Initialize the store.
+
+        Args:
+            history_file_path (str): Path of the JSON snapshot file (`<agent_name><agent_id>.json`).
+        """
+        self.history_file_path = history_file_path
+
+    def exists(self) -> bool:
+        """Check if any persisted history exists"""
+        return os.path.exists(self.history_file_path)
+
+    @abstractmethod
+    def load(self) -> Optional[List[Any]]:
+        """
+        Load persisted message dicts.
+
+        Returns:
+            Optional[List[Any]]: Raw message entries, or None if nothing has been persisted.
+
+        Raises:
+            json.JSONDecodeError: If the snapshot file is not valid JSON.
+        """
+
+    @abstractmethod
+    def write_snapshot(self, messages: List[Dict[str, Any]]) -> None:
+        """Persist the complete message list, replacing any previous state"""
+
+    @abstractmethod
+    def append(self, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        """Persist a message appended at the end of the history"""
+
+    @abstractmethod
+    def insert(self, index: int, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        """Persist a message inserted at the given index"""
+
+    @abstractmethod
+    def update(self, index: int, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        """Persist an in-place update of the message at the given index"""
+
+    @abstractmethod
+    def pop(self, snapshot: SnapshotProvider) -> None:
+        """Persist removal of the last message"""
+
+    def _write_json_atomically(self, messages: List[Dict[str, Any]]) -> bytes:
+        """Write the message list as pretty JSON via a temp file and return the bytes written"""
+        data = json.dumps(messages, indent=4, ensure_ascii=False).encode("utf-8")
+        tmp_path = f"{self.history_file_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.history_file_path)
+        return data
+
+    def _read_snapshot(self) -> Optional[bytes]:
+        """Read raw snapshot bytes, or None if the file does not exist"""
+        if not os.path.exists(self.history_file_path):
+            return None
+        with open(self.history_file_path, "rb") as f:
+            return f.read()
+
+
+class JsonFileChatHistoryStore(ChatHistoryStore):
+    """
+    Legacy backend: rewrites the whole JSON file on every change.
+    """
+
+    def load(self) -> Optional[List[Any]]:
+        raw = self._read_snapshot()
+        if raw is None:
+            return None
+        return json.loads(raw.decode("utf-8"))
+
+    def write_snapshot(self, messages: List[Dict[str, Any]]) -> None:
+        self._write_json_atomically(messages)
+
+    def append(self, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        self.write_snapshot(snapshot())
+
+    def insert(self, index: int, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        self.write_snapshot(snapshot())
+
+    def update(self, index: int, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        self.write_snapshot(snapshot())
+
+    def pop(self, snapshot: SnapshotProvider) -> None:
+        self.write_snapshot(snapshot())
+
+
+class JournaledChatHistoryStore(ChatHistoryStore):
+    """
+    Append-only backend: a JSON snapshot (same format as the legacy file) plus a JSONL journal.
+
+    Each change appends one JSON line to `<history>.journal.jsonl`. When the journal grows past
+    `compact_every` records, or becomes larger than the snapshot, it is folded back into the snapshot.
+    The first journal line records the SHA-1 of the snapshot it applies to, so a journal left over
+    from a crash between snapshot rewrite and journal truncation is ignored instead of replayed twice.
+    """
+
+    JOURNAL_SUFFIX = ".journal.jsonl"
+
+    def __init__(self, history_file_path: str, compact_every: int = 200, min_compact_bytes: int = 64 * 1024):
+        """
+        Initialize the journaled store.
+
+        Args:
+            history_file_path (str): Path of the JSON snapshot file.
+            compact_every (int): Journal record count that triggers compaction.
+            min_compact_bytes (int): Journal size below which size-based compaction is not triggered.
+        """
+        super().__init__(history_file_path)
+        if history_file_path.endswith(".json"):
+            self.journal_file_path = history_file_path[:-len(".json")] + self.JOURNAL_SUFFIX
+        else:
+            self.journal_file_path = history_file_path + self.JOURNAL_SUFFIX
+        self.compact_every = compact_every
+        self.min_compact_bytes = min_compact_bytes
+
+        self._snapshot_digest: Optional[str] = None
+        self._snapshot_size = 0
+        self._journal_records = 0
+        self._journal_size = 0
+        self._journal_damaged = False
+
+    def exists(self) -> bool:
+        return os.path.exists(self.history_file_path) or os.path.exists(self.journal_file_path)
+
+    def load(self) -> Optional[List[Any]]:
+        raw = self._read_snapshot()
+        messages: List[Any] = []
+        if raw is not None:
+            messages = json.loads(raw.decode("utf-8"))
+            self._snapshot_size = len(raw)
+        else:
+            self._snapshot_size = 0
+        self._snapshot_digest = self._digest(raw or b"")
+        self._journal_records = 0
+        self._journal_size = 0
+        self._journal_damaged = False
+
+        if not os.path.exists(self.journal_file_path):
+            return messages if raw is not None else None
+
+        if not isinstance(messages, list):
+            logger.warning(f"Snapshot is not a list, ignoring journal: {self.journal_file_path}")
+            return messages
+
+        replayed = self._replay_journal(messages)
+        if replayed is None:
+            # Journal belongs to another snapshot; it will be overwritten on next write
+            os.remove(self.journal_file_path)
+            return messages if raw is not None else None
+        return replayed
+
+    def write_snapshot(self, messages: List[Dict[str, Any]]) -> None:
+        data = self._write_json_atomically(messages)
+        self._snapshot_digest = self._digest(data)
+        self._snapshot_size = len(data)
+        self._journal_damaged = False
+        self._reset_journal()
+
+    def append(self, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        self._write_record({"op": "append", "message": message}, snapshot)
+
+    def insert(self, index: int, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        self._write_record({"op": "insert", "index": index, "message": message}, snapshot)
+
+    def update(self, index: int, message: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        self._write_record({"op": "update", "index": index, "message": message}, snapshot)
+
+    def pop(self, snapshot: SnapshotProvider) -> None:
+        self._write_record({"op": "pop"}, snapshot)
+
+    def compact(self, snapshot: SnapshotProvider) -> None:
+        """Fold the journal into a fresh snapshot"""
+        logger.debug(f"Compacting chat history journal ({self._journal_records} records): {self.journal_file_path}")
+        self.write_snapshot(snapshot())
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        return hashlib.sha1(data).hexdigest()
+
+    def _reset_journal(self) -> None:
+        """Start a new journal bound to the current snapshot"""
+        header = json.dumps({"op": "base", "snapshot_sha1": self._snapshot_digest}) + "\n"
+        with open(self.journal_file_path, "w", encoding="utf-8") as f:
+            f.write(header)
+        self._journal_records = 0
+        self._journal_size = len(header)
+
+    def _write_record(self, record: Dict[str, Any], snapshot: SnapshotProvider) -> None:
+        if self._snapshot_digest is None or self._journal_damaged or not os.path.exists(self.journal_file_path):
+            # No usable journal (fresh history, legacy file or torn tail): start from a full snapshot
+            self.write_snapshot(snapshot())
+            return
+
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with open(self.journal_file_path, "a", encoding="utf-8") as f:
+            f.write(line)
+        self._journal_records += 1
+        self._journal_size += len(line.encode("utf-8"))
+
+        if self._journal_records >= self.compact_every or (
+            self._journal_size > self.min_compact_bytes and self._journal_size > self._snapshot_size
+        ):
+            self.compact(snapshot)
+
+    def _replay_journal(self, messages: List[Any]) -> Optional[List[Any]]:
+        """
+        Apply journal records on top of snapshot messages.
+
+        Returns:
+            Optional[List[Any]]: Resulting messages, or None if the journal does not match the snapshot.
+        """
+        with open(self.journal_file_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+
+        if not lines:
+            return None
+        try:
+            header = json.loads(lines[0])
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid chat history journal header, ignoring journal: {self.journal_file_path}")
+            return None
+        if header.get("op") != "base" or header.get("snapshot_sha1") != self._snapshot_digest:
+            logger.warning(f"Chat history journal does not match snapshot, ignoring journal: {self.journal_file_path}")
+            return None
+
+        self._journal_size = len(lines[0].encode("utf-8"))
+        for line_no, line in enumerate(lines[1:], start=2):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn trailing write is expected after a crash; anything after it is unusable
+                logger.warning(f"Truncated chat history journal at line {line_no}: {self.journal_file_path}")
+                self._journal_damaged = True
+                break
+
+            op = record.get("op")
+            if op == "append":
+                messages.append(record["message"])
+            elif op == "insert":
+                messages.insert(record["index"], record["message"])
+            elif op == "update":
+                index = record["index"]
+                if 0 <= index < len(messages):
+                    messages[index] = record["message"]
+            elif op == "pop":
+                if messages:
+                    messages.pop()
+            else:
+                logger.warning(f"Unknown chat history journal op '{op}' at line {line_no}, skipped")
+                continue
+
+            self._journal_records += 1
+            self._journal_size += len(line.encode("utf-8"))
+
+        return messages
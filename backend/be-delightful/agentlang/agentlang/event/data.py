@@ -42,6 +42,16 @@ class AfterLlmResponseEventData(BaseEventData):
     tool_context: ToolContext
     llm_response_message: ChatCompletionMessage  # LLM response message content
     show_in_ui: bool = True  # Whether to display in UI
+    first_token_time: Optional[float] = None  # Time to first token (seconds), stream mode only
+
+
+class LlmStreamDeltaEventData(BaseEventData):
+    """Event data structure for partial LLM response content in stream mode"""
+
+    model_name: str
+    tool_context: ToolContext
+    delta: str  # Content generated since the previous delta event
+    sequence: int  # Position of this delta in the response, starting at 0
 
 
 class BeforeToolCallEventData(BaseEventData):
@@ -14,6 +14,7 @@ class EventType(str, Enum):
     AFTER_CLIENT_CHAT = "after_client_chat"
     BEFORE_LLM_REQUEST = "before_llm_request"  # Event before calling LLM
     AFTER_LLM_REQUEST = "after_llm_request"  # Event after calling LLM
+    LLM_STREAM_DELTA = "llm_stream_delta"  # Partial LLM response in stream mode
     BEFORE_TOOL_CALL = "before_tool_call"  # Event before tool invocation
     AFTER_TOOL_CALL = "after_tool_call"  # Event after tool invocation
     AGENT_SUSPENDED = "agent_suspended"  # Agent termination event
@@ -24,6 +25,7 @@ class EventType(str, Enum):
     FILE_CREATED = "file_created"  # File creation event
     FILE_UPDATED = "file_updated"  # File update event
     FILE_DELETED = "file_deleted"  # File deletion event
+    TOOL_PROGRESS = "tool_progress"  # Partial output of a running tool
 
     ERROR = "error"  # Error event
 
@@ -5,11 +5,13 @@ This module provides a factory pattern for creating different LLM clients
 based on the model ID provided.
 """
 
+import json
 import os
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from openai import AsyncOpenAI
-from openai.types.chat import ChatCompletion
+from openai.types.chat import ChatCompletion, ChatCompletionMessageToolCall
 from pydantic import BaseModel
 
 from agentlang.config.config import config
@@ -21,6 +23,11 @@ from agentlang.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Receives each streamed content delta, None for chunks that only carry tool call fragments
+StreamDeltaCallback = Callable[[Optional[str]], Awaitable[None]]
+# Receives each streamed tool call as soon as its arguments form a complete JSON object
+ToolCallReadyCallback = Callable[[ChatCompletionMessageToolCall], Awaitable[None]]
+
 DEFAULT_TIMEOUT = int(config.get("llm.api_timeout", 600))
 MAX_RETRIES = int(config.get("llm.api_max_retries", 3))
 
@@ -159,6 +166,223 @@ class LLMFactory:
         if not llm_config:
             raise ValueError(f"Configuration not found for model ID {model_id}")
 
+        request_params = cls._build_request_params(llm_config, messages, tools, stop)
+
+        # Send request and get response
+        # logger.debug(f"Sending chat completion request to {llm_config.name}: {request_params}")
+        try:
+            response = await client.chat.completions.create(**request_params)
+
+            # Use TokenUsageTracker to record token usage
+            cls.token_tracker.record_llm_usage(
+                response.usage,
+                model_id,
+                user_id=agent_context.get_user_id() if agent_context else None,
+                model_name=llm_config.name
+            )
+
+            return response
+        except Exception as e:
+            logger.critical(f"Error calling LLM {model_id}: {e!r}", exc_info=True)
+            raise
+
+    @classmethod
+    async def call_with_tool_support_stream(
+        cls,
+        model_id: str,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        stop: Optional[List[str]] = None,
+        agent_context: Optional[AgentContextInterface] = None,
+        on_delta: Optional[StreamDeltaCallback] = None,
+        on_tool_call: Optional[ToolCallReadyCallback] = None,
+    ) -> ChatCompletion:
+        """Call LLM with tool support in streaming mode.
+
+        Content deltas are passed to on_delta as they arrive, tool calls are assembled from their
+        fragments, and the result is returned as a regular ChatCompletion so callers can treat it
+        like the response of call_with_tool_support.
+
+        Args:
+            model_id: The model ID to use.
+            messages: Chat message history.
+            tools: List of available tools, optional.
+            stop: List of stop sequences, optional.
+            agent_context: Agent context interface, optional.
+            on_delta: Awaited for every chunk with its content delta, optional.
+            on_tool_call: Awaited once per tool call whose arguments are complete, in index order,
+                before the rest of the response has arrived, optional.
+
+        Returns:
+            Assembled LLM response.
+
+        Raises:
+            ValueError: If model ID is not supported.
+        """
+        client = cls.get(model_id)
+        if not client:
+            raise ValueError(f"Unable to get client for model ID {model_id}")
+
+        llm_config = cls._configs.get(model_id)
+        if not llm_config:
+            raise ValueError(f"Configuration not found for model ID {model_id}")
+
+        request_params = cls._build_request_params(llm_config, messages, tools, stop)
+        request_params["stream"] = True
+        # Ask for a final usage chunk, providers that do not support it can turn it off
+        if config.get("llm.stream_include_usage", True):
+            request_params["stream_options"] = {"include_usage": True}
+
+        start_time = time.monotonic()
+        first_token_time: Optional[float] = None
+        response_id = None
+        created = None
+        model_name = llm_config.name
+        content_parts: List[str] = []
+        # Tool call index -> assembled id, name and argument fragments
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        # Tool calls are reported to on_tool_call in index order, this is the next one to report
+        next_ready_index: Optional[int] = None
+        finish_reason = None
+        usage = None
+
+        try:
+            stream = await client.chat.completions.create(**request_params)
+            async for chunk in stream:
+                response_id = response_id or chunk.id
+                created = created or chunk.created
+                model_name = chunk.model or model_name
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                delta = choice.delta
+                if delta is None or (not delta.content and not delta.tool_calls):
+                    continue
+
+                if first_token_time is None:
+                    first_token_time = time.monotonic() - start_time
+                    logger.info(f"LLM {model_id} time to first token: {first_token_time:.3f}s")
+
+                for tool_call_delta in delta.tool_calls or []:
+                    tool_call = tool_calls.setdefault(tool_call_delta.index, {"id": None, "name": "", "arguments": []})
+                    if tool_call_delta.id:
+                        tool_call["id"] = tool_call_delta.id
+                    function = tool_call_delta.function
+                    if function is not None:
+                        # The name arrives whole in the first fragment
+                        if function.name and not tool_call["name"]:
+                            tool_call["name"] = function.name
+                        if function.arguments:
+                            tool_call["arguments"].append(function.arguments)
+
+                # Report complete tool calls in order, so callers never see a call before an earlier one
+                while on_tool_call and tool_calls:
+                    if next_ready_index is None:
+                        next_ready_index = min(tool_calls)
+                    if next_ready_index not in tool_calls:
+                        break
+                    ready_tool_call = cls._get_ready_tool_call(tool_calls[next_ready_index])
+                    if ready_tool_call is None:
+                        # A later call has started, so this one is complete but not valid JSON: stop reporting
+                        if max(tool_calls) > next_ready_index:
+                            on_tool_call = None
+                        break
+                    next_ready_index += 1
+                    await on_tool_call(ready_tool_call)
+
+                if delta.content:
+                    content_parts.append(delta.content)
+                if on_delta:
+                    await on_delta(delta.content or None)
+
+            cls.token_tracker.record_llm_usage(
+                usage,
+                model_id,
+                user_id=agent_context.get_user_id() if agent_context else None,
+                model_name=llm_config.name
+            )
+        except Exception as e:
+            logger.critical(f"Error calling LLM {model_id} in streaming mode: {e!r}", exc_info=True)
+            raise
+
+        message: Dict[str, Any] = {"role": "assistant", "content": "".join(content_parts)}
+        if tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": tool_call["id"] or f"call_{index}",
+                    "type": "function",
+                    "function": {"name": tool_call["name"], "arguments": "".join(tool_call["arguments"])},
+                }
+                for index, tool_call in sorted(tool_calls.items())
+            ]
+        response = ChatCompletion.model_validate({
+            "id": response_id or "",
+            "object": "chat.completion",
+            "created": created or int(time.time()),
+            "model": model_name,
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": finish_reason or ("tool_calls" if tool_calls else "stop"),
+            }],
+            "usage": usage.model_dump() if usage else None,
+        })
+        total_time = time.monotonic() - start_time
+        logger.debug(f"LLM {model_id} stream finished in {total_time:.3f}s, {len(tool_calls)} tool calls")
+        return response
+
+    @staticmethod
+    def _get_ready_tool_call(tool_call: Dict[str, Any]) -> Optional[ChatCompletionMessageToolCall]:
+        """Get a streamed tool call if its arguments already form a complete JSON object.
+
+        Args:
+            tool_call: Tool call assembled so far, with id, name and argument fragments.
+
+        Returns:
+            The tool call, or None while its arguments are incomplete.
+        """
+        if not tool_call["id"] or not tool_call["name"] or not tool_call["arguments"]:
+            return None
+        # Only try to parse when the last non-blank fragment may close the object
+        last_fragment = next((fragment for fragment in reversed(tool_call["arguments"]) if fragment.strip()), "")
+        if not last_fragment.rstrip().endswith("}"):
+            return None
+        arguments = "".join(tool_call["arguments"])
+        try:
+            if not isinstance(json.loads(arguments), dict):
+                return None
+        except json.JSONDecodeError:
+            return None
+        return ChatCompletionMessageToolCall(
+            id=tool_call["id"],
+            type="function",
+            function={"name": tool_call["name"], "arguments": arguments},
+        )
+
+    @classmethod
+    def _build_request_params(
+        cls,
+        llm_config: LLMClientConfig,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        stop: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Build chat completion request parameters shared by the blocking and streaming calls.
+
+        Args:
+            llm_config: Model configuration.
+            messages: Chat message history.
+            tools: List of available tools, optional.
+            stop: List of stop sequences, optional.
+
+        Returns:
+            Request parameters for client.chat.completions.create.
+        """
         # Use native tool calling
         # Build request parameters
         request_params = {
@@ -211,23 +435,7 @@ class LLMFactory:
         for key, value in llm_config.extra_params.items():
             request_params[key] = value
 
-        # Send request and get response
-        # logger.debug(f"Sending chat completion request to {llm_config.name}: {request_params}")
-        try:
-            response = await client.chat.completions.create(**request_params)
-
-            # Use TokenUsageTracker to record token usage
-            cls.token_tracker.record_llm_usage(
-                response.usage,
-                model_id,
-                user_id=agent_context.get_user_id() if agent_context else None,
-                model_name=llm_config.name
-            )
-
-            return response
-        except Exception as e:
-            logger.critical(f"Error calling LLM {model_id}: {e!r}", exc_info=True)
-            raise
+        return request_params
 
     @classmethod
     def get_embedding_client(cls, model_id: str) -> Any:
@@ -14,6 +14,7 @@ import aiofiles
 import aiofiles.os
 
 from agentlang.logger import get_logger
+from agentlang.utils.line_index import get_line_count
 from agentlang.utils.token_estimator import num_tokens_from_string
 
 logger = get_logger(__name__)
@@ -364,8 +365,8 @@ def count_file_lines(file_path: Path) -> Optional[int]:
         # Optimization: for large files, don't actually read all lines
         if file_path.stat().st_size > 10 * 1024 * 1024: # Don't count if over 10MB
              return None
-        with file_path.open("r", encoding="utf-8", errors='ignore') as f:
-            return sum(1 for _ in f)
+        # Cached per file and revalidated by size and mtime, repeated listings do not re-read files
+        return get_line_count(file_path)
     except Exception as e:
         logger.debug(f"Failed to count file lines: {file_path}, error: {e}")
         return None
@@ -0,0 +1,190 @@
+"""
+Line offset index for text files
+
+Records the byte offset of every LINE_INDEX_STRIDE-th line, so a range of lines can be read by
+seeking close to it instead of iterating the whole file, and the total line count is known without
+materializing the file. Indexes are cached in memory per path and revalidated by size, mtime and inode.
+"""
+
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from agentlang.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Number of lines between two recorded offsets
+LINE_INDEX_STRIDE = 1000
+# Number of file indexes kept in memory
+LINE_INDEX_CACHE_SIZE = 256
+# Read size used when scanning files
+_SCAN_CHUNK_SIZE = 1024 * 1024
+
+# (size, mtime_ns, inode)
+FileSignature = Tuple[int, int, int]
+
+
+class LineIndex:
+    """Sparse newline offset index of one file"""
+
+    def __init__(self, path: Path, signature: FileSignature, total_lines: int, checkpoints: array):
+        """
+        Initialize the index
+
+        Args:
+            path: Indexed file
+            signature: (size, mtime_ns, inode) of the file when it was indexed
+            total_lines: Number of lines, a trailing line without newline included
+            checkpoints: checkpoints[i] is the byte offset where line i * LINE_INDEX_STRIDE starts
+        """
+        self.path = path
+        self.signature = signature
+        self.total_lines = total_lines
+        self.checkpoints = checkpoints
+
+    @classmethod
+    def build(cls, path: Path, signature: FileSignature) -> "LineIndex":
+        """
+        Scan a file and build its index
+
+        Args:
+            path: File to index
+            signature: Current (size, mtime_ns, inode) of the file
+
+        Returns:
+            LineIndex: Index of the file
+        """
+        checkpoints = array("Q", [0])
+        newline_count = 0
+        next_checkpoint = LINE_INDEX_STRIDE
+        offset = 0
+        last_byte = b""
+
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(_SCAN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunk_newlines = chunk.count(b"\n")
+                if newline_count + chunk_newlines < next_checkpoint:
+                    # Fast path: no checkpoint falls into this chunk
+                    newline_count += chunk_newlines
+                else:
+                    pos = 0
+                    while True:
+                        pos = chunk.find(b"\n", pos)
+                        if pos == -1:
+                            break
+                        pos += 1
+                        newline_count += 1
+                        if newline_count == next_checkpoint:
+                            checkpoints.append(offset + pos)
+                            next_checkpoint += LINE_INDEX_STRIDE
+                offset += len(chunk)
+                last_byte = chunk[-1:]
+
+        total_lines = newline_count
+        if offset and last_byte != b"\n":
+            total_lines += 1
+        # A checkpoint at end of file does not start a line
+        if len(checkpoints) > 1 and checkpoints[-1] >= offset:
+            checkpoints.pop()
+        return cls(path, signature, total_lines, checkpoints)
+
+    def read_lines(self, offset: int, limit: Optional[int] = None) -> List[str]:
+        """
+        Read a range of lines, keeping line endings like text-mode iteration does
+
+        Args:
+            offset: First line to read (0-based)
+            limit: Number of lines to read, None or non-positive reads to end of file
+
+        Returns:
+            List[str]: Lines in the range
+        """
+        if offset >= self.total_lines:
+            return []
+        offset = max(0, offset)
+        checkpoint = min(offset // LINE_INDEX_STRIDE, len(self.checkpoints) - 1)
+        skip = offset - checkpoint * LINE_INDEX_STRIDE
+        remaining = limit if limit and limit > 0 else None
+
+        lines: List[str] = []
+        with open(self.path, "rb") as f:
+            f.seek(self.checkpoints[checkpoint])
+            for raw_line in f:
+                if skip:
+                    skip -= 1
+                    continue
+                lines.append(_decode_line(raw_line))
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        break
+        return lines
+
+
+def _decode_line(raw_line: bytes) -> str:
+    line = raw_line.decode("utf-8", errors="replace")
+    if line.endswith("\r\n"):
+        line = line[:-2] + "\n"
+    return line
+
+
+_cache: "OrderedDict[str, LineIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_file_signature(path: Union[str, Path]) -> FileSignature:
+    """Get (size, mtime_ns, inode) of a file"""
+    st = os.stat(path)
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def get_line_index(path: Union[str, Path]) -> LineIndex:
+    """
+    Get the line index of a file, building it if the file is new or changed
+
+    Blocking; call from a worker thread in async code.
+
+    Args:
+        path: File path
+
+    Returns:
+        LineIndex: Index matching the current file content
+    """
+    path = Path(path).resolve()
+    key = str(path)
+    signature = get_file_signature(path)
+
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None and index.signature == signature:
+            _cache.move_to_end(key)
+            return index
+
+    index = LineIndex.build(path, signature)
+
+    with _cache_lock:
+        _cache[key] = index
+        _cache.move_to_end(key)
+        while len(_cache) > LINE_INDEX_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
+
+
+def get_line_count(path: Union[str, Path]) -> int:
+    """
+    Get the number of lines of a file through the cached index
+
+    Args:
+        path: File path
+
+    Returns:
+        int: Number of lines
+    """
+    return get_line_index(path).total_lines
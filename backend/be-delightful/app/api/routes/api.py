@@ -10,6 +10,10 @@ from app.api.routes.chat_history import router as chat_history_router
 
 # Import all routers that need to be registered
 from app.api.routes.websocket import router as websocket_router
+from app.service.agent_event.stream_listener_service import StreamListenerService
+from app.service.workspace_index_service import WorkspaceIndexService
+from app.utils.http_client import get_http_client_stats
+from delightful_use.browser_manager import BrowserManager
 
 # Create main router with unified prefix
 api_router = APIRouter(prefix="/api")
@@ -23,3 +27,27 @@ api_router.include_router(chat_history_router)
 async def health_check():
     """Health check endpoint for monitoring service status"""
     return {"status": "healthy"}
+
+
+@api_router.get("/streams/stats", tags=["base"])
+async def stream_stats():
+    """Per-stream send queue depth and lag, for monitoring slow clients"""
+    return {"streams": StreamListenerService.get_stream_stats()}
+
+
+@api_router.get("/workspace/index/stats", tags=["base"])
+async def workspace_index_stats():
+    """Workspace file index size and maintenance metrics"""
+    return WorkspaceIndexService.get_instance().get_stats()
+
+
+@api_router.get("/http/stats", tags=["base"])
+async def http_client_stats():
+    """Shared HTTP client request, connection reuse and DNS cache metrics"""
+    return get_http_client_stats()
+
+
+@api_router.get("/browser/stats", tags=["base"])
+async def browser_stats():
+    """Browser context pool, recycling and time to first usable page metrics"""
+    return BrowserManager().get_pool_stats()
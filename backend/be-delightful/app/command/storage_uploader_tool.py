@@ -17,6 +17,7 @@ from app.infrastructure.storage.base import AbstractStorage
 from app.infrastructure.storage.exceptions import InitException, UploadException
 from agentlang.logger import get_logger, setup_logger
 from app.paths import PathManager
+from app.utils.http_client import close_http_session, get_http_session
 
 cli_app = typer.Typer(name="storage-uploader", help="Storage Uploader Tool for various backends.", no_args_is_help=True)
 logger = get_logger(__name__)
@@ -261,27 +262,26 @@ class StorageUploaderTool:
         logger.info(f"===================================================")
 
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(api_url, json=request_data, headers=headers) as response:
-                    response_text = await response.text()
-                    logger.info(f"File registration API response status code: {response.status}")
-                    logger.debug(f"File registration API response content: {response_text}")
-                    if response.status == 200:
-                        try:
-                            result = json.loads(response_text)
-                            if result.get("code") == 1000:
-                                logger.info(f"File registration API call successful, total: {result.get('data', {}).get('total', 0)}, "
-                                          f"success: {result.get('data', {}).get('success', 0)}, "
-                                          f"skipped: {result.get('data', {}).get('skipped', 0)}")
-                                self.uploaded_files_for_registration.clear()
-                                return True
-                            else:
-                                logger.error(f"File registration API returned business error: {result.get('message', 'unknown error')}")
-                        except json.JSONDecodeError:
-                            logger.error(f"File registration API response is not valid JSON format: {response_text[:200]}...")
-                    else:
-                        logger.error(f"File registration API request failed, status code: {response.status}, response: {response_text[:200]}...")
+            session = get_http_session()
+            async with session.post(api_url, json=request_data, headers=headers) as response:
+                response_text = await response.text()
+                logger.info(f"File registration API response status code: {response.status}")
+                logger.debug(f"File registration API response content: {response_text}")
+                if response.status == 200:
+                    try:
+                        result = json.loads(response_text)
+                        if result.get("code") == 1000:
+                            logger.info(f"File registration API call successful, total: {result.get('data', {}).get('total', 0)}, "
+                                      f"success: {result.get('data', {}).get('success', 0)}, "
+                                      f"skipped: {result.get('data', {}).get('skipped', 0)}")
+                            self.uploaded_files_for_registration.clear()
+                            return True
+                        else:
+                            logger.error(f"File registration API returned business error: {result.get('message', 'unknown error')}")
+                    except json.JSONDecodeError:
+                        logger.error(f"File registration API response is not valid JSON format: {response_text[:200]}...")
+                else:
+                    logger.error(f"File registration API request failed, status code: {response.status}, response: {response_text[:200]}...")
             return False
         except Exception as e:
             logger.error(f"Severe error occurred while registering uploaded files: {e}", exc_info=True)
@@ -422,11 +422,14 @@ async def _run_storage_uploader_watch_async(
     once: bool,
     refresh: bool
 ):
-    await tool.watch_command(
-        workspace_dir=workspace_dir,
-        once=once,
-        refresh=refresh
-    )
+    try:
+        await tool.watch_command(
+            workspace_dir=workspace_dir,
+            once=once,
+            refresh=refresh
+        )
+    finally:
+        await close_http_session()
 
 @cli_app.command("watch")
 def start_storage_uploader_watcher(
@@ -7,6 +7,7 @@ import json
 import os
 import time
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
@@ -15,16 +16,32 @@ from agentlang.logger import get_logger
 from app.infrastructure.storage.exceptions import InitException, UploadException
 from app.infrastructure.storage.factory import StorageFactory
 from app.infrastructure.storage.types import VolcEngineCredentials
+from app.utils.http_client import close_http_session, get_http_session
 
 # Get logger
 logger = get_logger(__name__)
 
+# Persistent upload index, relative to the uploader's working directory (project root)
+DEFAULT_UPLOAD_INDEX_FILE = ".credentials/tos_upload_index.json"
+# Read size used when hashing files
+HASH_CHUNK_SIZE = 1024 * 1024
+# Minimum interval between index writes while uploads are in progress (seconds)
+INDEX_SAVE_INTERVAL = 5
+# Reload credentials this long before they expire (seconds), same margin as the storage backends
+CREDENTIALS_REFRESH_MARGIN = 180
+# Quiet period after the last event on a path before it is uploaded (seconds)
+UPLOAD_DEBOUNCE_SECONDS = 1.0
+# Number of concurrent uploads started by the watcher
+UPLOAD_CONCURRENCY = 4
+# Interval at which uploaded files are registered with the API in one request (seconds)
+REGISTER_FLUSH_INTERVAL = 2.0
+
 
 class TOSUploader:
     """TOS uploader utility"""
 
     def __init__(self, sandbox_id: str, workspace_dir: str, credentials_file: str = None,
-                task_id: str = None, organization_code: str = None):
+                task_id: str = None, organization_code: str = None, index_file: str = None):
         """
         Initialize TOS uploader.
         
@@ -34,16 +51,24 @@ class TOSUploader:
             credentials_file: Path to TOS credential file
             task_id: Task ID for registering files after upload (deprecated, kept for backward compatibility)
             organization_code: Organization code for post-upload registration
+            index_file: Path of the persistent upload index, defaults to DEFAULT_UPLOAD_INDEX_FILE
         """
         self.sandbox_id = sandbox_id
         self.workspace_dir = Path(workspace_dir).resolve()
         self.credentials_file = credentials_file
         self.credentials = None
         self.storage_service = None
-        self.file_hashes = {}  # Cache file hashes to avoid duplicate uploads
+        # Upload index: absolute path -> {size, mtime_ns, inode, md5, key}, persisted across restarts
+        self.index_file = Path(index_file or DEFAULT_UPLOAD_INDEX_FILE)
+        self.file_index: Dict[str, Dict] = {}
+        self._index_dirty = False
+        self._index_saved_at = 0.0
+        # (path, mtime_ns, size) of the credential file last loaded, used to skip redundant reloads
+        self._credentials_signature: Optional[Tuple[str, int, int]] = None
         self.task_id = None  # task_id no longer used
         self.organization_code = organization_code
-        self.uploaded_files = []  # Track uploaded files for batch registration
+        self.uploaded_files = []  # Track uploaded files for batch registration, persisted with the upload index
+        self._register_lock = asyncio.Lock()
 
         # Get API base URL from environment
         self.api_base_url = os.getenv("DELIGHTFUL_API_SERVICE_BASE_URL")
@@ -75,9 +100,49 @@ class TOSUploader:
             logger.error("Unable to load TOS credentials")
             return False
 
+        self._load_index()
+
         # _load_credentials already initializes storage service
         return True
 
+    def _resolve_credentials_path(self) -> Optional[Path]:
+        """
+        Resolve the credential file to use
+
+        Returns:
+            Optional[Path]: Credential file path, None if no usable file exists
+        """
+        # Use provided credential file if present, otherwise the default one
+        if self.credentials_file and os.path.exists(self.credentials_file):
+            return Path(self.credentials_file)
+        default_file = Path(".credentials/upload_credentials.json")
+        if default_file.exists():
+            return default_file
+        return None
+
+    async def _ensure_credentials(self) -> bool:
+        """
+        Reload credentials only when the credential file changed or they are about to expire
+
+        Returns:
+            bool: Whether usable credentials are loaded
+        """
+        if self.credentials and self.storage_service and self._credentials_signature:
+            credentials_path = self._resolve_credentials_path()
+            if credentials_path and self._get_credentials_signature(credentials_path) == self._credentials_signature:
+                expire = self.credentials.expire or self.credentials.expires
+                if expire is None or time.time() < expire - CREDENTIALS_REFRESH_MARGIN:
+                    return True
+        return await self._load_credentials()
+
+    @staticmethod
+    def _get_credentials_signature(credentials_path: Path) -> Optional[Tuple[str, int, int]]:
+        try:
+            st = os.stat(credentials_path)
+        except OSError:
+            return None
+        return (str(credentials_path), st.st_mtime_ns, st.st_size)
+
     async def _load_credentials(self) -> bool:
         """
         Load TOS credentials
@@ -86,19 +151,12 @@ class TOSUploader:
             bool: Whether loading succeeded
         """
         try:
-            # Prefer default credential file
-            default_file = Path(".credentials/upload_credentials.json")
-
-            # Use provided credential file if present
-            if self.credentials_file and os.path.exists(self.credentials_file):
-                credentials_path = self.credentials_file
-                logger.info(f"Using specified credential file: {self.credentials_file}")
-            elif default_file.exists():
-                credentials_path = default_file
-                logger.info(f"Using default credential file: {default_file}")
-            else:
+            credentials_path = self._resolve_credentials_path()
+            if credentials_path is None:
                 logger.error("No usable TOS credential file found")
                 return False
+            logger.info(f"Using credential file: {credentials_path}")
+            signature = self._get_credentials_signature(credentials_path)
 
             # Read credential file
             with open(credentials_path, "r") as f:
@@ -135,6 +193,7 @@ class TOSUploader:
                 logger.error(f"Failed to reinitialize TOS upload service: {e}")
                 return False
 
+            self._credentials_signature = signature
             return True
 
         except Exception as e:
@@ -156,14 +215,78 @@ class TOSUploader:
         try:
             md5_hash = hashlib.md5()
             with open(file_path, "rb") as f:
-                # Read in chunks for large files
-                for chunk in iter(lambda: f.read(4096), b""):
+                # Read in large chunks for large files
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
                     md5_hash.update(chunk)
             return md5_hash.hexdigest()
         except Exception as e:
             logger.error(f"Failed to calculate file hash: {e}")
             return ""
 
+    def _load_index(self) -> None:
+        """Load the persistent upload index, starting empty if it is missing or unreadable"""
+        try:
+            if self.index_file.exists():
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.file_index = data.get("files", {}) if isinstance(data, dict) else {}
+                logger.info(f"Loaded upload index with {len(self.file_index)} entries: {self.index_file}")
+                # Files uploaded by a previous run that exited before registering them
+                pending = data.get("pending_registrations", []) if isinstance(data, dict) else []
+                self.uploaded_files = [
+                    item for item in pending
+                    if isinstance(item, dict) and item.get("file_key") and item.get("sandbox_id") == self.sandbox_id
+                ]
+                if self.uploaded_files:
+                    logger.info(f"Restored {len(self.uploaded_files)} files pending registration from the upload index")
+        except Exception as e:
+            logger.warning(f"Failed to load upload index, all files will be re-checked: {e}")
+            self.file_index = {}
+        self._index_dirty = False
+
+    def save_index(self, force: bool = False) -> None:
+        """
+        Persist the upload index if it changed
+
+        Args:
+            force: Write immediately instead of respecting INDEX_SAVE_INTERVAL
+        """
+        if not self._index_dirty:
+            return
+        if not force and time.time() - self._index_saved_at < INDEX_SAVE_INTERVAL:
+            return
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_file.with_name(self.index_file.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": 1, "files": self.file_index, "pending_registrations": self.uploaded_files},
+                    f, ensure_ascii=False
+                )
+            os.replace(tmp_path, self.index_file)
+            self._index_dirty = False
+            self._index_saved_at = time.time()
+        except Exception as e:
+            logger.warning(f"Failed to save upload index: {e}")
+
+    async def _get_content_hash(self, file_path: str, st: os.stat_result) -> str:
+        """
+        Get the MD5 of a file, reusing the indexed hash while size, mtime and inode are unchanged
+
+        Args:
+            file_path: Absolute file path
+            st: Current stat of the file
+
+        Returns:
+            str: File MD5 hash, empty string on failure
+        """
+        entry = self.file_index.get(file_path)
+        if (entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns
+                and entry.get("inode") == st.st_ino):
+            return entry.get("md5", "")
+        # Hash off the event loop so large files do not stall the watcher
+        return await asyncio.to_thread(self.get_file_hash, file_path)
+
     async def upload_file(self, file_path: str) -> bool:
         """
         Upload a file to TOS
@@ -174,9 +297,9 @@ class TOSUploader:
         Returns:
             bool: Whether upload succeeded
         """
-        # Reload credentials before each upload to ensure freshness
-        if not await self._load_credentials():
-            logger.error("Failed to reload TOS credentials before upload")
+        # Credentials are only re-read when the file changed or they are about to expire
+        if not await self._ensure_credentials():
+            logger.error("Failed to load TOS credentials before upload")
             return False
 
         if not self.storage_service or not self.credentials:
@@ -185,15 +308,17 @@ class TOSUploader:
 
         try:
             # Ensure file exists
-            file_path = str(file_path)
-            if not os.path.exists(file_path):
+            file_path = os.path.abspath(str(file_path))
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 logger.warning(f"File does not exist; cannot upload: {file_path}")
                 return False
 
-            # Calculate file hash
-            file_hash = self.get_file_hash(file_path)
+            # Calculate file hash (skipped for files unchanged since the last indexed upload)
+            file_hash = await self._get_content_hash(file_path, st)
             if not file_hash:
-                return False                
+                return False
             # Compute relative path
             try:
                 rel_path = os.path.relpath(file_path, str(self.workspace_dir))
@@ -206,8 +331,12 @@ class TOSUploader:
             # Directly combine base_dir and rel_path for key
             key = f"{base_dir}{rel_path}"
 
-            # Skip upload if file content unchanged
-            if key in self.file_hashes and self.file_hashes[key] == file_hash:
+            # Skip upload if the same content was already uploaded to the same key
+            entry = self.file_index.get(file_path)
+            if entry and entry.get("key") == key and entry.get("md5") == file_hash:
+                if entry.get("mtime_ns") != st.st_mtime_ns or entry.get("inode") != st.st_ino:
+                    # Touched or rewritten with identical content, refresh stat so it is not hashed again
+                    self._index_file(file_path, st, file_hash, key)
                 logger.info(f"File unchanged; skipping upload: {rel_path}")
                 return True
             self.storage_service.set_credentials(self.credentials)
@@ -218,8 +347,6 @@ class TOSUploader:
                 file=file_path,
                 key=key
             )            
-            # Cache file hash
-            self.file_hashes[key] = file_hash
 
             # Record uploaded file info for later registration
             if self.sandbox_id:
@@ -235,11 +362,13 @@ class TOSUploader:
                 else:
                     external_url = None
 
+                # A file uploaded again before registration only needs its latest entry
+                self.uploaded_files = [item for item in self.uploaded_files if item["file_key"] != key]
                 self.uploaded_files.append({
                     "file_key": key,
                     "file_extension": file_ext,
                     "filename": os.path.basename(file_path),
-                    "file_size": os.path.getsize(file_path),
+                    "file_size": st.st_size,
                     "external_url": external_url,
                     "sandbox_id": self.sandbox_id
                 })
@@ -247,16 +376,34 @@ class TOSUploader:
             else:
                 logger.warning("Sandbox ID not set; file uploaded but will not be registered")
 
+            # Record content hash and key in the upload index, saved together with the pending registration
+            # so a restart never skips a file that was uploaded but not registered
+            self._index_file(file_path, st, file_hash, key)
+
             logger.info(f"File uploaded: {rel_path}, key: {key}")
             return True
 
         except (InitException, UploadException) as e:
             logger.error(f"File upload failed: {e}")
+            # Credentials may have been revoked or rotated, re-read them on the next upload
+            self._credentials_signature = None
             return False
         except Exception as e:
             logger.error(f"Unexpected error during upload: {e}")
             return False
 
+    def _index_file(self, file_path: str, st: os.stat_result, file_hash: str, key: str) -> None:
+        """Record an uploaded file in the index and persist it periodically"""
+        self.file_index[file_path] = {
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "inode": st.st_ino,
+            "md5": file_hash,
+            "key": key,
+        }
+        self._index_dirty = True
+        self.save_index()
+
     async def register_uploaded_files(self) -> bool:
         """
         Register uploaded files with the API
@@ -268,17 +415,27 @@ class TOSUploader:
             logger.error("Sandbox ID not set; cannot register files")
             return False
 
+        # Only one registration request at a time; files uploaded meanwhile go into the next batch
+        async with self._register_lock:
+            return await self._register_batch()
+
+    async def _register_batch(self) -> bool:
+        """
+        Register the files uploaded so far in one request
+
+        Returns:
+            bool: Whether registration succeeded
+        """
         if not self.uploaded_files:
             logger.info("No files to register; skipping")
             return True
 
-        logger.info(f"Preparing to register files to API, count={len(self.uploaded_files)}, sandbox_id={self.sandbox_id}")
+        batch = list(self.uploaded_files)
+        logger.info(f"Preparing to register files to API, count={len(batch)}, sandbox_id={self.sandbox_id}")
 
         api_url_env = os.getenv("DELIGHTFUL_API_SERVICE_BASE_URL", "unset")
 
         try:
-            import aiohttp
-
             # Ensure API base URL exists
             if not self.api_base_url:
                 logger.error("DELIGHTFUL_API_SERVICE_BASE_URL is not set; cannot register files")
@@ -289,7 +446,7 @@ class TOSUploader:
 
             # Build request payload
             request_data = {
-                "attachments": self.uploaded_files,
+                "attachments": batch,
                 "sandbox_id": self.sandbox_id
             }
 
@@ -311,31 +468,36 @@ class TOSUploader:
             logger.info("====================================")
 
             # Send request
-            logger.info(f"Registering uploaded files with API, sandbox_id={self.sandbox_id}, count={len(self.uploaded_files)}")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(api_url, json=request_data, headers=headers) as response:
-                    response_text = await response.text()
-                    logger.info(f"Response status: {response.status}")
-                    logger.info(f"Response body: {response_text}")
-
-                    if response.status == 200:
-                        try:
-                            result = json.loads(response_text)
-                            if result.get("code") == 1000:
-                                logger.info(
-                                    f"File registration succeeded: total={result.get('data', {}).get('total', 0)}, "
-                                    f"success={result.get('data', {}).get('success', 0)}, "
-                                    f"skipped={result.get('data', {}).get('skipped', 0)}"
-                                )
-                                # Clear list after successful registration
-                                self.uploaded_files = []
-                                return True
-                            else:
-                                logger.error(f"File registration API returned error: {result.get('message')}")
-                        except json.JSONDecodeError:
-                            logger.error("Response is not valid JSON")
-                    else:
-                        logger.error(f"File registration request failed, status: {response.status}")
+            logger.info(f"Registering uploaded files with API, sandbox_id={self.sandbox_id}, count={len(batch)}")
+            session = get_http_session()
+            async with session.post(api_url, json=request_data, headers=headers) as response:
+                response_text = await response.text()
+                logger.info(f"Response status: {response.status}")
+                logger.info(f"Response body: {response_text}")
+
+                if response.status == 200:
+                    try:
+                        result = json.loads(response_text)
+                        if result.get("code") == 1000:
+                            logger.info(
+                                f"File registration succeeded: total={result.get('data', {}).get('total', 0)}, "
+                                f"success={result.get('data', {}).get('success', 0)}, "
+                                f"skipped={result.get('data', {}).get('skipped', 0)}"
+                            )
+                            # Remove registered entries, keeping files uploaded during the request
+                            registered = {id(item) for item in batch}
+                            self.uploaded_files = [
+                                item for item in self.uploaded_files if id(item) not in registered
+                            ]
+                            self._index_dirty = True
+                            self.save_index()
+                            return True
+                        else:
+                            logger.error(f"File registration API returned error: {result.get('message')}")
+                    except json.JSONDecodeError:
+                        logger.error("Response is not valid JSON")
+                else:
+                    logger.error(f"File registration request failed, status: {response.status}")
 
             return False
         except Exception as e:
@@ -349,10 +511,11 @@ class TOSUploader:
         Scan and upload existing files
         
         Args:
-            refresh: Whether to force refresh all files
+            refresh: Whether to force refresh all files (clears the upload index)
         """
         if refresh:
-            self.file_hashes.clear()
+            self.file_index.clear()
+            self._index_dirty = True
 
         logger.info(f"Scanning directory: {self.workspace_dir}")
 
@@ -362,6 +525,13 @@ class TOSUploader:
                 file_path = os.path.join(root, file)
                 await self.upload_file(file_path)
 
+        # Drop entries of files deleted while the uploader was not running
+        for indexed_path in list(self.file_index):
+            if not os.path.exists(indexed_path):
+                del self.file_index[indexed_path]
+                self._index_dirty = True
+        self.save_index(force=True)
+
         logger.info("Directory scan finished")
 
         # Register uploaded files when sandbox_id is set
@@ -428,6 +598,7 @@ class TOSUploader:
             # Stop observer
             observer.stop()
             observer.join()
+            self.save_index(force=True)
 
 
 class TOSFileEventHandler(FileSystemEventHandler):
@@ -442,57 +613,113 @@ class TOSFileEventHandler(FileSystemEventHandler):
         """
         super().__init__()
         self.uploader = uploader
-        self._tasks = set()
-        self._upload_queue = asyncio.Queue()
         self._main_loop = None
-        self._register_timer = None
-        self._last_upload_time = time.time()
+        # Path -> monotonic time after which it may be uploaded; repeated events push the deadline back
+        self._pending: Dict[str, float] = {}
+        self._pending_event: Optional[asyncio.Event] = None
+        # Ripe uploads ordered by file size so small files are not stuck behind large ones
+        self._upload_queue: Optional[asyncio.PriorityQueue] = None
+        self._queue_seq = 0
+        self._queued: set = set()
+        self._in_flight: set = set()
+        self._tasks = set()
 
     def set_loop(self, loop):
-        """Set main event loop"""
+        """Set main event loop and start the dispatcher, upload workers and registration flusher"""
         self._main_loop = loop
-        # Start consumer task
-        asyncio.run_coroutine_threadsafe(self._process_queue(), loop)
-        # Start periodic registration task if task_id is set
-        if self.uploader.task_id:
-            asyncio.run_coroutine_threadsafe(self._periodic_register(), loop)
-
-    async def _process_queue(self):
-        """Process upload queue tasks"""
+        asyncio.run_coroutine_threadsafe(self._start(), loop)
+
+    async def _start(self) -> None:
+        """Create loop-bound primitives and background tasks, runs on the main loop"""
+        self._pending_event = asyncio.Event()
+        self._upload_queue = asyncio.PriorityQueue()
+        self._spawn(self._dispatch_pending())
+        for _ in range(UPLOAD_CONCURRENCY):
+            self._spawn(self._upload_worker())
+        if self.uploader.sandbox_id:
+            self._spawn(self._flush_registrations())
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _mark_pending(self, file_path: str) -> None:
+        """Record an event on a path and restart its debounce timer, runs on the main loop"""
+        self._pending[file_path] = time.monotonic() + UPLOAD_DEBOUNCE_SECONDS
+        if self._pending_event:
+            self._pending_event.set()
+
+    async def _dispatch_pending(self) -> None:
+        """Move paths whose debounce window has passed into the upload queue"""
         while True:
-            file_path = await self._upload_queue.get()
             try:
-                # Delay briefly to allow file operations to finish
-                await asyncio.sleep(1)
-                # Credentials are reloaded during upload; no extra call needed
-                uploaded = await self.uploader.upload_file(file_path)
-                # Update last upload time
-                self._last_upload_time = time.time()
+                self._pending_event.clear()
+                if not self._pending:
+                    await self._pending_event.wait()
+                    continue
+
+                now = time.monotonic()
+                next_deadline = None
+                for file_path, deadline in list(self._pending.items()):
+                    if deadline > now:
+                        next_deadline = deadline if next_deadline is None else min(next_deadline, deadline)
+                        continue
+                    # Still uploading or already queued: keep it pending, it is re-checked once that finishes
+                    if file_path in self._in_flight or file_path in self._queued:
+                        continue
+                    del self._pending[file_path]
+                    self._enqueue(file_path)
+
+                timeout = max(0.0, next_deadline - now) if next_deadline else UPLOAD_DEBOUNCE_SECONDS
+                try:
+                    await asyncio.wait_for(self._pending_event.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to dispatch pending uploads: {e}")
+                await asyncio.sleep(UPLOAD_DEBOUNCE_SECONDS)
 
-                # If uploads succeeded, immediately attempt registration
-                if uploaded and self.uploader.uploaded_files and self.uploader.sandbox_id:
-                    logger.info(f"Upload succeeded; attempting immediate registration, uploaded count: {len(self.uploader.uploaded_files)}")
-                    asyncio.create_task(self.uploader.register_uploaded_files())
+    def _enqueue(self, file_path: str) -> None:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            # Deleted or moved away before the debounce window closed
+            return
+        self._queue_seq += 1
+        self._queued.add(file_path)
+        self._upload_queue.put_nowait((size, self._queue_seq, file_path))
 
+    async def _upload_worker(self) -> None:
+        """Upload queued files, smallest first"""
+        while True:
+            _, _, file_path = await self._upload_queue.get()
+            self._queued.discard(file_path)
+            self._in_flight.add(file_path)
+            try:
+                # Credentials are refreshed during upload when needed; no extra call needed
+                await self.uploader.upload_file(file_path)
             except Exception as e:
                 logger.error(f"Failed to process upload task: {e}")
             finally:
+                self._in_flight.discard(file_path)
                 self._upload_queue.task_done()
+                # Let the dispatcher pick up events that arrived during the upload
+                if file_path in self._pending:
+                    self._pending_event.set()
 
-    async def _periodic_register(self):
-        """Periodically register uploaded files"""
+    async def _flush_registrations(self) -> None:
+        """Register uploaded files in one request per flush window"""
         while True:
             try:
-                # Wait 30s before attempting registration
-                await asyncio.sleep(30)
-
-                # Register if files exist and no uploads in last 20s
-                current_time = time.time()
-                if (self.uploader.uploaded_files and 
-                    self.uploader.sandbox_id and
-                    current_time - self._last_upload_time > 20):
-                    logger.info("No uploads in last 30s; registering uploaded files")
+                await asyncio.sleep(REGISTER_FLUSH_INTERVAL)
+                if self.uploader.uploaded_files:
+                    logger.info(f"Registering uploaded files, count: {len(self.uploader.uploaded_files)}")
                     await self.uploader.register_uploaded_files()
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Periodic registration task failed: {e}")
                 # Continue loop despite errors
@@ -561,11 +788,8 @@ class TOSFileEventHandler(FileSystemEventHandler):
             logger.error("Main event loop not set; cannot schedule upload task")
             return
 
-        # Push task to queue in a thread-safe way
-        asyncio.run_coroutine_threadsafe(
-            self._upload_queue.put(file_path), 
-            self._main_loop
-        )
+        # Watchdog calls us from its own thread; hand the path over to the main loop
+        self._main_loop.call_soon_threadsafe(self._mark_pending, file_path)
 
 
 async def _run_tos_uploader_watch(sandbox_id: str = "default", 
@@ -610,15 +834,18 @@ async def _run_tos_uploader_watch(sandbox_id: str = "default",
         organization_code
     )
 
-    await tos_uploader.watch_command(
-        sandbox_id, 
-        workspace_dir, 
-        once, 
-        refresh,
-        credentials_file,
-        task_id,
-        organization_code
-    )
+    try:
+        await tos_uploader.watch_command(
+            sandbox_id, 
+            workspace_dir, 
+            once, 
+            refresh,
+            credentials_file,
+            task_id,
+            organization_code
+        )
+    finally:
+        await close_http_session()
 
 def start_tos_uploader_watcher(sandbox_id: str = "default", 
                  workspace_dir: str = ".workspace", 
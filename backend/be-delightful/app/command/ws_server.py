@@ -14,13 +14,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from uvicorn.config import Config
 
+from agentlang.config.config import config
 from agentlang.logger import get_logger
 from agentlang.utils.process_manager import ProcessManager
 from app.api.middleware import RequestLoggingMiddleware
 from app.api.routes import api_router
 from app.api.routes.websocket import router as websocket_router
+from app.paths import PathManager
 from app.service.agent_dispatcher import AgentDispatcher
 from app.service.idle_monitor_service import IdleMonitorService
+from app.service.workspace_index_service import WorkspaceIndexService
+from app.utils.http_client import close_http_session
 
 # Get logger
 logger = get_logger(__name__)
@@ -138,6 +142,9 @@ def start_ws_server():
 
         IdleMonitorService.get_instance().start()
 
+        if config.get("workspace_index.enabled", True):
+            WorkspaceIndexService.get_instance().start(PathManager.get_workspace_dir())
+
         # Use code similar to original main() function, but only start WebSocket service
         # Create and configure WebSocket socket
         ws_port = 8002
@@ -194,9 +201,15 @@ def start_ws_server():
             # Cancel service task
             ws_task.cancel()
 
+            # Deliver messages still buffered for the subscription endpoint
+            if dispatcher.http_stream:
+                await dispatcher.http_stream.close()
+
             await process_manager.stop_all()
 
             IdleMonitorService.get_instance().stop()
+            WorkspaceIndexService.get_instance().stop()
+            await close_http_session()
 
             try:
                 # Wait for task completion
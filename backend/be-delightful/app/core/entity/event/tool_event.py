@@ -0,0 +1,17 @@
+"""
+Tool event related data class definitions
+
+Used to define event data structures emitted while a tool is running
+"""
+from agentlang.context.tool_context import ToolContext
+from agentlang.event.common import BaseEventData
+
+
+class ToolProgressEventData(BaseEventData):
+    """Tool progress event data class"""
+
+    tool_context: ToolContext  # Tool context
+    tool_name: str  # Tool name
+    command: str  # Command or target being executed
+    stream: str  # Output stream, stdout or stderr
+    output: str  # Output produced since the previous progress event
@@ -12,6 +12,7 @@ from agentlang.event.data import (
     BeforeInitEventData,
     BeforeLlmRequestEventData,
     BeforeToolCallEventData,
+    LlmStreamDeltaEventData,
 )
 from agentlang.event.event import Event, EventType
 from agentlang.logger import get_logger
@@ -23,12 +24,15 @@ from app.core.entity.event.event import (
     BeforeSafetyCheckEventData,
 )
 from app.core.entity.event.event_context import EventContext
+from app.core.entity.event.tool_event import ToolProgressEventData
 from app.core.entity.message.server_message import (
+    DisplayType,
     MessageType,
     ServerMessage,
     ServerMessagePayload,
     TaskStatus,
     Tool,
+    ToolDetail,
     ToolStatus,
 )
 
@@ -262,6 +266,31 @@ class TaskMessageFactory:
             )
         )
 
+    @classmethod
+    def create_llm_stream_delta_message(cls, event: Event[LlmStreamDeltaEventData]) -> ServerMessage:
+        """
+        Create task message with partial LLM response content in stream mode
+
+        Args:
+            event: LLM stream delta event
+
+        Returns:
+            ServerMessage: Task message carrying the new content, to be appended to the previous deltas
+        """
+        agent_context = event.data.tool_context.get_extension_typed("agent_context", AgentContext)
+
+        return ServerMessage.create(
+            metadata=agent_context.get_init_client_message_metadata(),
+            payload=ServerMessagePayload.create(
+                task_id=agent_context.get_task_id() or "",
+                sandbox_id=agent_context.get_sandbox_id(),
+                message_type=MessageType.THINKING,
+                status=TaskStatus.RUNNING,
+                content=event.data.delta,
+                event=event.event_type
+            )
+        )
+
     @classmethod
     async def create_before_tool_call_message(cls, event: Event[BeforeToolCallEventData]) -> ServerMessage:
         """
@@ -375,6 +404,47 @@ class TaskMessageFactory:
             )
         )
 
+    @classmethod
+    def create_tool_progress_message(cls, event: Event[ToolProgressEventData]) -> ServerMessage:
+        """
+        Create task message with partial output of a running tool
+
+        Args:
+            event: Tool progress event
+
+        Returns:
+            ServerMessage: Task message carrying the new output chunk
+        """
+        tool_context = event.data.tool_context
+        agent_context = tool_context.get_extension_typed("agent_context", AgentContext)
+
+        tool = Tool(
+            id=tool_context.tool_call_id,
+            name=event.data.tool_name,
+            status=ToolStatus.RUNNING,
+            detail=ToolDetail(
+                type=DisplayType.TERMINAL,
+                data={
+                    "command": event.data.command,
+                    "stream": event.data.stream,
+                    "output": event.data.output,
+                },
+            ),
+        )
+
+        return ServerMessage.create(
+            metadata=agent_context.get_init_client_message_metadata(),
+            payload=ServerMessagePayload.create(
+                task_id=agent_context.get_task_id() or "",
+                sandbox_id=agent_context.get_sandbox_id(),
+                message_type=MessageType.TOOL_CALL,
+                status=TaskStatus.RUNNING,
+                content="",
+                tool=tool,
+                event=event.event_type
+            )
+        )
+
     @classmethod
     def create_before_safety_check_message(cls, event: Event[BeforeSafetyCheckEventData]) -> ServerMessage:
         """
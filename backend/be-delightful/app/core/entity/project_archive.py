@@ -1,12 +1,23 @@
 import time
+from typing import List
 
 from pydantic import BaseModel, Field
 
 
+class ProjectArchiveDelta(BaseModel):
+    """Incremental project archive, applied on top of the full archive in version order"""
+    file_key: str  # File storage key
+    file_size: int  # File size (bytes)
+    file_md5: str  # File MD5 hash
+    version: int  # Project archive version produced by this delta
+    deleted_paths: List[str] = Field(default_factory=list)  # Paths relative to project root removed since previous version
+
+
 class ProjectArchiveInfo(BaseModel):
     """Project archive information model"""
-    file_key: str  # File storage key
+    file_key: str  # File storage key of the full archive
     file_size: int  # File size (bytes)
     file_md5: str  # File MD5 hash
     upload_timestamp: int = Field(default_factory=lambda: int(time.time()))  # Upload timestamp 
     version: int = 0
+    deltas: List[ProjectArchiveDelta] = Field(default_factory=list)  # Deltas since the full archive, in version order
@@ -6,10 +6,13 @@ Provides HTTP-based stream implementation for sending messages to subscribed HTT
 
 import asyncio
 import json
-from typing import Dict, Optional, Tuple
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import aiohttp
 
+from agentlang.config.config import config as global_config
 from agentlang.event.event import EventType
 from agentlang.logger import get_logger
 from app.core.entity.message.client_message import MessageSubscriptionConfig
@@ -21,7 +24,12 @@ class HTTPSubscriptionStream(Stream):
     """A Stream implementation for sending data to HTTP subscription endpoints.
     
     This class provides a way to send messages to an HTTP endpoint specified in the
-    message_subscription_config.
+    message_subscription_config. Writes are buffered and delivered in order by a background
+    writer task, so the agent loop does not wait on the subscription endpoint.
+
+    With `subscription_stream.max_batch_size` > 1, up to that many messages queued within
+    `subscription_stream.max_batch_latency` seconds are sent together as one JSON array;
+    the default of 1 keeps one message per request.
     """
 
     def __init__(self, config: MessageSubscriptionConfig):
@@ -37,8 +45,42 @@ class HTTPSubscriptionStream(Stream):
         self._base_retry_delay = 1.0  # Base delay (seconds)
         self._max_retry_delay = 10.0  # Max delay (seconds)
 
-        self.ignore_events([EventType.AFTER_CLIENT_CHAT])
-        logger.info("Configured HTTPSubscriptionStream to ignore AFTER_CLIENT_CHAT events")
+        # Outbound buffer settings
+        self._max_batch_size = max(1, int(global_config.get("subscription_stream.max_batch_size", 1)))
+        self._max_batch_latency = float(global_config.get("subscription_stream.max_batch_latency", 0.05))
+        self._high_water_mark = max(1, int(global_config.get("subscription_stream.high_water_mark", 200)))
+        self._max_pending = max(self._high_water_mark, int(global_config.get("subscription_stream.max_pending", 5000)))
+
+        # Outbound buffer of (data, data_type, queued_at), drained by the writer task
+        self._buffer: Deque[Tuple[str, str, float]] = deque()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._data_event = asyncio.Event()
+        self._space_event = asyncio.Event()
+        self._drained_event = asyncio.Event()
+        self._drained_event.set()
+        self._sending = 0
+        self._closed = False
+        self._above_high_water = False
+
+        # Metrics
+        self._stats: Dict[str, Any] = {
+            "queued": 0,
+            "delivered": 0,
+            "batches": 0,
+            "retries": 0,
+            "failed_batches": 0,
+            "dropped": 0,
+            "max_pending": 0,
+            "high_water_events": 0,
+            "backpressure_waits": 0,
+            "max_delivery_latency_ms": 0.0,
+        }
+        self._latency_total_ms = 0.0
+
+        # Partial tool output and LLM deltas are only for live display, the final results arrive with
+        # AFTER_TOOL_CALL and AFTER_LLM_REQUEST
+        self.ignore_events([EventType.AFTER_CLIENT_CHAT, EventType.TOOL_PROGRESS, EventType.LLM_STREAM_DELTA])
+        logger.info("Configured HTTPSubscriptionStream to ignore AFTER_CLIENT_CHAT, TOOL_PROGRESS and LLM_STREAM_DELTA events")
 
     async def _ensure_session(self):
         """Ensure an HTTP session exists."""
@@ -115,106 +157,195 @@ class HTTPSubscriptionStream(Stream):
         logger.debug(f"should_retry final return: {retry_decision}")
         return retry_decision
 
-    async def _send_request_with_retry(self, method: str, url: str, headers: Dict, data: str) -> Tuple[bool, Optional[aiohttp.ClientResponse]]:
-        """
-        Send HTTP request with custom retry logic
-        
-        Returns:
-            Tuple (success, response)
-        """
-        retry_count = 0
-        last_exception = None
-        last_response = None
-
-        while retry_count <= self._max_retries:
-            current_attempt = retry_count + 1
-            try:
-                # Send the request
-                logger.debug(f"Attempt {current_attempt} in progress...")
-                async with self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    data=data
-                ) as response:
-                    # Keep a copy of the response to evaluate retry
-                    response_copy = response
-
-                    # Decide whether to retry
-                    if await self._should_retry(response):
-                        if retry_count < self._max_retries:
-                            retry_count += 1
-                            delay = min(self._base_retry_delay * (2 ** (retry_count - 1)), self._max_retry_delay)
-                            logger.info(f"Attempt {current_attempt} failed; retrying in {delay:.2f} seconds...")
-                            await asyncio.sleep(delay)
-                            continue
-                        else:
-                            # Max retries reached
-                            logger.warning(f"Max retries reached ({self._max_retries}); will not retry")
-                            return True, response
-                    else:
-                        # No retry needed, return success
-                        return True, response
-            except Exception as e:
-                last_exception = e
-                logger.error(f"Request raised an exception (attempt {current_attempt}/{self._max_retries + 1}): {e!s}")
-
-                if retry_count < self._max_retries:
-                    retry_count += 1
-                    delay = min(self._base_retry_delay * (2 ** (retry_count - 1)), self._max_retry_delay)
-                    logger.info(f"Retrying in {delay:.2f} seconds...")
-                    await asyncio.sleep(delay)
-                else:
-                    # Max retries reached
-                    logger.warning(f"Max retries reached ({self._max_retries}); will not retry")
-                    return False, None
+    async def write(self, data: str, data_type: str = "json") -> int:
+        """Queue string data for delivery to the HTTP subscription endpoint.
 
-        # If we reach here, all retries failed
-        return False, last_response
+        Delivery happens in a background writer task in write order, so the caller
+        never waits for the endpoint unless the buffer is completely full.
 
-    async def write(self, data: str, data_type: str = "json") -> int:
-        """Write string data to the HTTP subscription endpoint.
-        
         Args:
             data: The string data to be sent.
             data_type: The type of data being sent, defaults to "json".
-            
+
         Returns:
-            The number of bytes written.
-            
+            The number of bytes queued.
+
         Raises:
-            IOError: When there's an error writing to the HTTP endpoint.
+            IOError: When the stream has been closed.
+        """
+        if self._closed:
+            raise IOError("Failed to write to HTTP endpoint: stream is closed")
+
+        if len(self._buffer) >= self._max_pending:
+            # Hard limit reached: this is the only case where the caller waits
+            self._stats["backpressure_waits"] += 1
+            logger.warning(f"HTTP subscription buffer full ({len(self._buffer)} messages), waiting for delivery")
+            while len(self._buffer) >= self._max_pending and not self._closed:
+                self._space_event.clear()
+                await self._space_event.wait()
+
+        self._buffer.append((data, data_type, time.monotonic()))
+        self._drained_event.clear()
+        self._stats["queued"] += 1
+        pending = len(self._buffer)
+        self._stats["max_pending"] = max(self._stats["max_pending"], pending)
+        if pending >= self._high_water_mark and not self._above_high_water:
+            self._above_high_water = True
+            self._stats["high_water_events"] += 1
+            logger.warning(f"HTTP subscription buffer above high-water mark: {pending} messages pending")
+
+        self._ensure_writer()
+        self._data_event.set()
+        return len(data)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued messages have been delivered or given up.
+
+        Args:
+            timeout: Maximum time to wait in seconds, None waits indefinitely.
+
+        Returns:
+            bool: True if the buffer was drained within the timeout.
         """
+        if not self._buffer and not self._sending:
+            return True
+        self._ensure_writer()
         try:
-            await self._ensure_session()
+            await asyncio.wait_for(self._drained_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out flushing HTTP subscription stream, {len(self._buffer)} messages pending")
+            return False
 
-            # Prepare headers and payload
-            headers = dict(self._config.headers)
+    async def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Flush pending messages, stop the writer and close the HTTP session.
 
-            if data_type == "json":
-                # Ensure Content-Type is application/json
-                if "Content-Type" not in headers:
-                    headers["Content-Type"] = "application/json"
+        Args:
+            timeout: Maximum time to wait for pending messages in seconds.
+        """
+        await self.flush(timeout)
+        self._closed = True
+        self._space_event.set()
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        if self._session:
+            await self._session.close()
+            self._session = None
 
-            # Send request with custom retry logic
-            success, response = await self._send_request_with_retry(
-                method=self._config.method,
-                url=self._config.url,
-                headers=headers,
-                data=data
-            )
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivery and backpressure metrics.
 
-            if not success:
-                raise IOError("Failed to write to HTTP endpoint after retries")
+        Returns:
+            Dict: Queue depth, delivery counters and delivery latency.
+        """
+        delivered = self._stats["delivered"]
+        return {
+            **self._stats,
+            "pending": len(self._buffer),
+            "in_flight": self._sending,
+            "avg_delivery_latency_ms": round(self._latency_total_ms / delivered, 2) if delivered else 0.0,
+        }
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer task if it is not running."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self) -> None:
+        """Deliver queued messages in order, one batch at a time."""
+        while True:
+            try:
+                if not self._buffer:
+                    self._drained_event.set()
+                    self._data_event.clear()
+                    await self._data_event.wait()
+                    continue
+                self._drained_event.clear()
+
+                # Give later messages up to max_batch_latency to join a partial batch
+                if self._max_batch_size > 1 and len(self._buffer) < self._max_batch_size:
+                    self._data_event.clear()
+                    try:
+                        await asyncio.wait_for(self._wait_for_batch(), timeout=self._max_batch_latency)
+                    except asyncio.TimeoutError:
+                        pass
+
+                batch = []
+                while self._buffer and len(batch) < self._max_batch_size:
+                    batch.append(self._buffer.popleft())
+                self._space_event.set()
+                if len(self._buffer) < self._high_water_mark // 2:
+                    self._above_high_water = False
+
+                self._sending = len(batch)
+                try:
+                    await self._deliver(batch)
+                finally:
+                    self._sending = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"HTTP subscription writer error: {e!s}")
 
-            # Check final response status
-            if response.status >= 400:
-                error_text = await response.text()
-                logger.error(f"HTTP subscription failed with status {response.status}: {error_text}")
-                raise IOError(f"Failed to write to HTTP endpoint: Status {response.status}")
+    async def _wait_for_batch(self) -> None:
+        """Wait until the buffer holds a full batch."""
+        while len(self._buffer) < self._max_batch_size:
+            self._data_event.clear()
+            await self._data_event.wait()
 
-            return len(data)
+    async def _deliver(self, batch: List[Tuple[str, str, float]]) -> None:
+        """Send one batch with retries; the batch is dropped after the last failed attempt.
 
-        except Exception as e:
-            logger.error(f"Failed to write to HTTP endpoint: {e!s}")
-            raise IOError(f"Failed to write to HTTP endpoint: {e!s}")
+        Args:
+            batch: Queued (data, data_type, queued_at) entries, in write order.
+        """
+        await self._ensure_session()
+
+        headers = dict(self._config.headers)
+        if "Content-Type" not in headers and any(data_type == "json" for _, data_type, _ in batch):
+            # Ensure Content-Type is application/json
+            headers["Content-Type"] = "application/json"
+
+        if len(batch) == 1:
+            payload = batch[0][0]
+        else:
+            # Messages are already serialized JSON, join them into an array without re-encoding
+            payload = "[" + ",".join(data for data, _, _ in batch) + "]"
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._session.request(
+                    method=self._config.method,
+                    url=self._config.url,
+                    headers=headers,
+                    data=payload
+                ) as response:
+                    if not await self._should_retry(response):
+                        self._record_delivery(batch)
+                        return
+            except Exception as e:
+                logger.error(f"Request raised an exception (attempt {attempt + 1}/{self._max_retries + 1}): {e!s}")
+
+            if attempt < self._max_retries:
+                self._stats["retries"] += 1
+                delay = min(self._base_retry_delay * (2 ** attempt), self._max_retry_delay)
+                logger.info(f"Attempt {attempt + 1} failed; retrying in {delay:.2f} seconds...")
+                await asyncio.sleep(delay)
+
+        logger.error(f"Failed to write to HTTP endpoint after {self._max_retries} retries, dropping {len(batch)} messages")
+        self._stats["failed_batches"] += 1
+        self._stats["dropped"] += len(batch)
+
+    def _record_delivery(self, batch: List[Tuple[str, str, float]]) -> None:
+        now = time.monotonic()
+        self._stats["delivered"] += len(batch)
+        self._stats["batches"] += 1
+        for _, _, queued_at in batch:
+            latency_ms = (now - queued_at) * 1000
+            self._latency_total_ms += latency_ms
+            self._stats["max_delivery_latency_ms"] = max(self._stats["max_delivery_latency_ms"], round(latency_ms, 2))
@@ -0,0 +1,173 @@
+"""
+Queued stream writer
+
+Gives each stream its own bounded send queue and writer task, so a slow client only delays itself
+instead of every stream the message is fanned out to
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from agentlang.logger import get_logger
+from app.core.stream.base import Stream
+
+logger = get_logger(__name__)
+
+
+class StreamOverflowPolicy(str, Enum):
+    """What to do when a stream's send queue is full"""
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued message to make room
+    DROP_NEWEST = "drop_newest"  # Discard the message being submitted
+    DISCONNECT = "disconnect"  # Give up on the stream
+
+
+class QueuedStreamWriter:
+    """Bounded send queue plus writer task for a single stream"""
+
+    def __init__(
+        self,
+        stream: Stream,
+        max_queue_size: int,
+        overflow_policy: StreamOverflowPolicy,
+        on_failure: Callable[["QueuedStreamWriter", Exception], None],
+    ):
+        """
+        Initialize the writer
+
+        Args:
+            stream: Stream to write to
+            max_queue_size: Maximum number of queued messages
+            overflow_policy: Policy applied when the queue is full
+            on_failure: Called when a write fails or the queue overflows with the DISCONNECT policy
+        """
+        self.stream = stream
+        self.max_queue_size = max(1, max_queue_size)
+        self.overflow_policy = overflow_policy
+        self._on_failure = on_failure
+
+        # Pending (data, enqueued_at) entries in submit order
+        self._queue: Deque[Tuple[str, float]] = deque()
+        self._data_event = asyncio.Event()
+        self._drained_event = asyncio.Event()
+        self._drained_event.set()
+        self._task: Optional[asyncio.Task] = None
+        self._writing = False
+        self.closed = False
+
+        # Metrics
+        self.sent = 0
+        self.dropped = 0
+        self.failures = 0
+        self.max_depth = 0
+        self._last_write_ms = 0.0
+        self._last_lag_ms = 0.0
+
+    def submit(self, data: str) -> bool:
+        """
+        Queue a serialized message without waiting for the stream
+
+        Args:
+            data: Serialized message
+
+        Returns:
+            bool: Whether the message was queued
+        """
+        if self.closed:
+            return False
+
+        if len(self._queue) >= self.max_queue_size:
+            if self.overflow_policy == StreamOverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                logger.warning(f"Stream queue full, dropping new message, stream type: {type(self.stream)}")
+                return False
+            if self.overflow_policy == StreamOverflowPolicy.DISCONNECT:
+                logger.warning(f"Stream queue full ({len(self._queue)} messages), disconnecting stream, stream type: {type(self.stream)}")
+                self._on_failure(self, OverflowError(f"Send queue exceeded {self.max_queue_size} messages"))
+                return False
+            self._queue.popleft()
+            self.dropped += 1
+            logger.warning(f"Stream queue full, dropping oldest message, stream type: {type(self.stream)}")
+
+        self._queue.append((data, time.monotonic()))
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._drained_event.clear()
+        self._data_event.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return True
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued messages have been written
+
+        Args:
+            timeout: Maximum time to wait in seconds, None waits indefinitely
+
+        Returns:
+            bool: True if the queue was drained within the timeout
+        """
+        if self.closed:
+            return True
+        try:
+            await asyncio.wait_for(self._drained_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self) -> None:
+        """Stop the writer task and discard queued messages"""
+        self.closed = True
+        self.dropped += len(self._queue)
+        self._queue.clear()
+        self._drained_event.set()
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue metrics
+
+        Returns:
+            Dict: Queue depth, lag of the oldest queued message and write counters
+        """
+        lag_ms = (time.monotonic() - self._queue[0][1]) * 1000 if self._queue else 0.0
+        return {
+            "stream_type": type(self.stream).__name__,
+            "overflow_policy": self.overflow_policy.value,
+            "depth": len(self._queue),
+            "max_depth": self.max_depth,
+            "lag_ms": round(lag_ms, 2),
+            "last_lag_ms": round(self._last_lag_ms, 2),
+            "last_write_ms": round(self._last_write_ms, 2),
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "failures": self.failures,
+            "closed": self.closed,
+        }
+
+    async def _run(self) -> None:
+        """Write queued messages to the stream in order"""
+        while not self.closed:
+            if not self._queue:
+                self._drained_event.set()
+                self._data_event.clear()
+                await self._data_event.wait()
+                continue
+
+            data, enqueued_at = self._queue.popleft()
+            started_at = time.monotonic()
+            self._last_lag_ms = (started_at - enqueued_at) * 1000
+            try:
+                await self.stream.write(data)
+                self.sent += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failures += 1
+                self._on_failure(self, e)
+            finally:
+                self._last_write_ms = (time.monotonic() - started_at) * 1000
+        self._drained_event.set()
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import os
 import random
@@ -27,6 +28,7 @@ from agentlang.event.data import (
     BeforeMainAgentRunEventData,
     BeforeToolCallEventData,
     ErrorEventData,
+    LlmStreamDeltaEventData,
 )
 from agentlang.event.event import EventType
 from agentlang.exceptions import UserFriendlyException
@@ -34,12 +36,12 @@ from agentlang.llms.factory import LLMFactory
 from agentlang.llms.token_usage.models import TokenUsage
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
-from agentlang.utils.parallel import Parallel
 from app.core.context.agent_context import AgentContext
 from app.paths import PathManager
 from app.tools.core.base_tool import BaseTool
 from app.tools.core.tool_executor import tool_executor
 from app.tools.core.tool_factory import tool_factory
+from app.tools.core.tool_scheduler import ToolScheduler
 from app.tools.list_dir import ListDir
 
 logger = get_logger(__name__)
@@ -87,10 +89,18 @@ class Agent(BaseAgent):
 
         # Whether to enable multi-tool calls, disabled by default
         self.enable_multi_tool_calls = config.get("agent.enable_multi_tool_calls", False)
-        # Whether to enable parallel tool calls, disabled by default
-        self.enable_parallel_tool_calls = config.get("agent.enable_parallel_tool_calls", False)
-        # Parallel tool call timeout (seconds), default is no timeout
+        # Whether to run non-conflicting tool calls in parallel, enabled by default (see ToolScheduler)
+        self.enable_parallel_tool_calls = config.get("agent.enable_parallel_tool_calls", True)
+        # Timeout of each tool call in parallel mode (seconds) unless the tool sets its own, default is no timeout
         self.parallel_tool_calls_timeout = config.get("agent.parallel_tool_calls_timeout", None)
+        # Whether to start side-effect free tool calls (eager_safe) in stream mode as soon as their arguments are complete, enabled by default
+        self.eager_tool_dispatch = config.get("agent.eager_tool_dispatch", True)
+        # Scheduler holding the tool calls started while the LLM is still streaming
+        self._tool_scheduler: Optional[ToolScheduler] = None
+        # (tool names, tool schemas, schema hash), compiled on the first LLM call of a tool set
+        self._tools_list_cache: Optional[tuple[tuple[str, ...], List[Dict[str, Any]], str]] = None
+        # Hash of the system prompt and tools sent with the previous LLM call
+        self._prompt_prefix_hash: Optional[str] = None
 
         logger.info(f"Initialize agent: {self.agent_name}")
         self._initialize_agent()
@@ -317,6 +327,8 @@ class Agent(BaseAgent):
             else:
                 # Theoretically should not happen, but log just in case
                 logger.warning(f"Attempted to remove Agent (name='{self.agent_name}', id='{self.id}') but not found in active registry.")
+            # Tool calls started during streaming must not outlive the agent
+            await self._cancel_scheduled_tool_calls()
             # When task is terminated by user, agent coroutine is forcibly cancelled, need to close all resources here
             await self.agent_context.close_all_resources()
 
@@ -1043,35 +1055,71 @@ class Agent(BaseAgent):
         if self.is_agent_running():
             self.set_agent_state(AgentState.FINISHED)
 
-        # Log token usage - only print in non-streaming mode
-        if not self.stream_mode:
-            self.print_token_usage()
+        # Log token usage, streamed responses record usage from their final chunk as well
+        self.print_token_usage()
 
         return final_response
 
-    async def _handle_agent_loop_stream(self) -> None:
-        """Handle agent loop streaming"""
-        # Currently streaming is not implemented, return None
-        return None
+    async def _handle_agent_loop_stream(self) -> Optional[str]:
+        """
+        Handle agent loop in stream mode
 
-    async def _call_llm(self, messages: List[Dict[str, Any]]) -> ChatCompletion:
-        """Call LLM"""
+        Runs the same loop as _handle_agent_loop; _call_llm streams each LLM response, forwarding
+        content deltas as LLM_STREAM_DELTA events while tool calls are assembled from their fragments.
+
+        Returns:
+            Optional[str]: Final response
+        """
+        return await self._handle_agent_loop()
+
+    def _get_tools_list(self) -> tuple[List[Dict[str, Any]], str]:
+        """
+        Get the tool schemas sent to the LLM, compiled once for the current tool set
 
-        # Convert tool instances to format needed by LLM
-        tools_list = []
-        if self.tools:
-            for tool_name in self.tools.keys():
+        Returns:
+            tuple[List[Dict[str, Any]], str]: Tool schemas and their hash
+        """
+        tool_names = tuple(self.tools.keys()) if self.tools else ()
+        if self._tools_list_cache is None or self._tools_list_cache[0] != tool_names:
+            # Convert tool instances to format needed by LLM
+            tools_list = []
+            for tool_name in tool_names:
                 tool_instance: BaseTool = tool_factory.get_tool_instance(tool_name)
                 # Ensure tool instance is valid
                 if tool_instance:
-                    tool_param = tool_instance.to_param()
-                    tools_list.append(tool_param)
+                    tools_list.append(tool_instance.to_param())
                 else:
                     logger.warning(f"Unable to get tool instance: {tool_name}")
+            tools_hash = hashlib.sha256(json.dumps(tools_list, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+            self._tools_list_cache = (tool_names, tools_list, tools_hash)
+            logger.info(f"Compiled {len(tools_list)} tool schemas for agent {self.agent_name}, hash: {tools_hash[:12]}")
+        return self._tools_list_cache[1], self._tools_list_cache[2]
+
+    def _check_prompt_prefix(self, messages: List[Dict[str, Any]], tools_hash: str) -> None:
+        """
+        Warn when the system prompt or tools changed since the previous LLM call, as the provider-side prompt
+        cache only hits on a byte-identical prefix
+
+        Args:
+            messages: Messages sent to the LLM
+            tools_hash: Hash of the tool schemas sent with them
+        """
+        system_prompt = (messages[0].get("content") or "") if messages and messages[0].get("role") == "system" else ""
+        prefix_hash = hashlib.sha256(f"{tools_hash}\n{system_prompt}".encode("utf-8")).hexdigest()
+        if self._prompt_prefix_hash is not None and prefix_hash != self._prompt_prefix_hash:
+            logger.warning("Prompt prefix (system prompt and tools) changed since the previous LLM call, provider prompt cache will miss")
+        self._prompt_prefix_hash = prefix_hash
+
+    async def _call_llm(self, messages: List[Dict[str, Any]]) -> ChatCompletion:
+        """Call LLM"""
 
-        # Save tools list to .tools.json file with same name as chat history
+        # Tool schemas are compiled once per tool set and reused, keeping the request prefix byte-stable
+        tools_list, tools_hash = self._get_tools_list()
+        self._check_prompt_prefix(messages, tools_hash)
+
+        # Save tools list to .tools.json file with same name as chat history (only written when it changed)
         if self.chat_history and tools_list:
-            self.chat_history.save_tools_list(tools_list)
+            self.chat_history.save_tools_list(tools_list, tools_hash)
 
         # Create ToolContext instance
         tool_context = ToolContext(metadata=self.agent_context.get_metadata())
@@ -1092,14 +1140,18 @@ class Agent(BaseAgent):
         start_time = time.time()
         # logger.debug(f"Messages sent to LLM: {messages}")
 
-        # Use LLMFactory.call_with_tool_support method to handle tool calls uniformly
-        llm_response: ChatCompletion = await LLMFactory.call_with_tool_support(
-            self.llm_id,
-            messages, # Pass dict list
-            tools=tools_list if tools_list else None,
-            stop=self.agent_context.stop_sequences if hasattr(self.agent_context, 'stop_sequences') else None,
-            agent_context=self.agent_context
-        )
+        first_token_time = None
+        if self.stream_mode:
+            llm_response, first_token_time = await self._call_llm_stream(messages, tools_list, tool_context)
+        else:
+            # Use LLMFactory.call_with_tool_support method to handle tool calls uniformly
+            llm_response: ChatCompletion = await LLMFactory.call_with_tool_support(
+                self.llm_id,
+                messages, # Pass dict list
+                tools=tools_list if tools_list else None,
+                stop=self.agent_context.stop_sequences if hasattr(self.agent_context, 'stop_sequences') else None,
+                agent_context=self.agent_context
+            )
 
         llm_response_message = llm_response.choices[0].message
         request_time = time.time() - start_time
@@ -1154,22 +1206,146 @@ class Agent(BaseAgent):
                 request_time=request_time,
                 success=True,
                 tool_context=tool_context,
-                llm_response_message=llm_response_message # Pass original response message
+                llm_response_message=llm_response_message, # Pass original response message
+                first_token_time=first_token_time
             )
         )
 
         return llm_response
 
+    async def _call_llm_stream(self, messages: List[Dict[str, Any]], tools_list: List[Dict[str, Any]], tool_context: ToolContext) -> tuple[ChatCompletion, Optional[float]]:
+        """
+        Call LLM in streaming mode, forwarding content deltas as LLM_STREAM_DELTA events
+
+        Deltas are batched so clients receive at most one event per llm.stream_delta_interval seconds
+        instead of one per token.
+
+        Args:
+            messages: Messages sent to the LLM
+            tools_list: Tool definitions
+            tool_context: Tool context of this LLM request
+
+        Returns:
+            tuple[ChatCompletion, Optional[float]]: Assembled response and time to first token in seconds
+        """
+        flush_interval = float(config.get("llm.stream_delta_interval", 0.1))
+        start_time = time.monotonic()
+        state = {"first_token_time": None, "last_flush": start_time, "sequence": 0, "eager_stopped": False}
+        pending: List[str] = []
+        content_parts: List[str] = []
+
+        # Tool calls started by an earlier response that was never executed (e.g. the loop failed)
+        await self._cancel_scheduled_tool_calls()
+
+        async def flush() -> None:
+            if not pending:
+                return
+            delta = "".join(pending)
+            pending.clear()
+            state["last_flush"] = time.monotonic()
+            await self.agent_context.dispatch_event(
+                EventType.LLM_STREAM_DELTA,
+                LlmStreamDeltaEventData(
+                    model_name=self.llm_name,
+                    tool_context=tool_context,
+                    delta=delta,
+                    sequence=state["sequence"]
+                )
+            )
+            state["sequence"] += 1
+
+        async def on_delta(content: Optional[str]) -> None:
+            if state["first_token_time"] is None:
+                state["first_token_time"] = time.monotonic() - start_time
+            if content:
+                pending.append(content)
+                content_parts.append(content)
+                if time.monotonic() - state["last_flush"] >= flush_interval:
+                    await flush()
+
+        async def on_tool_call(openai_tool_call: ChatCompletionMessageToolCall) -> None:
+            # Without multi-tool calls only the first tool call is executed
+            if state["eager_stopped"] or (not self.enable_multi_tool_calls and self._tool_scheduler is not None):
+                return
+            # Only tools opting in with eager_safe start early: side effects must not happen before the response is
+            # complete and recorded in history. Later calls wait too, so they are not scheduled ahead of the held-back call.
+            try:
+                tool_instance = tool_factory.get_tool_instance(openai_tool_call.function.name)
+            except ValueError:
+                tool_instance = None
+            if tool_instance is None or not tool_instance.eager_safe:
+                state["eager_stopped"] = True
+                return
+            converted = await self._parse_and_convert_tool_calls([openai_tool_call])
+            if converted:
+                if self._tool_scheduler is None:
+                    self._tool_scheduler = self._create_tool_scheduler()
+                # Models write their text before the tool calls, so the content is final by now
+                partial_message = ChatCompletionMessage(role="assistant", content="".join(content_parts))
+                logger.info(f"Starting tool call {converted[0].function.name} ({converted[0].id}) while the LLM is still streaming")
+                self._tool_scheduler.submit(converted[0], partial_message)
+
+        try:
+            llm_response = await LLMFactory.call_with_tool_support_stream(
+                self.llm_id,
+                messages,
+                tools=tools_list if tools_list else None,
+                stop=self.agent_context.stop_sequences if hasattr(self.agent_context, 'stop_sequences') else None,
+                agent_context=self.agent_context,
+                on_delta=on_delta,
+                on_tool_call=on_tool_call if self.eager_tool_dispatch else None
+            )
+        except BaseException:
+            await self._cancel_scheduled_tool_calls()
+            raise
+        await flush()
+
+        if state["first_token_time"] is not None:
+            logger.info(f"LLM stream: time to first token {state['first_token_time']:.3f}s, {state['sequence']} delta events")
+        return llm_response, state["first_token_time"]
+
+    def _create_tool_scheduler(self) -> ToolScheduler:
+        """Create the scheduler running the tool calls of one LLM response"""
+        return ToolScheduler(
+            execute=self._execute_single_tool_call,
+            parallel=self.enable_parallel_tool_calls,
+            default_timeout=self.parallel_tool_calls_timeout if self.enable_parallel_tool_calls else None
+        )
+
+    async def _execute_single_tool_call(self, tool_call: ToolCall, llm_response_message: ChatCompletionMessage) -> Optional[ToolResult]:
+        """Execute one tool call for ToolScheduler"""
+        results = await self._execute_tool_calls_sequential([tool_call], llm_response_message)
+        return results[0] if results else None
+
+    async def _cancel_scheduled_tool_calls(self) -> None:
+        """Cancel tool calls started during streaming whose results will not be used"""
+        scheduler = self._tool_scheduler
+        self._tool_scheduler = None
+        if scheduler is not None:
+            logger.warning("Cancelling tool calls started during streaming")
+            await scheduler.cancel()
+
     async def _execute_tool_calls(self, tool_calls: List[ToolCall], llm_response_message: ChatCompletionMessage) -> List[ToolResult]:
-        """Execute tool calls with support for parallel execution"""
-        if not self.enable_parallel_tool_calls or len(tool_calls) <= 1:
-            # Non-parallel mode or single tool call, use original logic
-            logger.debug("Using sequential execution mode for tool calls")
-            return await self._execute_tool_calls_sequential(tool_calls, llm_response_message)
-        else:
-            # Parallel mode
-            logger.info(f"Using parallel execution mode for {len(tool_calls)} tool calls")
-            return await self._execute_tool_calls_parallel(tool_calls, llm_response_message)
+        """
+        Execute tool calls through ToolScheduler
+
+        Calls that do not conflict run concurrently when parallel tool calls are enabled, otherwise one at a
+        time. Calls already started while the LLM was streaming are awaited, the others are started now.
+
+        Args:
+            tool_calls: Tool calls of the LLM response
+            llm_response_message: LLM response message
+
+        Returns:
+            List[ToolResult]: Results in the original tool call order
+        """
+        scheduler = self._tool_scheduler
+        self._tool_scheduler = None
+        if scheduler is None:
+            scheduler = self._create_tool_scheduler()
+        mode = "parallel" if self.enable_parallel_tool_calls else "sequential"
+        logger.info(f"Executing {len(tool_calls)} tool calls in {mode} mode")
+        return await scheduler.gather(tool_calls, llm_response_message)
 
     async def _execute_tool_calls_sequential(self, tool_calls: List[ToolCall], llm_response_message: ChatCompletionMessage) -> List[ToolResult]:
         """Execute tool calls using sequential mode (original logic)"""
@@ -1300,199 +1476,10 @@ class Agent(BaseAgent):
         return results
 
     async def _execute_tool_calls_parallel(self, tool_calls: List[ToolCall], llm_response_message: ChatCompletionMessage) -> List[ToolResult]:
-        """Execute tool calls using parallel mode"""
-        # Create a list containing all tool call information for parallel processing
-        tool_tasks = []
-
-        logger.info(f"Preparing to execute {len(tool_calls)} tool calls in parallel, timeout setting: {self.parallel_tool_calls_timeout} seconds")
-
-        # 1. Preprocess all tool calls to generate execution tasks
-        for tool_call in tool_calls:
-            try:
-                tool_name = tool_call.function.name
-                tool_arguments_str = tool_call.function.arguments
-                tool_call_id = tool_call.id
-
-                # Try to parse parameter string to dict
-                try:
-                    tool_arguments_dict = json.loads(tool_arguments_str)
-                    if not isinstance(tool_arguments_dict, dict):
-                        logger.warning(f"Parallel tool call: '{tool_name}' parameters are not dict after parsing, will pass empty dict")
-                        logger.warning(f"Original parameter data: {tool_arguments_str}")
-                        logger.warning(f"Parsed result: {tool_arguments_dict}")
-                        tool_arguments_for_exec = {}
-                    else:
-                        tool_arguments_for_exec = tool_arguments_dict
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Parallel tool call: '{tool_name}' parameters cannot be parsed as JSON, will pass empty dict")
-                    logger.warning(f"Original parameter data: {tool_arguments_str}")
-                    logger.warning(f"Full error message: {e}")
-                    tool_arguments_for_exec = {}
-
-                # Create tool context
-                tool_context = ToolContext(
-                    tool_call_id=tool_call_id,
-                    tool_name=tool_name,
-                    arguments=tool_arguments_for_exec,
-                    metadata=self.agent_context.get_metadata()
-                )
-                # Register AgentContext as extension
-                tool_context.register_extension("agent_context", self.agent_context)
-
-                # Add EventContext extension
-                from app.core.entity.event.event_context import EventContext
-                tool_context.register_extension("event_context", EventContext())
-
-                # Get tool instance
-                tool_instance = tool_factory.get_tool_instance(tool_name)
-
-                # Need to convert internal ToolCall back to OpenAI type for event
-                openai_tool_call = ChatCompletionMessageToolCall(
-                    id=tool_call_id,
-                    type=tool_call.type,
-                    function={"name": tool_name, "arguments": tool_arguments_str}
-                )
-
-                # Add tool call information to task list
-                tool_tasks.append({
-                    "tool_call": tool_call,
-                    "openai_tool_call": openai_tool_call,
-                    "tool_context": tool_context,
-                    "tool_name": tool_name,
-                    "arguments": tool_arguments_for_exec,
-                    "tool_instance": tool_instance
-                })
-
-            except Exception as e:
-                logger.error(f"Error preprocessing tool call: {e}", exc_info=True)
-                # For failed preprocessing, add error result
-                try:
-                    tool_call_id = getattr(tool_call, 'id', None)
-                    tool_name = getattr(getattr(tool_call, 'function', None), 'name', '[unknown]')
-                    if tool_call_id:
-                        # Create error result
-                        error_result = ToolResult(
-                            content=f"Preprocessing tool call '{tool_name}' failed: {e!s}",
-                            tool_call_id=tool_call_id,
-                            name=tool_name,
-                            ok=False
-                        )
-                        # Handle this error result separately
-                        error_task = {
-                            "error_result": error_result,
-                            "is_error": True
-                        }
-                        tool_tasks.append(error_task)
-                except Exception as err:
-                    logger.error(f"Error creating tool call error result: {err}", exc_info=True)
-
-        # If no valid tool call tasks, return directly
-        if not tool_tasks:
-            logger.warning("No valid tool call tasks to execute")
-            return []
-
-        # 2. Define async function for single tool execution
-        async def execute_single_tool(task_info):
-            # Check if it's a preprocessing error result
-            if task_info.get("is_error", False):
-                return task_info.get("error_result")
-
-            tool_call = task_info["tool_call"]
-            openai_tool_call = task_info["openai_tool_call"]
-            tool_context = task_info["tool_context"]
-            tool_name = task_info["tool_name"]
-            arguments = task_info["arguments"]
-            tool_instance = task_info["tool_instance"]
-
-            start_time = time.time()
-
-            try:
-                # Dispatch before tool call event
-                await self.agent_context.dispatch_event(
-                    EventType.BEFORE_TOOL_CALL,
-                    BeforeToolCallEventData(
-                        tool_call=openai_tool_call,
-                        tool_context=tool_context,
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        tool_instance=tool_instance,
-                        llm_response_message=llm_response_message
-                    )
-                )
-
-                # Execute tool call
-                logger.info(f"Executing tool in parallel: {tool_name}, arguments: {arguments}")
-                result = await tool_executor.execute_tool_call(
-                    tool_context=tool_context,
-                    arguments=arguments
-                )
-
-                # Ensure result contains tool_call_id
-                if not result.tool_call_id:
-                    result.tool_call_id = tool_call.id
-
-                # Calculate execution time
-                execution_time = time.time() - start_time
-                result.execution_time = execution_time
-
-                # Dispatch after tool call event
-                await self.agent_context.dispatch_event(
-                    EventType.AFTER_TOOL_CALL,
-                    AfterToolCallEventData(
-                        tool_call=openai_tool_call,
-                        tool_context=tool_context,
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        result=result,
-                        execution_time=execution_time,
-                        tool_instance=tool_instance
-                    )
-                )
-
-                return result
-
-            except Exception as e:
-                logger.error(f"Error executing tool '{tool_name}' in parallel: {e}", exc_info=True)
-                # Calculate execution time (even on error)
-                execution_time = time.time() - start_time
-                # Create failed ToolResult
-                error_result = ToolResult(
-                    content=f"Failed to execute tool '{tool_name}': {e!s}",
-                    tool_call_id=tool_call.id,
-                    name=tool_name,
-                    ok=False,
-                    execution_time=execution_time
-                )
-                return error_result
-
-        # 3. Use Parallel class to execute all tool calls in parallel
-        parallel = Parallel(timeout=self.parallel_tool_calls_timeout)
-
-        # Add task for each tool call
-        for task_info in tool_tasks:
-            parallel.add(execute_single_tool, task_info)
-
-        # Execute all tool calls in parallel and collect results
-        try:
-            results = await parallel.run()
-            logger.info(f"Completed parallel execution of {len(results)} tool calls")
-            return results
-        except asyncio.TimeoutError as e:
-            logger.error(f"Parallel tool call execution timeout: {e}")
-            # Timeout handling: create timeout error result for each tool call
-            timeout_results = []
-            for task_info in tool_tasks:
-                if task_info.get("is_error", False):
-                    # Preserve preprocessing errors
-                    timeout_results.append(task_info.get("error_result"))
-                else:
-                    tool_call = task_info["tool_call"]
-                    tool_name = task_info["tool_name"]
-                    timeout_result = ToolResult(
-                        content=f"Tool '{tool_name}' execution timeout, exceeded {self.parallel_tool_calls_timeout} second limit",
-                        tool_call_id=tool_call.id,
-                        name=tool_name,
-                        ok=False
-                    )
-                    timeout_results.append(timeout_result)
-            return timeout_results
+        """Execute tool calls in parallel, calls touching the same paths or exclusive tools are still ordered"""
+        scheduler = ToolScheduler(
+            execute=self._execute_single_tool_call,
+            parallel=True,
+            default_timeout=self.parallel_tool_calls_timeout
+        )
+        return await scheduler.gather(tool_calls, llm_response_message)
@@ -7,10 +7,11 @@ import io
 import time
 from typing import BinaryIO, Optional
 
-import aiohttp
 import oss2
 from loguru import logger
 
+from app.utils.http_client import get_http_session
+
 from .base import AbstractStorage, BaseFileProcessor, with_refreshed_credentials
 from .exceptions import (
     DownloadException,
@@ -64,30 +65,30 @@ class AliyunOSSUploader(AbstractStorage, BaseFileProcessor):
         if self.metadata:
             json_data["metadata"] = self.metadata
 
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method=self.sts_refresh_config.method,
-                url=self.sts_refresh_config.url,
-                headers=self.sts_refresh_config.headers,
-                json=json_data
-            ) as response:
-                response.raise_for_status()
-                responseBody = await response.json()
-
-                actual_credential_data_wrapper = responseBody.get("data", {})
-                if not actual_credential_data_wrapper:
-                    logger.error("STS refresh response missing 'data' field or 'data' field is empty.")
-                    # Consider raising an exception here if this is a critical failure
-                    return 
+        session = get_http_session()
+        async with session.request(
+            method=self.sts_refresh_config.method,
+            url=self.sts_refresh_config.url,
+            headers=self.sts_refresh_config.headers,
+            json=json_data
+        ) as response:
+            response.raise_for_status()
+            responseBody = await response.json()
+
+            actual_credential_data_wrapper = responseBody.get("data", {})
+            if not actual_credential_data_wrapper:
+                logger.error("STS refresh response missing 'data' field or 'data' field is empty.")
+                # Consider raising an exception here if this is a critical failure
+                return 
 
-                try:
-                    # Use actual_credential_data_wrapper directly, Pydantic model's internal validator will handle it
-                    self.credentials = AliyunCredentials(**actual_credential_data_wrapper)
-                    logger.info("Aliyun OSS STS Token retrieved successfully (via Pydantic model conversion)")
-                except Exception as e:
-                    logger.error(f"Failed to parse refreshed STS credentials: {e}\nInput data from STS: {actual_credential_data_wrapper}") # Log input for debugging
-                    # Handle errors as needed, e.g., raise e
-                    return
+            try:
+                # Use actual_credential_data_wrapper directly, Pydantic model's internal validator will handle it
+                self.credentials = AliyunCredentials(**actual_credential_data_wrapper)
+                logger.info("Aliyun OSS STS Token retrieved successfully (via Pydantic model conversion)")
+            except Exception as e:
+                logger.error(f"Failed to parse refreshed STS credentials: {e}\nInput data from STS: {actual_credential_data_wrapper}") # Log input for debugging
+                # Handle errors as needed, e.g., raise e
+                return
 
     @with_refreshed_credentials
     async def upload(
@@ -12,6 +12,8 @@ from typing import Any, AsyncGenerator, BinaryIO, Dict, Optional, Tuple
 import aiohttp
 from loguru import logger
 
+from app.utils.http_client import get_http_session
+
 from .base import AbstractStorage, BaseFileProcessor, with_refreshed_credentials
 from .exceptions import (
     DownloadException,
@@ -160,16 +162,15 @@ class LocalStorage(AbstractStorage, BaseFileProcessor):
     @asynccontextmanager
     async def _create_client_session(self) -> AsyncGenerator[aiohttp.ClientSession, None]:
         """
-        Context manager to create an HTTP client session.
+        Context manager providing the shared pooled HTTP client session.
+        
+        The session is shared process-wide and is not closed on exit, so connections to the storage
+        service are kept alive between uploads.
         
         Yields:
             aiohttp.ClientSession: HTTP client session
         """
-        session = aiohttp.ClientSession()
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield get_http_session()
 
     @with_refreshed_credentials
     async def upload(
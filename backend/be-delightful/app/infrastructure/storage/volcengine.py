@@ -7,10 +7,11 @@ import io
 import time
 from typing import BinaryIO, Optional
 
-import aiohttp
 from loguru import logger
 from tos import TosClientV2
 
+from app.utils.http_client import get_http_session
+
 from .base import AbstractStorage, BaseFileProcessor, with_refreshed_credentials
 from .exceptions import (
     DownloadException,
@@ -59,17 +60,17 @@ class VolcEngineUploader(AbstractStorage, BaseFileProcessor):
         if self.metadata:
             json_data["metadata"] = self.metadata
 
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method=self.sts_refresh_config.method,
-                url=self.sts_refresh_config.url,
-                headers=self.sts_refresh_config.headers,
-                json=json_data
-            ) as response:
-                response.raise_for_status()
-                responseBody = await response.json()
-                self.credentials = VolcEngineCredentials(**responseBody["data"])
-                logger.info("Volcengine STS token acquired")
+        session = get_http_session()
+        async with session.request(
+            method=self.sts_refresh_config.method,
+            url=self.sts_refresh_config.url,
+            headers=self.sts_refresh_config.headers,
+            json=json_data
+        ) as response:
+            response.raise_for_status()
+            responseBody = await response.json()
+            self.credentials = VolcEngineCredentials(**responseBody["data"])
+            logger.info("Volcengine STS token acquired")
 
     @with_refreshed_credentials
     async def upload(
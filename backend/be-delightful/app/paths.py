@@ -29,6 +29,7 @@ class PathManager(BasePathManager):
     _project_archive_dir_name: ClassVar[str] = "project_archive"
     _project_archive_info_file_relative_path: ClassVar[Optional[str]] = None
     _project_archive_info_file: ClassVar[Optional[Path]] = None
+    _project_archive_manifest_file: ClassVar[Optional[Path]] = None
 
     @classmethod
     def set_project_root(cls, project_root: Path) -> None:
@@ -46,6 +47,7 @@ class PathManager(BasePathManager):
         cls._project_schema_absolute_dir = cls._project_root / cls._project_schema_dir_name
         cls._project_archive_info_file_relative_path = f"{cls._project_schema_dir_name}/project_archive_info.json"
         cls._project_archive_info_file = cls.get_project_schema_absolute_dir() / "project_archive_info.json"
+        cls._project_archive_manifest_file = cls.get_project_schema_absolute_dir() / "project_archive_manifest.json"
 
         # Ensure application layer specific directories exist
         cls._ensure_app_directories_exist()
@@ -118,3 +120,10 @@ class PathManager(BasePathManager):
         if cls._project_archive_info_file is None:
             raise RuntimeError("Must call set_project_root to set project root directory first")
         return cls._project_archive_info_file
+
+    @classmethod
+    def get_project_archive_manifest_file(cls) -> Path:
+        """Get file path of the manifest of files contained in the last uploaded project archive"""
+        if cls._project_archive_manifest_file is None:
+            raise RuntimeError("Must call set_project_root to set project root directory first")
+        return cls._project_archive_manifest_file
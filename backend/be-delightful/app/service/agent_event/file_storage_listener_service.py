@@ -2,7 +2,7 @@
 File storage listener service for monitoring file events and uploading files to object storage
 """
 
-import hashlib
+import asyncio
 import json
 import os
 import shutil
@@ -10,7 +10,7 @@ import tempfile
 import time
 import traceback
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Optional
 
 from agentlang.context.tool_context import ToolContext
 from agentlang.event.data import AfterMainAgentRunEventData
@@ -19,13 +19,14 @@ from agentlang.logger import get_logger
 from app.core.context.agent_context import AgentContext
 from app.core.entity.attachment import Attachment, AttachmentTag
 from app.core.entity.event.file_event import FileEventData  # Import FileEventData from business layer
-from app.core.entity.project_archive import ProjectArchiveInfo
+from app.core.entity.project_archive import ProjectArchiveDelta, ProjectArchiveInfo
 from app.infrastructure.storage.base import BaseFileProcessor
 from app.infrastructure.storage.exceptions import InitException, UploadException
 from app.infrastructure.storage.factory import StorageFactory
 from app.infrastructure.storage.types import StorageResponse
 from app.paths import PathManager
 from app.service.agent_event.base_listener_service import BaseListenerService
+from app.utils.archive_utils import ArchiveManifest, write_zip_archive
 
 logger = get_logger(__name__)
 
@@ -35,6 +36,11 @@ class FileStorageListenerService:
     File storage listener service for monitoring file events and uploading files to object storage
     """
 
+    # Upload a full project archive after this many delta archives
+    MAX_ARCHIVE_DELTAS = 10
+    # Upload a full project archive once accumulated deltas exceed this fraction of the full archive size
+    MAX_DELTA_SIZE_RATIO = 0.5
+
     @staticmethod
     def register_standard_listeners(agent_context: AgentContext) -> None:
         """
@@ -178,98 +184,178 @@ class FileStorageListenerService:
 
         return info_response
 
+    @staticmethod
+    def _load_project_archive_info() -> Optional[ProjectArchiveInfo]:
+        """
+        Load the local project archive information
+
+        Returns:
+            Optional[ProjectArchiveInfo]: Archive information, None if file does not exist or is invalid
+        """
+        try:
+            project_archive_info_file = PathManager.get_project_archive_info_file()
+            if os.path.exists(project_archive_info_file):
+                with open(project_archive_info_file, 'r') as f:
+                    return ProjectArchiveInfo.model_validate(json.load(f))
+        except Exception as e:
+            logger.error(f"Error loading project archive information: {e}")
+        return None
+
+    @staticmethod
+    def _load_archive_manifest(version: int) -> Optional[ArchiveManifest]:
+        """
+        Load the manifest of the last uploaded archive, only if it belongs to the given version
+
+        Args:
+            version: Current project archive version
+
+        Returns:
+            Optional[ArchiveManifest]: Manifest, None if missing or written for another version
+        """
+        try:
+            manifest_file = PathManager.get_project_archive_manifest_file()
+            if not os.path.exists(manifest_file):
+                return None
+            with open(manifest_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != version:
+                return None
+            return {path: (stat[0], stat[1]) for path, stat in data.get('files', {}).items()}
+        except Exception as e:
+            logger.error(f"Error loading project archive manifest: {e}")
+            return None
+
+    @staticmethod
+    def _save_archive_manifest(version: int, manifest: ArchiveManifest) -> None:
+        """
+        Save the manifest of the archive just uploaded
+
+        Args:
+            version: Project archive version of the archive
+            manifest: Files contained in the project at archive time
+        """
+        try:
+            manifest_file = PathManager.get_project_archive_manifest_file()
+            with open(manifest_file, 'w') as f:
+                json.dump({'version': version, 'files': manifest}, f)
+        except Exception as e:
+            logger.error(f"Error saving project archive manifest: {e}")
+
     @staticmethod
     async def _archive_and_upload_project(agent_context: AgentContext) -> None:
         """
         Compress and upload project directory
 
+        Uploads a delta archive with only the files changed since the last version when possible,
+        and a full archive otherwise.
+
         Args:
             agent_context: Agent context object
         """
-        # Compress .chat_history and .workspace directories into one archive
+        # Archive .chat_history and .workspace directories into one zip, streaming from the source trees
         chat_history_dir = PathManager.get_chat_history_dir()
         workspace_dir = PathManager.get_workspace_dir()
         project_archive_dir_name = PathManager.get_project_archive_dir_name()
+        directories = [str(chat_history_dir), str(workspace_dir)]
 
-        combined_zip = FileStorageListenerService._compress_directory(
-            directory_paths=[str(chat_history_dir), str(workspace_dir)],
-            output_filename=project_archive_dir_name
-        )
+        current_info = FileStorageListenerService._load_project_archive_info()
+        base_manifest = None
+        if current_info and len(current_info.deltas) < FileStorageListenerService.MAX_ARCHIVE_DELTAS:
+            base_manifest = FileStorageListenerService._load_archive_manifest(current_info.version)
 
-        if not combined_zip:
-            logger.error("Failed to compress directory, cannot upload")
-            return
-
-        # Calculate file MD5 and size
-        file_size = os.path.getsize(combined_zip)
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            archive_path = os.path.join(tmp_dir, project_archive_dir_name + ".zip")
+            try:
+                archive = await asyncio.to_thread(write_zip_archive, directories, archive_path, base_manifest)
+                if base_manifest is not None:
+                    if not archive.file_count and not archive.deleted_paths:
+                        logger.info("Project has no changes since last archive, skipping upload")
+                        return
+                    delta_size = archive.size + sum(delta.file_size for delta in current_info.deltas)
+                    if delta_size > current_info.file_size * FileStorageListenerService.MAX_DELTA_SIZE_RATIO:
+                        logger.info(f"Accumulated delta size {delta_size} is too large, uploading full archive")
+                        base_manifest = None
+                        archive = await asyncio.to_thread(write_zip_archive, directories, archive_path)
+            except Exception as e:
+                logger.error(f"Failed to compress directory, cannot upload: {e}")
+                return
 
-        # Calculate file MD5
-        md5_hash = hashlib.md5()
-        with open(combined_zip, "rb") as f:
-            # Read file in chunks to handle large files
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5_hash.update(chunk)
-        file_md5 = md5_hash.hexdigest()
+            is_delta = base_manifest is not None
 
-        metadata = agent_context.get_init_client_message_metadata()
-        sts_token_refresh = agent_context.get_init_client_message_sts_token_refresh()
-
-        storage_service = await StorageFactory.get_storage(
-            sts_token_refresh=sts_token_refresh,
-            metadata=metadata
-        )
-
-        # Prepare file key using storage_service.credentials.get_dir() to get directory
-        file_key = BaseFileProcessor.combine_path(storage_service.credentials.get_dir(), project_archive_dir_name + ".zip")
+            metadata = agent_context.get_init_client_message_metadata()
+            sts_token_refresh = agent_context.get_init_client_message_sts_token_refresh()
 
-        # Upload the merged archive file
-        try:
-            storage_response = await storage_service.upload(
-                file=combined_zip,
-                key=file_key,
-                options={}
+            storage_service = await StorageFactory.get_storage(
+                sts_token_refresh=sts_token_refresh,
+                metadata=metadata
             )
 
-            if not storage_response:
-                logger.error(f"Failed to upload {project_archive_dir_name}")
-                return
-
-            logger.info(f"Successfully uploaded {project_archive_dir_name}")
-
             # Get and increment current version number
             current_version = FileStorageListenerService._get_current_version()
             new_version = current_version + 1
-            logger.info(f"Project archive version number incremented from {current_version} to {new_version}")
-
-            # Create project archive information with incremented version number
-            project_archive_info = ProjectArchiveInfo(
-                file_key=storage_response.key,
-                file_size=file_size,
-                file_md5=file_md5,
-                version=new_version
-            )
 
-            # Save project archive information to local file and upload to OSS
-            await FileStorageListenerService._save_and_upload_project_archive_info(
-                project_archive_info=project_archive_info,
-                agent_context=agent_context
-            )
+            # Prepare file key using storage_service.credentials.get_dir() to get directory
+            if is_delta:
+                archive_file_name = f"{project_archive_dir_name}.delta.v{new_version}.zip"
+            else:
+                archive_file_name = project_archive_dir_name + ".zip"
+            file_key = BaseFileProcessor.combine_path(storage_service.credentials.get_dir(), archive_file_name)
 
-            # Save project archive information to agent context
-            agent_context.set_project_archive_info(project_archive_info)
+            # Upload the archive file
+            try:
+                storage_response = await storage_service.upload(
+                    file=archive.path,
+                    key=file_key,
+                    options={}
+                )
 
-            logger.info(f"Project archive information saved: key={storage_response.key}, size={file_size}, md5={file_md5}, version={new_version}")
-        except Exception as e:
-            logger.error(traceback.format_exc())
-            logger.error(f"Error occurred while uploading {project_archive_dir_name}: {e}")
+                if not storage_response:
+                    logger.error(f"Failed to upload {archive_file_name}")
+                    return
+
+                logger.info(f"Successfully uploaded {archive_file_name} ({archive.file_count} files)")
+                logger.info(f"Project archive version number incremented from {current_version} to {new_version}")
+
+                # Create project archive information with incremented version number
+                if is_delta:
+                    project_archive_info = current_info.model_copy(update={
+                        "version": new_version,
+                        "upload_timestamp": int(time.time()),
+                        "deltas": current_info.deltas + [ProjectArchiveDelta(
+                            file_key=storage_response.key,
+                            file_size=archive.size,
+                            file_md5=archive.md5,
+                            version=new_version,
+                            deleted_paths=archive.deleted_paths
+                        )]
+                    })
+                else:
+                    project_archive_info = ProjectArchiveInfo(
+                        file_key=storage_response.key,
+                        file_size=archive.size,
+                        file_md5=archive.md5,
+                        version=new_version
+                    )
+
+                # Save project archive information to local file and upload to OSS
+                await FileStorageListenerService._save_and_upload_project_archive_info(
+                    project_archive_info=project_archive_info,
+                    agent_context=agent_context
+                )
+                FileStorageListenerService._save_archive_manifest(new_version, archive.manifest)
 
-        # Clean up temporary files
-        if combined_zip and os.path.exists(combined_zip):
-            try:
-                os.remove(combined_zip)
-                logger.info(f"Deleted temporary compressed file: {combined_zip}")
+                # Save project archive information to agent context
+                agent_context.set_project_archive_info(project_archive_info)
+
+                logger.info(f"Project archive information saved: key={storage_response.key}, size={archive.size}, md5={archive.md5}, version={new_version}, delta={is_delta}")
             except Exception as e:
-                logger.error(f"Failed to delete temporary compressed file: {e}")
+                logger.error(traceback.format_exc())
+                logger.error(f"Error occurred while uploading {archive_file_name}: {e}")
+        finally:
+            # Clean up temporary files
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            logger.info(f"Deleted temporary archive directory: {tmp_dir}")
 
     @staticmethod
     async def _upload_file_to_storage(filepath: str, agent_context: AgentContext) -> Optional[StorageResponse]:
@@ -400,82 +486,3 @@ class FileStorageListenerService:
         Add attachment to agent context
         """
         agent_context.add_attachment(attachment)
-
-    @staticmethod
-    def _compress_directory(directory_paths: Union[str, List[str]], output_filename: str) -> Optional[str]:
-        """
-        Compress specified directory, supports single or multiple directories
-
-        Args:
-            directory_paths: Directory path(s) to compress, can be single string or list of paths
-            output_filename: Output compressed filename (without extension)
-
-        Returns:
-            Optional[str]: Full path of compressed file on success, None on failure
-        """
-        try:
-            # Convert single directory path to list for unified processing
-            if isinstance(directory_paths, str):
-                directories = [directory_paths]
-            else:
-                directories = directory_paths
-
-            # If only one directory, use direct compression logic (more efficient)
-            if len(directories) == 1 and os.path.exists(directories[0]) and os.path.isdir(directories[0]):
-                directory_path = directories[0]
-                # Create temporary directory to store compressed file
-                tmp_dir = tempfile.mkdtemp()
-                base_name = os.path.join(tmp_dir, output_filename)
-
-                # Create .zip format compressed file
-                compressed_file = shutil.make_archive(
-                    base_name=base_name,  # Base name of compressed file (without extension)
-                    format='zip',         # Compression format, using zip here
-                    root_dir=os.path.dirname(directory_path),  # Root directory (parent of directory to compress)
-                    base_dir=os.path.basename(directory_path)  # Name of directory to compress
-                )
-
-                logger.info(f"Successfully compressed directory {directory_path} to {compressed_file}")
-                return compressed_file
-
-            # Multiple directories case, need to copy to temporary directory first then compress
-            # Create temporary directory as compression source
-            temp_source_dir = tempfile.mkdtemp()
-
-            # Copy all valid directories to temporary directory
-            valid_dirs = False
-            for directory in directories:
-                if not os.path.exists(directory) or not os.path.isdir(directory):
-                    logger.warning(f"Directory to compress does not exist: {directory}")
-                    continue
-
-                valid_dirs = True
-                dir_name = os.path.basename(directory)
-                target_dir = os.path.join(temp_source_dir, dir_name)
-                shutil.copytree(directory, target_dir)
-
-            if not valid_dirs:
-                logger.error("No valid directories available for compression")
-                shutil.rmtree(temp_source_dir)
-                return None
-
-            # Create temporary directory to store compressed file
-            tmp_dir = tempfile.mkdtemp()
-            base_name = os.path.join(tmp_dir, output_filename)
-
-            # Create .zip format compressed file
-            compressed_file = shutil.make_archive(
-                base_name=base_name,  # Base name of compressed file (without extension)
-                format='zip',         # Compression format, using zip here
-                root_dir=temp_source_dir,  # Root directory
-                base_dir='.'          # Compress all content in temporary directory
-            )
-
-            # Clean up temporary source directory
-            shutil.rmtree(temp_source_dir)
-
-            logger.info(f"Successfully compressed multiple directories to {compressed_file}")
-            return compressed_file
-        except Exception as e:
-            logger.error(f"Error occurred during directory compression: {e}")
-            return None
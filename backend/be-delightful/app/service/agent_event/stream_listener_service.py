@@ -1,6 +1,8 @@
+import asyncio
 import traceback
-from typing import List
+from typing import Any, Dict, List, Optional
 
+from agentlang.config.config import config
 from agentlang.context.tool_context import ToolContext
 from agentlang.event.data import (
     AfterInitEventData,
@@ -12,6 +14,7 @@ from agentlang.event.data import (
     BeforeLlmRequestEventData,
     BeforeToolCallEventData,
     ErrorEventData,
+    LlmStreamDeltaEventData,
 )
 from agentlang.event.event import Event, EventType
 from agentlang.logger import get_logger
@@ -23,10 +26,13 @@ from app.core.entity.event.event import (
 )
 from app.core.entity.event.event_context import EventContext
 from app.core.entity.event.file_event import FileEventData
+from app.core.entity.event.tool_event import ToolProgressEventData
 from app.core.entity.factory.task_message_factory import TaskMessageFactory
 from app.core.entity.message.server_message import ServerMessage, TaskStatus, TaskStep
+from app.core.stream import Stream
 from app.core.stream.http_subscription_stream import HTTPSubscriptionStream
 from app.core.stream.stdout_stream import StdoutStream
+from app.core.stream.stream_writer import QueuedStreamWriter, StreamOverflowPolicy
 from app.service.agent_event.base_listener_service import BaseListenerService
 
 logger = get_logger(__name__)
@@ -36,6 +42,9 @@ class StreamListenerService:
     BeDelightful event listener service for handling and sending BeDelightful events
     """
 
+    # Per-stream send queues, keyed by stream ID (same key as agent_context.streams)
+    _writers: Dict[str, QueuedStreamWriter] = {}
+
     @staticmethod
     def register_standard_listeners(agent_context: AgentContext) -> None:
         """
@@ -53,6 +62,7 @@ class StreamListenerService:
             EventType.AFTER_CLIENT_CHAT: StreamListenerService._handle_after_client_chat,
             EventType.BEFORE_LLM_REQUEST: StreamListenerService._handle_before_llm_request,
             EventType.AFTER_LLM_REQUEST: StreamListenerService._handle_after_llm_response,
+            EventType.LLM_STREAM_DELTA: StreamListenerService._handle_llm_stream_delta,
             EventType.BEFORE_TOOL_CALL: StreamListenerService._handle_before_tool_call,
             EventType.AFTER_TOOL_CALL: StreamListenerService._handle_after_tool_call,
             EventType.AGENT_SUSPENDED: StreamListenerService._handle_agent_suspended,
@@ -60,6 +70,7 @@ class StreamListenerService:
             EventType.AFTER_MAIN_AGENT_RUN: StreamListenerService._handle_after_main_agent_run,
             EventType.ERROR: StreamListenerService._handle_error,
             EventType.FILE_CREATED: StreamListenerService._handle_file_created,
+            EventType.TOOL_PROGRESS: StreamListenerService._handle_tool_progress,
         }
 
         # Use base class method to register listeners in batch
@@ -139,6 +150,17 @@ class StreamListenerService:
         await StreamListenerService._send_task_message(event.data.tool_context, task_message, event)
         logger.info(f"Completed LLM request: {event.data.model_name}, time elapsed: {event.data.request_time:.2f}s")
 
+    @staticmethod
+    async def _handle_llm_stream_delta(event: Event[LlmStreamDeltaEventData]) -> None:
+        """
+        Handle LLM stream delta event
+
+        Args:
+            event: LLM stream delta event object containing LlmStreamDeltaEventData
+        """
+        task_message = TaskMessageFactory.create_llm_stream_delta_message(event)
+        await StreamListenerService._send_task_message(event.data.tool_context, task_message, event)
+
     @staticmethod
     async def _handle_before_tool_call(event: Event[BeforeToolCallEventData]) -> None:
         """
@@ -164,6 +186,17 @@ class StreamListenerService:
         task_message = await TaskMessageFactory.create_after_tool_call_message(event)
         await StreamListenerService._send_task_message(event.data.tool_context, task_message, event)
 
+    @staticmethod
+    async def _handle_tool_progress(event: Event[ToolProgressEventData]) -> None:
+        """
+        Handle tool progress event
+
+        Args:
+            event: Tool progress event object containing ToolProgressEventData
+        """
+        task_message = TaskMessageFactory.create_tool_progress_message(event)
+        await StreamListenerService._send_task_message(event.data.tool_context, task_message, event)
+
     @staticmethod
     async def _handle_agent_suspended(event: Event[AgentSuspendedEventData]) -> None:
         """
@@ -209,6 +242,8 @@ class StreamListenerService:
         tool_context.register_extension("event_context", EventContext())
 
         await StreamListenerService._send_task_message(tool_context, task_message, event)
+        # The run result is the last message of a run, make sure clients have it before returning
+        await StreamListenerService.flush_streams(timeout=5.0)
 
     @staticmethod
     async def _handle_error(event: Event[ErrorEventData]) -> None:
@@ -336,34 +371,114 @@ class StreamListenerService:
             else:
                 logger.debug("Event context not found, skipping step processing")
 
+            # Serialize once, every stream receives the same string
             message_json = task_message.model_dump_json()
 
-            # Send to all streams
+            # Queue for all streams; each stream has its own writer so a slow one does not delay the others
             # Create a copy of the dictionary for iteration to avoid errors from modifying dictionary during iteration
-            for stream_id, stream in list(agent_context.streams.items()):
-                try:
-                    if stream.should_ignore_event(event.event_type):
-                        logger.info(f"Skipped writing message to stream, stream type: {type(stream)}, event type: {event.event_type}")
-                        continue
-
-                    logger.info(f"Starting to write message to stream, stream type: {type(stream)}")
-                    await stream.write(message_json)
-                    logger.info(f"Successfully wrote message to stream, stream type: {type(stream)}")
-                except Exception as e:
-                    logger.error(f"Stack trace: {traceback.format_exc()}")
-                    logger.error(f"Failed to write message to stream: {e!s}, removing stream, stream type: {type(stream)}")
-                    # Do not remove if StdoutStream or HTTPStream
-                    if isinstance(stream, StdoutStream) or isinstance(stream, HTTPSubscriptionStream):
-                        logger.info(f"Stream not removed, stream type: {type(stream)}")
-                    else:
-                        logger.info(f"Removing stream, stream type: {type(stream)}")
-                        tool_context.get_extension_typed("agent_context", AgentContext).remove_stream(stream)
-            logger.debug(f"Successfully sent task message: {payload.message_id}")
+            streams = list(agent_context.streams.items())
+            for stream_id, stream in streams:
+                if stream.should_ignore_event(event.event_type):
+                    logger.info(f"Skipped writing message to stream, stream type: {type(stream)}, event type: {event.event_type}")
+                    continue
+
+                writer = StreamListenerService._get_writer(agent_context, stream_id, stream)
+                writer.submit(message_json)
+
+            StreamListenerService._prune_writers({stream_id for stream_id, _ in streams})
+            logger.debug(f"Queued task message for {len(streams)} streams: {payload.message_id}")
         except Exception as e:
             # Print stack trace
             logger.error(f"Stack trace: {traceback.format_exc()}")
             logger.error(f"Failed to send task message: {e!s}")
 
+    @staticmethod
+    def _get_writer(agent_context: AgentContext, stream_id: str, stream: Stream) -> QueuedStreamWriter:
+        """
+        Get the send queue of a stream, creating it on first use
+
+        Args:
+            agent_context: Agent context owning the stream
+            stream_id: Stream ID in agent_context.streams
+            stream: Stream instance
+
+        Returns:
+            QueuedStreamWriter: Writer for the stream
+        """
+        writer = StreamListenerService._writers.get(stream_id)
+        # Stream IDs are object IDs and may be reused after a stream is garbage collected
+        if writer and writer.stream is stream and not writer.closed:
+            return writer
+
+        policy = StreamOverflowPolicy(config.get("stream_queue.overflow_policy", StreamOverflowPolicy.DISCONNECT.value))
+        removable = not StreamListenerService._is_persistent_stream(stream)
+        if policy == StreamOverflowPolicy.DISCONNECT and not removable:
+            # Stdout and HTTP subscription streams are never removed, shed load instead
+            policy = StreamOverflowPolicy.DROP_OLDEST
+
+        def on_failure(failed_writer: QueuedStreamWriter, error: Exception) -> None:
+            logger.error(f"Failed to write message to stream: {error!s}, stream type: {type(stream)}")
+            if removable:
+                logger.info(f"Removing stream, stream type: {type(stream)}")
+                failed_writer.close()
+                agent_context.remove_stream(stream)
+            else:
+                logger.info(f"Stream not removed, stream type: {type(stream)}")
+
+        writer = QueuedStreamWriter(
+            stream,
+            max_queue_size=int(config.get("stream_queue.max_size", 1000)),
+            overflow_policy=policy,
+            on_failure=on_failure,
+        )
+        StreamListenerService._writers[stream_id] = writer
+        return writer
+
+    @staticmethod
+    def _is_persistent_stream(stream: Stream) -> bool:
+        """Check if a stream must be kept even when writing to it fails"""
+        return isinstance(stream, (StdoutStream, HTTPSubscriptionStream))
+
+    @staticmethod
+    def _prune_writers(active_stream_ids: set) -> None:
+        """Close writers of streams that are no longer registered"""
+        for stream_id in list(StreamListenerService._writers):
+            writer = StreamListenerService._writers[stream_id]
+            if stream_id not in active_stream_ids or writer.closed:
+                writer.close()
+                del StreamListenerService._writers[stream_id]
+
+    @staticmethod
+    async def flush_streams(timeout: Optional[float] = None) -> None:
+        """
+        Wait until every stream's send queue has been written
+
+        Args:
+            timeout: Maximum time to wait per stream in seconds
+        """
+        writers = list(StreamListenerService._writers.values())
+        results = await asyncio.gather(*(writer.flush(timeout) for writer in writers))
+        for writer, drained in zip(writers, results):
+            if not drained:
+                logger.warning(f"Timed out flushing stream queue, stream type: {type(writer.stream)}, depth: {writer.get_stats()['depth']}")
+
+    @staticmethod
+    def get_stream_stats() -> List[Dict[str, Any]]:
+        """
+        Get per-stream queue metrics
+
+        Returns:
+            List[Dict[str, Any]]: Queue depth, lag and counters of every stream writer
+        """
+        stats = []
+        for stream_id, writer in list(StreamListenerService._writers.items()):
+            item = {"stream_id": stream_id, **writer.get_stats()}
+            # Streams with their own buffering (HTTP subscription) report it as well
+            if isinstance(writer.stream, HTTPSubscriptionStream):
+                item["stream_buffer"] = writer.stream.get_stats()
+            stats.append(item)
+        return stats
+
     @staticmethod
     async def _handle_file_created(event: Event[FileEventData]) -> None:
         """
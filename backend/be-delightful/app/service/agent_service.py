@@ -13,6 +13,7 @@ from agentlang.event.data import AfterInitEventData
 from agentlang.event.event import EventType
 from agentlang.logger import get_logger
 from app.core.context.agent_context import AgentContext
+from app.core.entity.project_archive import ProjectArchiveInfo
 from app.core.stream.base import Stream
 from app.infrastructure.storage.base import BaseFileProcessor
 from app.infrastructure.storage.factory import StorageFactory
@@ -185,6 +186,45 @@ class AgentService:
         os.unlink(temp_zip_path)
         logger.info(f"Temp file deleted: {temp_zip_path}")
 
+        # Apply incremental archives uploaded after the full archive
+        await self._apply_project_archive_deltas(storage_service)
+
+    async def _apply_project_archive_deltas(self, storage_service) -> None:
+        """
+        Download and apply delta archives listed in the local project archive info, in version order
+
+        Args:
+            storage_service: Storage service used to download delta archives
+        """
+        with open(PathManager.get_project_archive_info_file(), 'r') as f:
+            project_archive_info = ProjectArchiveInfo.model_validate(json.load(f))
+        if not project_archive_info.deltas:
+            return
+
+        project_root = PathManager.get_project_root().resolve()
+        for delta in sorted(project_archive_info.deltas, key=lambda d: d.version):
+            logger.info(f"Applying project archive delta v{delta.version}: {delta.file_key}")
+            delta_stream = await storage_service.download(key=delta.file_key, options=None)
+
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as temp_delta:
+                temp_delta_path = temp_delta.name
+                temp_delta.write(delta_stream.read())
+            try:
+                with zipfile.ZipFile(temp_delta_path, 'r') as zip_ref:
+                    zip_ref.extractall(project_root)
+            finally:
+                os.unlink(temp_delta_path)
+
+            for deleted_path in delta.deleted_paths:
+                target = (project_root / deleted_path).resolve()
+                if not target.is_relative_to(project_root):
+                    logger.warning(f"Skipping deleted path outside project root: {deleted_path}")
+                    continue
+                if target.is_file():
+                    target.unlink()
+
+        logger.info(f"Applied {len(project_archive_info.deltas)} project archive deltas")
+
     def _save_init_client_message_to_credentials(self, agent_context: AgentContext) -> None:
         """
         Save client initialization message
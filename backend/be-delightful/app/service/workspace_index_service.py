@@ -0,0 +1,373 @@
+"""
+Workspace file index service
+
+Keeps an in-memory index of every file and directory in the workspace (size, mtime, text/binary flag and
+lazily computed line and token counts), built once by a background scan and kept current by a watchdog
+observer. FileSearch and ListDir query it instead of walking and re-tokenizing the workspace on every call.
+"""
+import fnmatch
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from agentlang.logger import get_logger
+from agentlang.utils.file import count_file_lines, count_file_tokens, is_text_file
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class IndexedEntry:
+    """A file or directory in the index"""
+    path: str  # Absolute path
+    name: str
+    is_dir: bool
+    size: int
+    mtime: float
+    mtime_ns: int
+    is_text: bool = False
+    # Line and token counts, valid while (size, mtime_ns) equals counts_signature
+    line_count: Optional[int] = None
+    token_count: Optional[int] = None
+    counts_signature: Optional[Tuple[int, int]] = field(default=None, repr=False)
+
+
+class _IndexEventHandler(FileSystemEventHandler):
+    """Applies file system events to the index"""
+
+    def __init__(self, service: "WorkspaceIndexService"):
+        super().__init__()
+        self.service = service
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        try:
+            if event.event_type == "moved":
+                self.service.remove_path(event.src_path)
+                self.service.refresh_path(event.dest_path)
+            elif event.event_type == "deleted":
+                self.service.remove_path(event.src_path)
+            else:
+                self.service.refresh_path(event.src_path)
+            self.service.events_processed += 1
+        except Exception as e:
+            logger.debug(f"Failed to apply file system event {event.event_type} for {event.src_path}: {e}")
+
+
+class WorkspaceIndexService:
+    """
+    Workspace file index service, answers file searches and directory listings from memory
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get WorkspaceIndexService singleton instance"""
+        if cls._instance is None:
+            cls._instance = WorkspaceIndexService()
+        return cls._instance
+
+    def __init__(self):
+        """Initialize workspace index service"""
+        if WorkspaceIndexService._instance is not None:
+            return
+
+        self._root: Optional[str] = None
+        self._entries: Dict[str, IndexedEntry] = {}
+        # Directory path -> paths of its direct children
+        self._children: Dict[str, Set[str]] = {}
+        # Directory path -> directory mtime when its children were last scanned
+        self._scanned_mtime_ns: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._ready = threading.Event()
+        self._observer: Optional[Observer] = None
+        self._scan_thread: Optional[threading.Thread] = None
+
+        # Metrics
+        self.events_processed = 0
+        self.scan_seconds = 0.0
+
+    def start(self, root: Path) -> None:
+        """
+        Start watching a workspace and build its index in the background
+
+        Args:
+            root: Workspace directory
+        """
+        if self._observer is not None:
+            logger.warning("Workspace index service is already running")
+            return
+
+        root_path = Path(root).resolve()
+        root_path.mkdir(parents=True, exist_ok=True)
+        self._root = str(root_path)
+
+        # Watch first so changes made during the initial scan are not lost
+        self._observer = Observer()
+        self._observer.schedule(_IndexEventHandler(self), self._root, recursive=True)
+        self._observer.daemon = True
+        self._observer.start()
+
+        self._scan_thread = threading.Thread(target=self._initial_scan, daemon=True)
+        self._scan_thread.start()
+        logger.info(f"Workspace index service started for {self._root}")
+
+    def stop(self) -> None:
+        """Stop watching the workspace"""
+        if self._observer is not None:
+            logger.info("Stopping workspace index service")
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        self._ready.clear()
+
+    def is_ready(self, root: Path) -> bool:
+        """
+        Check whether the index can answer queries for a directory tree
+
+        Args:
+            root: Root directory of the caller
+
+        Returns:
+            bool: True if the index is built and covers exactly this root
+        """
+        if not self._ready.is_set() or self._observer is None or not self._observer.is_alive():
+            return False
+        return str(Path(root).resolve()) == self._root
+
+    def search_files(self, pattern: str, limit: int) -> List[IndexedEntry]:
+        """
+        Fuzzy search file names, same matching as FileSearch: *pattern* on the lowercase name, exact
+        matches first, then shorter names, then path
+
+        Args:
+            pattern: Part of the file name
+            limit: Maximum number of results
+
+        Returns:
+            List[IndexedEntry]: Existing matching files with fresh stat information
+        """
+        regex = re.compile(fnmatch.translate(f"*{pattern}*".lower()))
+        pattern_lower = pattern.lower()
+        with self._lock:
+            candidates = [
+                entry for entry in self._entries.values()
+                if not entry.is_dir and regex.match(entry.name.lower())
+            ]
+        candidates.sort(key=lambda entry: (entry.name.lower() != pattern_lower, len(entry.name), entry.path))
+
+        results = []
+        for entry in candidates:
+            # Events may lag behind the file system, confirm each returned file
+            refreshed = self.refresh_path(entry.path, recursive=False)
+            if refreshed is not None and not refreshed.is_dir:
+                results.append(refreshed)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def list_directory(self, directory: Path) -> Optional[List[IndexedEntry]]:
+        """
+        Get the direct children of a directory, directories first, then by lowercase name
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Optional[List[IndexedEntry]]: Children, or None if the directory is not indexed
+        """
+        key = str(Path(directory).resolve())
+        self._revalidate_directory(key)
+        with self._lock:
+            if key not in self._children:
+                return None
+            children = [self._entries[path] for path in self._children[key] if path in self._entries]
+        children.sort(key=lambda entry: (not entry.is_dir, entry.name.lower()))
+        return children
+
+    def get_counts(self, entry: IndexedEntry, calculate_tokens: bool) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get line and token counts of a text file, computed once per file version
+
+        Args:
+            entry: Indexed file
+            calculate_tokens: Whether the token count is needed
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: (line count, token count)
+        """
+        signature = (entry.size, entry.mtime_ns)
+        if entry.counts_signature != signature:
+            entry.line_count = count_file_lines(Path(entry.path))
+            entry.token_count = None
+            entry.counts_signature = signature
+        if calculate_tokens and entry.token_count is None:
+            entry.token_count = count_file_tokens(Path(entry.path))
+        return entry.line_count, entry.token_count if calculate_tokens else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics
+
+        Returns:
+            Dict: Entry counts, total size and maintenance metrics
+        """
+        with self._lock:
+            files = [entry for entry in self._entries.values() if not entry.is_dir]
+            return {
+                "root": self._root,
+                "ready": self._ready.is_set(),
+                "files": len(files),
+                "text_files": sum(1 for entry in files if entry.is_text),
+                "directories": len(self._children),
+                "total_size": sum(entry.size for entry in files),
+                "scan_seconds": round(self.scan_seconds, 3),
+                "events_processed": self.events_processed,
+            }
+
+    def refresh_path(self, path: str, recursive: bool = True) -> Optional[IndexedEntry]:
+        """
+        Update the index entry of a path from the file system
+
+        Args:
+            path: Absolute path
+            recursive: Scan the subtree if the path is a new directory
+
+        Returns:
+            Optional[IndexedEntry]: Updated entry, None if the path no longer exists or is outside the root
+        """
+        if not self._is_under_root(path):
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.remove_path(path)
+            return None
+
+        is_dir = os.path.isdir(path)
+        with self._lock:
+            known_dir = path in self._children
+            entry = self._add_entry(path, st, is_dir)
+        if is_dir and recursive and not known_dir:
+            self._scan_tree(path)
+        return entry
+
+    def remove_path(self, path: str) -> None:
+        """
+        Remove a path and everything below it from the index
+
+        Args:
+            path: Absolute path
+        """
+        with self._lock:
+            parent = os.path.dirname(path)
+            if parent in self._children:
+                self._children[parent].discard(path)
+            stack = [path]
+            while stack:
+                current = stack.pop()
+                self._entries.pop(current, None)
+                self._scanned_mtime_ns.pop(current, None)
+                stack.extend(self._children.pop(current, ()))
+
+    def _is_under_root(self, path: str) -> bool:
+        return self._root is not None and path != self._root and path.startswith(self._root + os.sep)
+
+    def _add_entry(self, path: str, st: os.stat_result, is_dir: bool) -> IndexedEntry:
+        """Insert or update an entry, caller holds the lock"""
+        name = os.path.basename(path)
+        entry = self._entries.get(path)
+        if entry is None or entry.is_dir != is_dir:
+            entry = IndexedEntry(
+                path=path,
+                name=name,
+                is_dir=is_dir,
+                size=st.st_size,
+                mtime=st.st_mtime,
+                mtime_ns=st.st_mtime_ns,
+                is_text=not is_dir and is_text_file(Path(path)),
+            )
+            self._entries[path] = entry
+        else:
+            entry.size = st.st_size
+            entry.mtime = st.st_mtime
+            entry.mtime_ns = st.st_mtime_ns
+        if is_dir:
+            self._children.setdefault(path, set())
+        parent = os.path.dirname(path)
+        if parent == self._root or parent in self._entries:
+            self._children.setdefault(parent, set()).add(path)
+        return entry
+
+    def _scan_tree(self, directory: str) -> None:
+        """Index a directory tree"""
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            stack.extend(self._scan_directory(current))
+
+    def _scan_directory(self, directory: str) -> List[str]:
+        """
+        Index the direct children of a directory, dropping children that no longer exist
+
+        Returns:
+            List[str]: Child directories that were not indexed before
+        """
+        found: Dict[str, Tuple[os.stat_result, bool]] = {}
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    try:
+                        found[item.path] = (item.stat(), item.is_dir())
+                    except OSError:
+                        continue
+            dir_stat = os.stat(directory)
+        except OSError:
+            self.remove_path(directory)
+            return []
+
+        new_dirs = []
+        with self._lock:
+            known = self._children.get(directory, set())
+            for path in known - set(found):
+                self.remove_path(path)
+            for path, (st, is_dir) in found.items():
+                if is_dir and path not in self._children:
+                    new_dirs.append(path)
+                self._add_entry(path, st, is_dir)
+            if directory != self._root:
+                self._add_entry(directory, dir_stat, True)
+            self._children.setdefault(directory, set())
+            self._scanned_mtime_ns[directory] = dir_stat.st_mtime_ns
+        return new_dirs
+
+    def _revalidate_directory(self, directory: str) -> None:
+        """Rescan a directory whose mtime changed since it was indexed, in case an event was missed"""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            scanned_mtime_ns = self._scanned_mtime_ns.get(directory)
+        if scanned_mtime_ns != mtime_ns:
+            for new_dir in self._scan_directory(directory):
+                self._scan_tree(new_dir)
+
+    def _initial_scan(self) -> None:
+        started_at = time.monotonic()
+        try:
+            self._scan_tree(self._root)
+            self.scan_seconds = time.monotonic() - started_at
+            self._ready.set()
+            stats = self.get_stats()
+            logger.info(f"Workspace index built: {stats['files']} files, {stats['directories']} directories in {self.scan_seconds:.2f}s")
+        except Exception as e:
+            logger.error(f"Failed to build workspace index: {e}", exc_info=True)
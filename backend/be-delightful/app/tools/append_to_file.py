@@ -12,7 +12,7 @@ from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.syntax_checker import SyntaxChecker
 from app.core.entity.message.server_message import FileContent, ToolDetail
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
@@ -66,6 +66,9 @@ class AppendToFile(AbstractFileTool[AppendToFileParams], WorkspaceGuardTool[Appe
     - If the file already exists, will append content at the end of the file
     """
 
+    concurrency = ToolConcurrency.PATH_MUTATING
+    path_params = ("file_path",)
+
     async def execute(self, tool_context: ToolContext, params: AppendToFileParams) -> ToolResult:
         """
         Perform the file append operation.
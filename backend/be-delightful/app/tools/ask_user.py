@@ -14,7 +14,7 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from app.core.entity.message.server_message import AskUserContent, DisplayType, ToolDetail
 from app.core.entity.tool.tool_result import AskUserToolResult
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 
 logger = get_logger(__name__)
 
@@ -46,6 +46,8 @@ class AskUser(BaseTool[AskUserParams]):
     Use when you need extra information, confirmation, or further instruction. It allows asking and waiting for a reply before continuing. Use only when necessary; generally you should guide the flow yourself to achieve the user's goals.
     """
 
+    concurrency = ToolConcurrency.EXCLUSIVE
+
     async def execute(self, tool_context: ToolContext, params: AskUserParams) -> AskUserToolResult:
         """
         Ask the user a question and wait for a response.
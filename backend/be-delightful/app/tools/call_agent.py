@@ -7,7 +7,7 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.file import get_file_info
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 
 logger = get_logger(__name__)
 
@@ -46,6 +46,8 @@ class CallAgent(AbstractFileTool[CallAgentParams]):
     Each call should have a small enough and clear enough goal to allow the agent to complete the task in the most efficient way.
     """
 
+    concurrency = ToolConcurrency.EXCLUSIVE
+
     def get_prompt_hint(self) -> str:
         """Generate XML-formatted prompt information with detailed tool usage instructions"""
         hint = """<tool name="call_agent">
@@ -16,7 +16,7 @@ from agentlang.utils.file import generate_safe_filename
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
 from app.paths import PathManager
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.download_from_url import DownloadFromUrl, DownloadFromUrlParams
 from app.tools.summarize import Summarize
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
@@ -114,6 +114,9 @@ class ConvertPdf(AbstractFileTool[ConvertPdfParams], WorkspaceGuardTool[ConvertP
     ```
     """
 
+    concurrency = ToolConcurrency.PATH_MUTATING
+    path_params = ("input_path", "output_path")
+
     async def execute(
         self,
         tool_context: ToolContext,
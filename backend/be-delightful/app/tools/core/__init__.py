@@ -1,6 +1,6 @@
 """Core components for the tool framework."""
 
-from app.tools.core.base_tool import BaseTool
+from app.tools.core.base_tool import BaseTool, ToolConcurrency
 from app.tools.core.base_tool_params import BaseToolParams
 from app.tools.core.tool_decorator import tool
 from app.tools.core.tool_factory import tool_factory
@@ -8,6 +8,7 @@ from app.tools.core.tool_factory import tool_factory
 __all__ = [
     "BaseTool",
     "BaseToolParams",
+    "ToolConcurrency",
     "tool",
     "tool_factory"
 ]
@@ -8,7 +8,8 @@ import os
 import re
 import time
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Dict, Generic, Optional, Type, TypeVar, Union, get_args, get_origin
+from enum import Enum
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
 
 from pydantic import ConfigDict, ValidationError
 
@@ -17,12 +18,21 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.snowflake import Snowflake
 from app.core.entity.message.server_message import ToolDetail
+from app.paths import PathManager
 from app.tools.core.base_tool_params import BaseToolParams
 
 # Parameter type variable
 T = TypeVar('T', bound=BaseToolParams)
 
 
+class ToolConcurrency(str, Enum):
+    """How calls of a tool may overlap with other tool calls, used by ToolScheduler"""
+
+    READ_ONLY = "read_only"  # Only reads, runs alongside any call that does not write the paths it reads
+    PATH_MUTATING = "path_mutating"  # Writes the paths in its arguments, ordered with calls touching them
+    EXCLUSIVE = "exclusive"  # Global or unknown side effects, runs alone
+
+
 class BaseTool(Generic[T], ABC):
     """Base class for tools defining shared interfaces and behaviors."""
     # Tool metadata (class level)
@@ -30,6 +40,14 @@ class BaseTool(Generic[T], ABC):
     description: ClassVar[str] = ""
     params_class: ClassVar[Type[T]] = None
 
+    # Scheduling metadata (class level), see ToolScheduler
+    concurrency: ClassVar[ToolConcurrency] = ToolConcurrency.EXCLUSIVE
+    path_params: ClassVar[Tuple[str, ...]] = ()  # Parameters holding the paths a call reads or writes
+    reads_workspace: ClassVar[bool] = False  # Calls read the whole workspace (searches), regardless of path_params
+    call_timeout: ClassVar[Optional[float]] = None  # Timeout of one call (seconds), None for the scheduler default
+    max_concurrent_calls: ClassVar[Optional[int]] = None  # Calls of this tool running at once, None for no limit
+    eager_safe: ClassVar[bool] = False  # Calls have no side effects and may start while the LLM is still streaming
+
     # Config options
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -156,6 +174,33 @@ class BaseTool(Generic[T], ABC):
         """Execute the tool."""
         pass
 
+    def get_accessed_paths(self, arguments: Dict[str, Any]) -> Optional[List[str]]:
+        """Get the paths a call reads or writes, used to order conflicting tool calls.
+
+        Relative paths are resolved against the workspace directory. Tools reading the whole workspace
+        report the workspace directory, so they are ordered after earlier writes.
+
+        Args:
+            arguments: Tool call arguments.
+
+        Returns:
+            Optional[List[str]]: Normalized absolute paths, None if a path-mutating call names no path.
+        """
+        workspace_dir = str(PathManager.get_workspace_dir())
+        if self.reads_workspace:
+            return [os.path.normpath(workspace_dir)]
+        paths = []
+        for param in self.path_params:
+            value = arguments.get(param)
+            if value is None and self.params_class and param in self.params_class.model_fields:
+                value = self.params_class.model_fields[param].default
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, str) and item.strip():
+                    paths.append(os.path.normpath(os.path.join(workspace_dir, item.strip())))
+        if not paths and self.concurrency == ToolConcurrency.PATH_MUTATING:
+            return None
+        return paths
+
     def get_effective_name(self) -> str:
         """Get the effective tool name (instance override > class value)."""
         return self._custom_name if self._custom_name is not None else self.__class__.name
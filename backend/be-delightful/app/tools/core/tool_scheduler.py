@@ -0,0 +1,190 @@
+"""
+Tool call scheduler
+
+Runs the tool calls of an LLM response as concurrently as the tools allow: every call waits only for the
+earlier calls it conflicts with. Read-only calls run together, a call writing a path is ordered with every
+call touching that path or a path below it, and exclusive tools (shell_exec, finish_task, ask_user, ...)
+run alone. Per-tool timeouts and concurrency limits apply on top.
+"""
+import asyncio
+import contextlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from agentlang.chat_history import ToolCall
+from agentlang.config.config import config
+from agentlang.logger import get_logger
+from agentlang.tools.tool_result import ToolResult
+from app.tools.core.base_tool import ToolConcurrency
+from app.tools.core.tool_factory import tool_factory
+
+logger = get_logger(__name__)
+
+# Executes one tool call, receives the extra arguments passed to submit
+ToolCallExecutor = Callable[..., Awaitable[Optional[ToolResult]]]
+
+
+def _paths_overlap(path: str, other: str) -> bool:
+    """Check whether two normalized paths are the same or one contains the other"""
+    return path == other or path.startswith(other.rstrip(os.sep) + os.sep) or other.startswith(path.rstrip(os.sep) + os.sep)
+
+
+@dataclass
+class ScheduledToolCall:
+    """A submitted tool call with the access information used for scheduling"""
+    tool_call: ToolCall
+    tool_name: str
+    concurrency: ToolConcurrency
+    paths: Optional[List[str]]  # None when unknown, conflicts with every call
+    timeout: Optional[float]
+    task: Optional[asyncio.Task] = None
+
+    def conflicts_with(self, other: "ScheduledToolCall") -> bool:
+        """Check whether the two calls must not run at the same time"""
+        if ToolConcurrency.EXCLUSIVE in (self.concurrency, other.concurrency):
+            return True
+        if self.paths is None or other.paths is None:
+            return True
+        if self.concurrency == ToolConcurrency.READ_ONLY and other.concurrency == ToolConcurrency.READ_ONLY:
+            return False
+        return any(_paths_overlap(path, other_path) for path in self.paths for other_path in other.paths)
+
+
+class ToolScheduler:
+    """Schedules the tool calls of one LLM response"""
+
+    def __init__(self, execute: ToolCallExecutor, parallel: bool = True, default_timeout: Optional[float] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            execute: Executes one tool call and returns its result
+            parallel: Run non-conflicting calls concurrently, otherwise one at a time in submission order
+            default_timeout: Timeout (seconds) of tools without their own timeout, None for no timeout
+        """
+        self._execute = execute
+        self.parallel = parallel
+        self.default_timeout = default_timeout
+        # Tool call id -> scheduled call, in submission order
+        self._calls: Dict[str, ScheduledToolCall] = {}
+        self._global_semaphore = asyncio.Semaphore(max(int(config.get("agent.max_parallel_tool_calls", 8)), 1))
+        self._tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def submit(self, tool_call: ToolCall, *args: Any) -> asyncio.Task:
+        """
+        Start a tool call once the earlier calls it conflicts with have finished
+
+        Args:
+            tool_call: Tool call to run, calls must be submitted in their original order
+            *args: Extra arguments passed to the executor
+
+        Returns:
+            asyncio.Task: Task resolving to the tool result
+        """
+        if tool_call.id in self._calls:
+            return self._calls[tool_call.id].task
+
+        scheduled = self._describe(tool_call)
+        if self.parallel:
+            dependencies = [call.task for call in self._calls.values() if scheduled.conflicts_with(call)]
+        else:
+            dependencies = [call.task for call in list(self._calls.values())[-1:]]
+        logger.debug(
+            f"Scheduling tool call {scheduled.tool_name} ({tool_call.id}, {scheduled.concurrency.value}) "
+            f"after {len(dependencies)} conflicting calls"
+        )
+        scheduled.task = asyncio.create_task(self._run(scheduled, dependencies, args))
+        self._calls[tool_call.id] = scheduled
+        return scheduled.task
+
+    async def gather(self, tool_calls: List[ToolCall], *args: Any) -> List[ToolResult]:
+        """
+        Submit the calls not submitted yet and wait for all of them
+
+        Args:
+            tool_calls: Tool calls of the response, in their original order
+            *args: Extra arguments passed to the executor of newly submitted calls
+
+        Returns:
+            List[ToolResult]: Results in the order of tool_calls
+        """
+        tasks = [self.submit(tool_call, *args) for tool_call in tool_calls]
+        # Calls submitted earlier but no longer part of the response still have to finish
+        others = [call.task for tool_call_id, call in self._calls.items() if call.task not in tasks]
+        try:
+            results = await asyncio.gather(*tasks)
+            if others:
+                await asyncio.wait(others)
+        except BaseException:
+            await self.cancel()
+            raise
+        return [result for result in results if result]
+
+    async def cancel(self) -> None:
+        """Cancel all unfinished calls"""
+        tasks = [call.task for call in self._calls.values() if not call.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _describe(self, tool_call: ToolCall) -> ScheduledToolCall:
+        """Look up the access information of a tool call"""
+        tool_name = tool_call.function.name
+        try:
+            tool_instance = tool_factory.get_tool_instance(tool_name)
+        except ValueError:
+            tool_instance = None
+        if tool_instance is None:
+            return ScheduledToolCall(tool_call, tool_name, ToolConcurrency.EXCLUSIVE, None, self.default_timeout)
+
+        try:
+            arguments = json.loads(tool_call.function.arguments)
+        except (json.JSONDecodeError, TypeError):
+            arguments = {}
+        if not isinstance(arguments, dict):
+            arguments = {}
+
+        timeout = config.get("agent.tool_timeouts", {}).get(tool_name, tool_instance.call_timeout)
+        return ScheduledToolCall(
+            tool_call=tool_call,
+            tool_name=tool_name,
+            concurrency=tool_instance.concurrency,
+            paths=tool_instance.get_accessed_paths(arguments),
+            timeout=timeout if timeout is not None else self.default_timeout,
+        )
+
+    def _get_tool_semaphore(self, tool_name: str) -> Optional[asyncio.Semaphore]:
+        """Get the semaphore limiting concurrent calls of a tool, None if unlimited"""
+        if tool_name not in self._tool_semaphores:
+            limit = config.get("agent.tool_concurrency_limits", {}).get(tool_name)
+            if limit is None:
+                try:
+                    limit = tool_factory.get_tool_instance(tool_name).max_concurrent_calls
+                except ValueError:
+                    limit = None
+            self._tool_semaphores[tool_name] = asyncio.Semaphore(max(int(limit), 1)) if limit else None
+        return self._tool_semaphores[tool_name]
+
+    async def _run(self, scheduled: ScheduledToolCall, dependencies: List[asyncio.Task], args: tuple) -> Optional[ToolResult]:
+        if dependencies:
+            # Only wait for them, their results are collected by gather
+            await asyncio.wait(dependencies)
+
+        tool_semaphore = self._get_tool_semaphore(scheduled.tool_name)
+        async with self._global_semaphore, tool_semaphore or contextlib.nullcontext():
+            execution = self._execute(scheduled.tool_call, *args)
+            if not scheduled.timeout:
+                return await execution
+            try:
+                return await asyncio.wait_for(execution, timeout=scheduled.timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Tool call {scheduled.tool_name} ({scheduled.tool_call.id}) timed out after {scheduled.timeout} seconds")
+                return ToolResult(
+                    content=f"Tool '{scheduled.tool_name}' execution timeout, exceeded {scheduled.timeout} second limit",
+                    tool_call_id=scheduled.tool_call.id,
+                    name=scheduled.tool_name,
+                    ok=False
+                )
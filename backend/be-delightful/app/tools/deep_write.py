@@ -11,7 +11,7 @@ from app.core.context.agent_context import AgentContext
 from app.core.entity.factory.tool_detail_factory import ToolDetailFactory
 from app.core.entity.message.server_message import ToolDetail
 from app.core.entity.tool.tool_result import DeepWriteToolResult
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 from app.tools.read_file import ReadFile, ReadFileParams
 
 logger = get_logger(__name__)
@@ -56,6 +56,9 @@ class DeepWrite(BaseTool[DeepWriteParams]):
     - If references are insufficient to support the task, this tool returns guidance; adjust references or requirements accordingly.
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    path_params = ("reference_files",)
+
     async def execute(
         self,
         tool_context: ToolContext,
@@ -8,7 +8,7 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.file import safe_delete
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
@@ -34,6 +34,9 @@ class DeleteFile(AbstractFileTool[DeleteFileParams], WorkspaceGuardTool[DeleteFi
     - Can only delete files in working directory
     """
 
+    concurrency = ToolConcurrency.PATH_MUTATING
+    path_params = ("file_path",)
+
     def __init__(self, **data):
         super().__init__(**data)
 
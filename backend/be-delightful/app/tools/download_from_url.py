@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import Any, Dict, NamedTuple, Optional
 
 import aiofiles
-import aiohttp
 from pydantic import Field
 
 from agentlang.context.tool_context import ToolContext
@@ -13,8 +12,9 @@ from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.file import generate_safe_filename
 from app.core.entity.message.server_message import FileContent, ToolDetail
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
+from app.utils.http_client import create_cookie_session
 
 logger = get_logger(__name__)
 
@@ -69,6 +69,9 @@ class DownloadFromUrl(AbstractFileTool[DownloadFromUrlParams], WorkspaceGuardToo
     - Supports many file types (images, PDFs, archives, etc.)
     """
 
+    concurrency = ToolConcurrency.PATH_MUTATING
+    path_params = ("file_path",)
+
     async def execute(self, tool_context: ToolContext, params: DownloadFromUrlParams) -> ToolResult:
         """Perform the file download."""
         try:
@@ -162,29 +165,28 @@ class DownloadFromUrl(AbstractFileTool[DownloadFromUrlParams], WorkspaceGuardToo
         content_type = ""
         file_exists = file_path.exists()
 
-        async with aiohttp.ClientSession() as session:
-            # Allow redirects and track count
-            async with session.get(url, allow_redirects=True) as response:
-                # Validate response status
-                if response.status != 200:
-                    raise Exception(f"Download failed, HTTP status: {response.status}, reason: {response.reason}")
-
-                # Final URL after redirects
-                final_url = str(response.url)
-                # Count redirects
-                if hasattr(response, 'history'):
-                    redirect_count = len(response.history)
-
-                # Get content type
-                content_type = response.headers.get('Content-Type', 'unknown')
-
-                # Write content to file
-                async with aiofiles.open(file_path, 'wb') as f:
-                    file_size = 0
-                    # Stream in chunks to avoid memory pressure
-                    async for chunk in response.content.iter_chunked(8192):
-                        await f.write(chunk)
-                        file_size += len(chunk)
+        # Allow redirects and track count, keeping cookies set along the redirect chain
+        async with create_cookie_session() as session, session.get(url, allow_redirects=True) as response:
+            # Validate response status
+            if response.status != 200:
+                raise Exception(f"Download failed, HTTP status: {response.status}, reason: {response.reason}")
+
+            # Final URL after redirects
+            final_url = str(response.url)
+            # Count redirects
+            if hasattr(response, 'history'):
+                redirect_count = len(response.history)
+
+            # Get content type
+            content_type = response.headers.get('Content-Type', 'unknown')
+
+            # Write content to file
+            async with aiofiles.open(file_path, 'wb') as f:
+                file_size = 0
+                # Stream in chunks to avoid memory pressure
+                async for chunk in response.content.iter_chunked(8192):
+                    await f.write(chunk)
+                    file_size += len(chunk)
 
         logger.info(f"Download complete: {file_path}, size: {file_size} bytes")
 
@@ -7,8 +7,10 @@ from pydantic import Field
 from agentlang.context.tool_context import ToolContext
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
+from agentlang.utils.file import count_file_lines
 from agentlang.utils.schema import FileInfo
-from app.tools.core import BaseToolParams, tool
+from app.service.workspace_index_service import WorkspaceIndexService
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
@@ -29,6 +31,10 @@ class FileSearch(WorkspaceGuardTool[FileSearchParams]):
     Use this tool if you know part of a file path but don't know exactly where it is. Results will be limited to 10. Make your query more specific if you need to filter results further.
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    reads_workspace = True
+    eager_safe = True
+
     async def execute(self, tool_context: ToolContext, params: FileSearchParams) -> ToolResult:
         """Execute the tool and return results
 
@@ -48,31 +54,41 @@ class FileSearch(WorkspaceGuardTool[FileSearchParams]):
     def _run(self, query: str) -> str:
         """Run the tool and return search results"""
         try:
-            # Get all file paths
-            all_files = self._get_all_files(self.base_dir)
-
-            # Filter files using fuzzy matching
-            matches = self._fuzzy_match(all_files, query)
-
-            # Limit number of results
-            matches = matches[:10]
+            index = WorkspaceIndexService.get_instance()
+            if index.is_ready(self.base_dir):
+                # Served from the workspace index, no walk of the workspace
+                base_dir = self.base_dir.resolve()
+                matches = [
+                    (Path(entry.path), entry.size, entry.mtime)
+                    for entry in index.search_files(query, limit=10)
+                ]
+            else:
+                base_dir = self.base_dir
+                # Get all file paths
+                all_files = self._get_all_files(self.base_dir)
+
+                # Filter files using fuzzy matching
+                matches = []
+                # Limit number of results
+                for file_path in self._fuzzy_match(all_files, query)[:10]:
+                    stat = file_path.stat()
+                    matches.append((file_path, stat.st_size, stat.st_mtime))
 
             if not matches:
                 return "No matching files found"
 
             # Format output
             output = ["Found the following matching files:\n"]
-            for file_path in matches:
-                stat = file_path.stat()
-                rel_path = str(file_path.relative_to(self.base_dir))
+            for file_path, size, mtime in matches:
+                rel_path = str(file_path.relative_to(base_dir))
 
                 # Create FileInfo object
                 file_info = FileInfo(
                     name=file_path.name,
                     path=rel_path,
                     is_dir=False,
-                    size=stat.st_size,
-                    last_modified=stat.st_mtime,
+                    size=size,
+                    last_modified=mtime,
                     line_count=self._count_lines(file_path)
                     if file_path.suffix in [".py", ".js", ".ts", ".jsx", ".tsx", ".vue", ".md", ".txt"]
                     else None,
@@ -132,11 +148,7 @@ class FileSearch(WorkspaceGuardTool[FileSearchParams]):
 
     def _count_lines(self, file_path: Path) -> int:
         """Count lines in file"""
-        try:
-            with file_path.open("r", encoding="utf-8") as f:
-                return sum(1 for _ in f)
-        except:
-            return None
+        return count_file_lines(file_path)
 
     async def get_after_tool_call_friendly_action_and_remark(self, tool_name: str, tool_context: ToolContext, result: ToolResult, execution_time: float, arguments: Dict[str, Any] = None) -> Dict:
         """
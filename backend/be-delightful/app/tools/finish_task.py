@@ -4,7 +4,7 @@ from pydantic import Field
 
 from agentlang.context.tool_context import ToolContext
 from agentlang.tools.tool_result import ToolResult
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 
 
 class FinishTaskParams(BaseToolParams):
@@ -35,6 +35,8 @@ class FinishTask(BaseTool[FinishTaskParams]):
     Call this tool when all required work is complete and you are ready to give the final reply. After invoking it, the current conversation turn ends, so ensure every necessary action is done first.
     """
 
+    concurrency = ToolConcurrency.EXCLUSIVE
+
     async def execute(self, tool_context: ToolContext, params: FinishTaskParams) -> ToolResult:
         """Complete the current task and produce the final message."""
         # Format file list and append to message
@@ -26,7 +26,7 @@ from agentlang.tools.tool_result import ToolResult
 from app.core.context.agent_context import AgentContext
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
 from app.core.entity.tool.tool_result import ImageToolResult
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
@@ -58,6 +58,9 @@ class GenerateImage(WorkspaceGuardTool[GenerateImageParams]):
     AI image generation tool that generates images based on text descriptions
     """
 
+    concurrency = ToolConcurrency.PATH_MUTATING
+    path_params = ("output_path",)
+
     # Record the number of images generated per conversation
     _generation_counts = defaultdict(int)
 
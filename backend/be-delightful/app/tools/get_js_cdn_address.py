@@ -6,7 +6,7 @@ from pydantic import Field
 
 from agentlang.context.tool_context import ToolContext
 from agentlang.tools.tool_result import ToolResult
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 
 
 class GetJsCdnAddressParams(BaseToolParams):
@@ -23,6 +23,8 @@ class GetJsCdnAddress(BaseTool[GetJsCdnAddressParams]):
     Get the CDN address of the specified JavaScript library from CDNJS
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+
     async def execute(self, tool_context: ToolContext, params: GetJsCdnAddressParams) -> ToolResult:
         """Execute JS CDN tool
 
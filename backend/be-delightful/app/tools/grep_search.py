@@ -1,4 +1,5 @@
-import subprocess
+import asyncio
+import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -7,12 +8,22 @@ from pydantic import Field
 from agentlang.context.tool_context import ToolContext
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
+from agentlang.utils.file import count_file_lines
 from agentlang.utils.schema import FileInfo
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
 
+# Maximum matches returned per file (passed to rg --max-count)
+MAX_MATCHES_PER_FILE = 50
+# Maximum matches returned in total, the search is stopped once reached
+MAX_TOTAL_MATCHES = 200
+# Maximum bytes of matched line content returned in total, the search is stopped once reached
+MAX_RESULT_BYTES = 64 * 1024
+# Matched lines longer than this are cut, e.g. minified files
+MAX_LINE_LENGTH = 500
+
 
 class GrepSearchParams(BaseToolParams):
     """Search parameters"""
@@ -36,12 +47,16 @@ class GrepSearch(WorkspaceGuardTool[GrepSearchParams]):
     """
     Text-based regular expression search that finds exact pattern matches in files or directories, using ripgrep for efficient searching.
     Results are formatted in ripgrep style, configurable to include line numbers and content.
-    To avoid excessive output, results are limited to 50 matches.
+    To avoid excessive output, results are limited to 50 matches per file and 200 matches in total.
 
     Best suited for finding exact text matches or regular expression patterns.
     More precise than semantic search, for finding specific strings or patterns.
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    reads_workspace = True
+    eager_safe = True
+
     async def execute(self, tool_context: ToolContext, params: GrepSearchParams) -> ToolResult:
         """Execute the tool and return results
 
@@ -53,7 +68,7 @@ class GrepSearch(WorkspaceGuardTool[GrepSearchParams]):
             ToolResult: Contains search results or error information
         """
         # Call internal method to get results
-        result = self._run(
+        result = await self._run(
             query=params.query,
             case_sensitive=params.case_sensitive,
             include_pattern=params.include_pattern,
@@ -63,13 +78,13 @@ class GrepSearch(WorkspaceGuardTool[GrepSearchParams]):
         # Return ToolResult
         return ToolResult(content=result)
 
-    def _run(self, query: str, case_sensitive: Optional[bool] = None,
-             include_pattern: Optional[str] = None,
-             exclude_pattern: Optional[str] = None) -> str:
+    async def _run(self, query: str, case_sensitive: Optional[bool] = None,
+                   include_pattern: Optional[str] = None,
+                   exclude_pattern: Optional[str] = None) -> str:
         """Run the tool and return search results"""
         try:
             # Build ripgrep command
-            cmd = ["rg", "--line-number", "--max-count", "50", "--json"]
+            cmd = ["rg", "--line-number", "--max-count", str(MAX_MATCHES_PER_FILE), "--json"]
 
             # Add case sensitivity option
             if case_sensitive is not None:
@@ -85,57 +100,118 @@ class GrepSearch(WorkspaceGuardTool[GrepSearchParams]):
                 cmd.extend(["--glob", f"!{exclude_pattern}"])
 
             # Add search pattern and directory
-            cmd.extend([query, str(self.base_dir)])
-
-            # Execute command
-            process = subprocess.run(cmd, capture_output=True, text=True, cwd=str(self.base_dir))
-
-            # Process results
-            if process.returncode == 0 or process.returncode == 1:  # 1 means no matches
-                output = process.stdout.strip()
-                if not output:
-                    return "No matches found"
-
-                # Parse JSON output and group by file
-                matches = self._parse_ripgrep_output(output)
-                if not matches:
-                    return "No matches found"
-
-                # Format output
-                return self._format_matches(matches)
-            else:
-                error_msg = process.stderr.strip()
+            cmd.extend(["--regexp", query, str(self.base_dir)])
+
+            matches, truncated, error_msg = await self._search(cmd)
+            if error_msg is not None:
                 logger.error(f"ripgrep search failed: {error_msg}")
                 return f"Search execution failed: {error_msg}"
 
+            if not matches:
+                return "No matches found"
+
+            # Stat and line counts touch the file system, keep them off the event loop
+            result = await asyncio.to_thread(self._format_matches, matches)
+            if truncated:
+                result += (
+                    f"\n\n[Results truncated: search stopped after {MAX_TOTAL_MATCHES} matches or "
+                    f"{MAX_RESULT_BYTES // 1024}KB of matched content, narrow the query or include_pattern to see more]"
+                )
+            return result
+
         except FileNotFoundError:
             return "Error: ripgrep (rg) command not found. Please ensure ripgrep is installed."
         except Exception as e:
             logger.error(f"Error executing search: {e}", exc_info=True)
             return f"Error executing search: {e!s}"
 
-    def _parse_ripgrep_output(self, output: str) -> Dict[Path, List[Tuple[int, str]]]:
-        """Parse ripgrep's JSON output"""
-        import json
-
-        matches = {}
-        for line in output.splitlines():
-            try:
-                data = json.loads(line)
-                if data.get("type") == "match":
-                    path = Path(data["data"]["path"]["text"])
-                    line_number = data["data"]["line_number"]
-                    content = data["data"]["lines"]["text"].strip()
-
-                    if path not in matches:
-                        matches[path] = []
-                    matches[path].append((line_number, content))
-            except json.JSONDecodeError:
-                continue
-            except KeyError:
-                continue
-
-        return matches
+    async def _search(self, cmd: List[str]) -> Tuple[Dict[Path, List[Tuple[int, str]]], bool, Optional[str]]:
+        """
+        Run ripgrep and parse its JSON output while it is produced
+
+        The search is stopped as soon as the match or byte budget is reached; ripgrep is also killed
+        when the calling task is cancelled.
+
+        Args:
+            cmd: ripgrep command
+
+        Returns:
+            Tuple: (matches grouped by file, whether the budget stopped the search, error message or None)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.base_dir),
+            # Match lines of long minified files must fit in the reader buffer
+            limit=16 * 1024 * 1024,
+        )
+        matches: Dict[Path, List[Tuple[int, str]]] = {}
+        match_count = 0
+        result_bytes = 0
+        truncated = False
+        stderr_task = asyncio.create_task(process.stderr.read())
+        try:
+            while True:
+                try:
+                    line = await process.stdout.readline()
+                except ValueError:
+                    # A single line exceeded the reader limit, skip what is buffered
+                    logger.warning("Skipping oversized ripgrep output line")
+                    continue
+                if not line:
+                    break
+
+                match = self._parse_ripgrep_line(line)
+                if match is None:
+                    continue
+                path, line_number, content = match
+                matches.setdefault(path, []).append((line_number, content))
+                match_count += 1
+                result_bytes += len(content)
+                if match_count >= MAX_TOTAL_MATCHES or result_bytes >= MAX_RESULT_BYTES:
+                    truncated = True
+                    break
+
+            if truncated:
+                process.kill()
+            returncode = await process.wait()
+            stderr = (await stderr_task).decode(errors="replace").strip()
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            if not stderr_task.done():
+                stderr_task.cancel()
+
+        # 1 means no matches, a killed search is not an error
+        if truncated or returncode in (0, 1):
+            return matches, truncated, None
+        return matches, truncated, stderr
+
+    def _parse_ripgrep_line(self, line: bytes) -> Optional[Tuple[Path, int, str]]:
+        """
+        Parse one line of ripgrep's JSON output
+
+        Args:
+            line: JSON line
+
+        Returns:
+            Optional[Tuple[Path, int, str]]: (file path, line number, line content) for match messages, otherwise None
+        """
+        try:
+            data = json.loads(line)
+            if data.get("type") != "match":
+                return None
+            path = Path(data["data"]["path"]["text"])
+            line_number = data["data"]["line_number"]
+            content = data["data"]["lines"]["text"].strip()
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+        if len(content) > MAX_LINE_LENGTH:
+            content = content[:MAX_LINE_LENGTH] + "..."
+        return path, line_number, content
 
     def _format_matches(self, matches: Dict[Path, List[Tuple[int, str]]]) -> str:
         """Format match results"""
@@ -181,11 +257,7 @@ class GrepSearch(WorkspaceGuardTool[GrepSearchParams]):
 
     def _count_lines(self, file_path: Path) -> Optional[int]:
         """Count file lines"""
-        try:
-            with file_path.open("r", encoding="utf-8") as f:
-                return sum(1 for _ in f)
-        except:
-            return None
+        return count_file_lines(file_path)
 
     async def get_after_tool_call_friendly_action_and_remark(self, tool_name: str, tool_context: ToolContext, result: ToolResult, execution_time: float, arguments: Dict[str, Any] = None) -> Dict:
         """
@@ -11,7 +11,8 @@ from agentlang.context.tool_context import ToolContext
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
+from app.utils.http_client import get_http_session
 
 logger = get_logger(__name__)
 
@@ -56,6 +57,8 @@ class ImageSearch(BaseTool[ImageSearchParams]):
     Search for images on the internet based on keywords and return a list of results containing thumbnails, original image links, sources, and metadata.
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+
     def __init__(self, **data):
         super().__init__(**data)
         # Get API key and base endpoint from unified configuration
@@ -96,10 +99,10 @@ class ImageSearch(BaseTool[ImageSearchParams]):
         logger.info(f"Starting image search: query='{params.query}', count={params.count}, endpoint='{image_search_url}'")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_search_url, headers=headers, params=api_params) as response:
-                    response.raise_for_status()  # Raise exception for status codes >=400
-                    search_results = await response.json()
+            session = get_http_session()
+            async with session.get(image_search_url, headers=headers, params=api_params) as response:
+                response.raise_for_status()  # Raise exception for status codes >=400
+                search_results = await response.json()
 
             logger.info(f"Image search successful: query='{params.query}'")
 
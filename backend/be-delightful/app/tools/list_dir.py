@@ -8,7 +8,8 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.file import count_file_lines, count_file_tokens, format_file_size, is_text_file
 from agentlang.utils.schema import DirectoryInfo, FileInfo
-from app.tools.core import BaseToolParams, tool
+from app.service.workspace_index_service import IndexedEntry, WorkspaceIndexService
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
@@ -42,6 +43,10 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
     For text files, displays file size, line count, and token count to facilitate content volume assessment.
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    path_params = ("relative_workspace_path",)
+    eager_safe = True
+
     async def execute(self, tool_context: ToolContext, params: ListDirParams) -> ToolResult:
         """Execute tool and return result
 
@@ -85,6 +90,15 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
         if not target_path.is_dir():
             return f"Error: Path is not a directory: {target_path}"
 
+        # Use the workspace index when it covers this workspace, otherwise read the file system
+        index = WorkspaceIndexService.get_instance()
+        base_dir = self.base_dir
+        if index.is_ready(self.base_dir):
+            base_dir = self.base_dir.resolve()
+            target_path = target_path.resolve()
+        else:
+            index = None
+
         try:
             filter_mode = "Show text/code files only" if filter_binary else "Show all files"
             token_mode = "Calculate token count" if calculate_tokens else "Do not calculate token count"
@@ -103,7 +117,8 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
                 max_level=level,
                 filter_binary=filter_binary,
                 calculate_tokens=calculate_tokens,
-                base_dir=self.base_dir
+                base_dir=base_dir,
+                index=index,
             )
 
             if filter_binary and filtered_items > 0:
@@ -126,7 +141,8 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
         max_level: int = 1,
         filter_binary: bool = True,
         calculate_tokens: bool = True,
-        base_dir: Path = None
+        base_dir: Path = None,
+        index: Optional[WorkspaceIndexService] = None,
     ) -> Tuple[int, int]:
         """Recursively list directory contents (flat format) and return statistics (total items, filtered items)
 
@@ -139,6 +155,7 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
             filter_binary: Whether to filter binary files
             calculate_tokens: Whether to calculate token count for text files
             base_dir: Base directory path for calculating relative paths
+            index: Workspace index to read entries and cached counts from, None reads the file system
 
         Returns:
             Updated statistics tuple
@@ -150,10 +167,7 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
             return total_items, filtered_items
 
         try:
-            items = sorted(
-                list(current_path.iterdir()),
-                key=lambda x: (not x.is_dir(), x.name.lower())
-            )
+            items = self._get_children(current_path, index)
         except PermissionError:
             # Use new flat error format
             relative_path = str(current_path.relative_to(base_dir)) if base_dir and current_path.is_relative_to(base_dir) else str(current_path)
@@ -167,7 +181,7 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
 
         # If filtering binary files, filter first
         if filter_binary:
-            filtered_file_items = [item for item in items if item.is_dir() or self._is_text_file(item)]
+            filtered_file_items = [item for item in items if item.is_dir or item.is_text]
             filtered_items += len(items) - len(filtered_file_items)
             items = filtered_file_items
 
@@ -181,14 +195,15 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
             total_items += 1
             # Remove calculation and use of is_last, connector, new_prefix
 
-            relative_item_path = str(item.relative_to(base_dir))
+            item_path = Path(item.path)
+            relative_item_path = str(item_path.relative_to(base_dir))
 
-            if item.is_dir():
+            if item.is_dir:
                 # Count number of files in next level directory
                 try:
-                    sub_items = list(item.iterdir())
+                    sub_items = self._get_children(item_path, index)
                     if filter_binary:
-                        sub_items = [sub_item for sub_item in sub_items if sub_item.is_dir() or self._is_text_file(sub_item)]
+                        sub_items = [sub_item for sub_item in sub_items if sub_item.is_dir or sub_item.is_text]
                     item_count = f"{len(sub_items)} items"
                 except (PermissionError, Exception):
                     item_count = "? items"  # If subdirectory cannot be accessed, display as unknown
@@ -198,7 +213,7 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
                     path=relative_item_path, # Use calculated relative path
                     is_dir=True,
                     item_count=item_count,
-                    last_modified=item.stat().st_mtime,
+                    last_modified=item.mtime,
                 )
                 # Change output format to: path/: d item_count timestamp
                 output_lines.append(f"{info.path}/: d {info.item_count:>10} {info.format_time()}\n") # Use >10 for simple right alignment
@@ -207,32 +222,33 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
                 if current_level < max_level:
                     # Recursively process subdirectory, level+1, no longer pass prefix
                     total_items, filtered_items = self._list_directory_recursive(
-                        item, current_level + 1, output_lines, # Remove new_prefix
+                        item_path, current_level + 1, output_lines, # Remove new_prefix
                         (total_items, filtered_items),
-                        max_level, filter_binary, calculate_tokens, base_dir
+                        max_level, filter_binary, calculate_tokens, base_dir, index
                     )
             else: # Process files
                 try:
-                    stat_result = item.stat()
-                    file_size = stat_result.st_size
-
                     # For text files, calculate line count and token count
                     line_count = None
                     token_count = None
 
-                    if self._is_text_file(item):
-                        line_count = self._count_lines(item)
-                        # Only calculate when token calculation is needed
-                        if calculate_tokens:
-                            token_count = self._count_tokens(item)
+                    if item.is_text:
+                        if index:
+                            # Counted once per file version and cached in the index
+                            line_count, token_count = index.get_counts(item, calculate_tokens)
+                        else:
+                            line_count = self._count_lines(item_path)
+                            # Only calculate when token calculation is needed
+                            if calculate_tokens:
+                                token_count = self._count_tokens(item_path)
 
                     info = FileInfo(
                         name=item.name,
                         path=relative_item_path, # Use calculated relative path
                         is_dir=False,
-                        size=file_size,
+                        size=item.size,
                         line_count=line_count,
-                        last_modified=stat_result.st_mtime,
+                        last_modified=item.mtime,
                     )
 
                     size_str = self._format_size(info.size)
@@ -253,6 +269,42 @@ class ListDir(WorkspaceGuardTool[ListDirParams]):
 
         return total_items, filtered_items
 
+    def _get_children(self, directory: Path, index: Optional[WorkspaceIndexService]) -> List[IndexedEntry]:
+        """
+        Get the direct children of a directory, directories first, then by name
+
+        Args:
+            directory: Directory to list
+            index: Workspace index, None reads the file system
+
+        Returns:
+            List[IndexedEntry]: Children of the directory
+        """
+        if index:
+            children = index.list_directory(directory)
+            if children is not None:
+                return children
+
+        children = []
+        for item in directory.iterdir():
+            try:
+                stat_result = item.stat()
+            except OSError:
+                # Broken symlink, list the link itself
+                stat_result = item.lstat()
+            is_dir = item.is_dir()
+            children.append(IndexedEntry(
+                path=str(item),
+                name=item.name,
+                is_dir=is_dir,
+                size=stat_result.st_size,
+                mtime=stat_result.st_mtime,
+                mtime_ns=stat_result.st_mtime_ns,
+                is_text=not is_dir and self._is_text_file(item),
+            ))
+        children.sort(key=lambda x: (not x.is_dir, x.name.lower()))
+        return children
+
     def _count_lines(self, file_path: Path) -> Optional[int]:
         """Calculate file line count"""
         return count_file_lines(file_path)
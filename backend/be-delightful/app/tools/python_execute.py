@@ -1,6 +1,7 @@
 import asyncio
 import json
 import os
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 from pydantic import Field
@@ -9,8 +10,10 @@ from agentlang.context.tool_context import ToolContext
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
+from app.utils.output_capture import OutputCollector
+from app.utils.python_kernel import PythonKernel
 
 logger = get_logger(__name__)
 
@@ -42,6 +45,11 @@ class PythonExecuteParams(BaseToolParams):
         None,
         description="Command line arguments to pass to Python script (optional)"
     )
+    persistent: bool = Field(
+        False,
+        description="Run in the persistent Python kernel that keeps variables, imports and loaded data between calls, "
+                    "suited to multi-step data analysis; by default code runs in a new isolated interpreter process"
+    )
 
 
 @tool()
@@ -58,11 +66,15 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
     Notes:
     - code and file_path parameters are mutually exclusive, cannot be provided simultaneously
     - Code will be executed in a new Python interpreter process
+    - With persistent=True code runs in a long-lived kernel that keeps its globals between calls,
+      the kernel is restarted after a timeout, a crash or exceeding its memory limit
     - Supports setting working directory
     - Can set timeout duration
     - Can pass command line arguments to scripts
     """
 
+    concurrency = ToolConcurrency.EXCLUSIVE
+
     async def execute(
         self,
         tool_context: ToolContext,
@@ -101,7 +113,7 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
                     error=f"Working directory error: directory does not exist - {work_dir}"
                 )
 
-            # Prepare execution command based on parameter type
+            file_path = None
             if params.file_path:
                 # Validate file path safety
                 file_path, error = self.get_safe_path(params.file_path)
@@ -114,6 +126,11 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
                         error=f"File error: Python file does not exist - {file_path}"
                     )
 
+            if params.persistent:
+                return await self._execute_in_kernel(tool_context, params, work_dir, file_path)
+
+            # Prepare execution command based on parameter type
+            if file_path:
                 # Build command: python file_path [args]
                 cmd_args = ["python", str(file_path)]
                 if params.args:
@@ -142,15 +159,12 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
                         error=f"Temporary file error: Unable to create temporary Python file - {e}"
                     )
 
+            # Read output incrementally, forwarding it to the client and keeping head and tail within the budget
+            output = self.create_output_collector(tool_context, params.file_path or "code snippet")
+
             # Create process
             try:
-                env_vars = {
-                    **os.environ,
-                    'PYTHONIOENCODING': 'utf-8',
-                    'MPLCONFIGDIR': '/root/.config/matplotlib',
-                    'LC_ALL': 'C.UTF-8',
-                    'LANG': 'C.UTF-8'
-                }
+                env_vars = self._get_env_vars()
 
                 process = await asyncio.create_subprocess_exec(
                     *cmd_args,
@@ -160,73 +174,9 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
                     env=env_vars,
                 )
 
-                # Wait for process to complete with timeout
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=params.timeout
-                )
-                stdout_str = stdout.decode(errors='replace').strip() if stdout else ""
-                stderr_str = stderr.decode(errors='replace').strip() if stderr else ""
-                exit_code = process.returncode
-
-                # Build result message to make it more structured and human-readable
-                execution_type = "File execution" if params.file_path else "Code execution"
-                execution_target = params.file_path if params.file_path else "code snippet"
-
-                # Build more friendly and structured result message
-                if exit_code == 0:
-                    status = "Success"
-                    result_sections = []
-
-                    # Add basic information and output content
-                    header = f"{execution_type}: {execution_target}"
-                    if params.args:
-                        header += f" (arguments: {params.args})"
-
-                    result_sections.append(header)
-                    result_sections.append(f"Status: {status}")
-
-                    # Add output content (if any)
-                    if stdout_str:
-                        result_sections.append(f"Output:\n{stdout_str}")
-                    else:
-                        result_sections.append("Output: (none)")
-
-                    result_message = "\n".join(result_sections)
-                else:
-                    status = f"Failed (exit code: {exit_code})"
-                    result_sections = []
-
-                    # Add basic information
-                    header = f"{execution_type}: {execution_target}"
-                    if params.args:
-                        header += f" (arguments: {params.args})"
-
-                    result_sections.append(header)
-                    result_sections.append(f"Status: {status}")
-
-                    # Add output and error messages
-                    if stdout_str:
-                        result_sections.append(f"Standard output:\n{stdout_str}")
-
-                    if stderr_str:
-                        result_sections.append(f"Error message:\n{stderr_str}")
-
-                    result_message = "\n".join(result_sections)
-
-                # Build detailed information JSON and save to system field (for internal system use, not directly displayed to users)
-                execution_info = {
-                    "command": " ".join(cmd_args),
-                    "execution_type": "file" if params.file_path else "code",
-                    "target": params.file_path if params.file_path else "code_snippet",
-                    "cwd": str(work_dir),
-                    "args": params.args,
-                    "stdout": stdout_str,
-                    "stderr": stderr_str,
-                    "exit_code": exit_code,
-                    "success": exit_code == 0
-                }
-
-                system_info = json.dumps(execution_info, ensure_ascii=False)
+                exit_code = await output.read_process(process, timeout=params.timeout)
+                stdout_str = output.stdout.strip()
+                stderr_str = output.stderr.strip()
 
                 if params.code and temp_file.exists():
                     try:
@@ -235,16 +185,7 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
                     except Exception as e:
                         logger.warning(f"Failed to delete temporary file: {e}")
 
-                if exit_code == 0:
-                    result = ToolResult(
-                        content=result_message,
-                        system=system_info,
-                    )
-                else:
-                    result = ToolResult(
-                        error=result_message,
-                    )
-                return result
+                return self._build_result(params, " ".join(cmd_args), work_dir, stdout_str, stderr_str, exit_code)
 
             except asyncio.TimeoutError:
                 # Timeout, force terminate process
@@ -262,18 +203,9 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
                     except Exception as e:
                         logger.warning(f"Failed to delete temporary file: {e}")
 
-                execution_type = "File execution" if params.file_path else "Code execution"
-                execution_target = params.file_path if params.file_path else "code snippet"
-
-                timeout_message = (
-                    f"{execution_type}: {execution_target}\n"
-                    f"Status: Execution timeout ({params.timeout} seconds)\n"
-                    f"Reason: Code execution time exceeded the set time limit"
-                )
-
-                return ToolResult(
-                    error=timeout_message
-                )
+                return self._build_timeout_result(params, output)
+            finally:
+                output.close()
 
         except Exception as e:
             logger.exception(f"Error executing Python code: {e}")
@@ -286,6 +218,208 @@ class PythonExecute(WorkspaceGuardTool[PythonExecuteParams]):
                 error=error_message
             )
 
+    async def _execute_in_kernel(
+        self,
+        tool_context: ToolContext,
+        params: PythonExecuteParams,
+        work_dir: Path,
+        file_path: Optional[Path],
+    ) -> ToolResult:
+        """
+        Execute code or a script file in the persistent Python kernel
+
+        Args:
+            tool_context: Tool context
+            params: Execution parameters
+            work_dir: Validated working directory
+            file_path: Validated script path, None when executing a code string
+
+        Returns:
+            ToolResult: Execution result, formatted like a fresh-process execution
+        """
+        if file_path:
+            with open(file_path, "r", encoding="utf-8") as f:
+                code = f.read()
+            logger.debug(f"Executing Python file in persistent kernel: {file_path}, working directory: {work_dir}")
+        else:
+            code = params.code
+            logger.debug(f"Executing Python code string in persistent kernel, working directory: {work_dir}")
+
+        output = self.create_output_collector(tool_context, params.file_path or "code snippet")
+        try:
+            kernel_result = await PythonKernel.get_instance().execute(
+                code,
+                cwd=work_dir,
+                timeout=params.timeout,
+                env=self._get_env_vars(),
+                output=output,
+                file_path=file_path,
+                args=params.args.split() if params.args else None,
+            )
+        finally:
+            output.close()
+
+        if kernel_result.timed_out:
+            return self._build_timeout_result(params, output, kernel_note="The persistent kernel was restarted, its variables were lost")
+
+        kernel_note = None
+        if kernel_result.crashed:
+            kernel_note = "The persistent kernel exited (possibly by exceeding its memory limit) and will be restarted on the next call, its variables were lost"
+        elif kernel_result.fresh_kernel:
+            kernel_note = "Started a new persistent kernel, variables from earlier calls are not available"
+
+        command = f"python kernel {file_path or 'code_snippet'}"
+        if params.args:
+            command += f" {params.args}"
+        return self._build_result(
+            params,
+            command,
+            work_dir,
+            output.stdout.strip(),
+            output.stderr.strip(),
+            kernel_result.exit_code,
+            kernel_note=kernel_note,
+        )
+
+    @staticmethod
+    def _get_env_vars() -> Dict[str, str]:
+        """Get the environment for Python interpreter processes"""
+        return {
+            **os.environ,
+            'PYTHONIOENCODING': 'utf-8',
+            'MPLCONFIGDIR': '/root/.config/matplotlib',
+            'LC_ALL': 'C.UTF-8',
+            'LANG': 'C.UTF-8'
+        }
+
+    def _build_result(
+        self,
+        params: PythonExecuteParams,
+        command: str,
+        work_dir: Path,
+        stdout_str: str,
+        stderr_str: str,
+        exit_code: int,
+        kernel_note: Optional[str] = None,
+    ) -> ToolResult:
+        """
+        Build the tool result of a finished execution
+
+        Args:
+            params: Execution parameters
+            command: Executed command, recorded in the system information
+            work_dir: Working directory
+            stdout_str: Standard output
+            stderr_str: Standard error
+            exit_code: Exit code
+            kernel_note: Persistent kernel status note (optional)
+
+        Returns:
+            ToolResult: Result with content and system information on success, error otherwise
+        """
+        # Build result message to make it more structured and human-readable
+        execution_type = "File execution" if params.file_path else "Code execution"
+        execution_target = params.file_path if params.file_path else "code snippet"
+
+        # Build more friendly and structured result message
+        if exit_code == 0:
+            status = "Success"
+            result_sections = []
+
+            # Add basic information and output content
+            header = f"{execution_type}: {execution_target}"
+            if params.args:
+                header += f" (arguments: {params.args})"
+
+            result_sections.append(header)
+            result_sections.append(f"Status: {status}")
+            if kernel_note:
+                result_sections.append(f"Kernel: {kernel_note}")
+
+            # Add output content (if any)
+            if stdout_str:
+                result_sections.append(f"Output:\n{stdout_str}")
+            else:
+                result_sections.append("Output: (none)")
+
+            result_message = "\n".join(result_sections)
+        else:
+            status = f"Failed (exit code: {exit_code})"
+            result_sections = []
+
+            # Add basic information
+            header = f"{execution_type}: {execution_target}"
+            if params.args:
+                header += f" (arguments: {params.args})"
+
+            result_sections.append(header)
+            result_sections.append(f"Status: {status}")
+            if kernel_note:
+                result_sections.append(f"Kernel: {kernel_note}")
+
+            # Add output and error messages
+            if stdout_str:
+                result_sections.append(f"Standard output:\n{stdout_str}")
+
+            if stderr_str:
+                result_sections.append(f"Error message:\n{stderr_str}")
+
+            result_message = "\n".join(result_sections)
+
+        # Build detailed information JSON and save to system field (for internal system use, not directly displayed to users)
+        execution_info = {
+            "command": command,
+            "execution_type": "file" if params.file_path else "code",
+            "target": params.file_path if params.file_path else "code_snippet",
+            "cwd": str(work_dir),
+            "args": params.args,
+            "persistent": params.persistent,
+            "stdout": stdout_str,
+            "stderr": stderr_str,
+            "exit_code": exit_code,
+            "success": exit_code == 0
+        }
+
+        system_info = json.dumps(execution_info, ensure_ascii=False)
+
+        if exit_code == 0:
+            return ToolResult(
+                content=result_message,
+                system=system_info,
+            )
+        return ToolResult(
+            error=result_message,
+        )
+
+    def _build_timeout_result(
+        self,
+        params: PythonExecuteParams,
+        output: OutputCollector,
+        kernel_note: Optional[str] = None,
+    ) -> ToolResult:
+        """Build the tool result of an execution that exceeded its timeout, including output produced before it"""
+        execution_type = "File execution" if params.file_path else "Code execution"
+        execution_target = params.file_path if params.file_path else "code snippet"
+
+        timeout_message = (
+            f"{execution_type}: {execution_target}\n"
+            f"Status: Execution timeout ({params.timeout} seconds)\n"
+            f"Reason: Code execution time exceeded the set time limit"
+        )
+        if kernel_note:
+            timeout_message += f"\nKernel: {kernel_note}"
+
+        partial_stdout = output.stdout.strip()
+        partial_stderr = output.stderr.strip()
+        if partial_stdout:
+            timeout_message += f"\nStandard output before timeout:\n{partial_stdout}"
+        if partial_stderr:
+            timeout_message += f"\nError message before timeout:\n{partial_stderr}"
+
+        return ToolResult(
+            error=timeout_message
+        )
+
     async def get_tool_detail(self, tool_context: ToolContext, result: ToolResult, arguments: Dict[str, Any] = None) -> Optional[ToolDetail]:
         """
         Get corresponding ToolDetail based on tool execution result
@@ -1,25 +1,25 @@
+import asyncio
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import aiofiles
 import aiofiles.os  # Keep this for os.path.exists etc.
-from markitdown import MarkItDown, StreamInfo
 from pydantic import Field
 
 from agentlang.context.tool_context import ToolContext
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
+from agentlang.utils.line_index import get_line_index
 from agentlang.utils.token_estimator import num_tokens_from_string
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
-from app.tools.markitdown_plugins.csv_plugin import CSVConverter
-
-# Keep Excel and CSV converters if needed for other types
-from app.tools.markitdown_plugins.excel_plugin import ExcelConverter
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
+# Excel and CSV converters are registered in the conversion worker processes
+from app.utils.document_conversion_utils import convert_document_cached, is_row_paged
+
 # Import the new local PDF converter utility
 from app.utils.pdf_converter_utils import convert_pdf_locally
 
@@ -61,15 +61,14 @@ class ReadFile(AbstractFileTool[ReadFileParams], WorkspaceGuardTool[ReadFilePara
     - To avoid overly long content, if a single read exceeds 30,000 tokens, content will be automatically truncated; if you need to read the complete content, you can read multiple times
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    path_params = ("file_path",)
+    eager_safe = True
+
     # Maximum row limit for Excel processing
     EXCEL_MAX_ROWS = 1000
     EXCEL_MAX_PREVIEW_ROWS = 50
 
-    md = MarkItDown()
-    # Remove PDFConverter registration here, it's handled in the util
-    md.register_converter(ExcelConverter())
-    md.register_converter(CSVConverter())
-
     async def execute(self, tool_context: ToolContext, params: ReadFileParams) -> ToolResult:
         """
         Execute file reading operation
@@ -170,19 +169,21 @@ class ReadFile(AbstractFileTool[ReadFileParams], WorkspaceGuardTool[ReadFilePara
             if use_markitdown:
                  logger.info(f"File {read_path} (original: {original_file_name}) using markitdown for reading")
                  try:
-                     # MarkItDown requires binary reading
-                     async with aiofiles.open(read_path, "rb") as f:
-                         # Pass original offset and limit to MarkItDown (except during PDF cache creation phase)
-                         # Note: offset and limit passed here are from user's original request
-                         result = self.md.convert(f, stream_info=StreamInfo(extension=read_extension), offset=params.offset, limit=params.limit)
-                         if not result or not result.markdown:
-                             logger.warning(f"MarkItDown conversion returned empty content: {read_path}")
-                             content = "[File conversion result is empty]"
-                         else:
-                             content = result.markdown
+                     # Converted off the event loop and cached by content hash outside the workspace
+                     converted_path = await convert_document_cached(read_path, read_extension, params.offset, params.limit)
                  except Exception as e:
                      logger.exception(f"Failed to read file using MarkItDown ({read_path}): {e!s}")
                      return ToolResult(error=f"File conversion failed: {e!s}")
+
+                 if (await aiofiles.os.stat(converted_path)).st_size == 0:
+                     logger.warning(f"MarkItDown conversion returned empty content: {read_path}")
+                     content = "[File conversion result is empty]"
+                 elif is_row_paged(read_extension) or params.limit is None or params.limit <= 0:
+                     # Row-paged converters already applied offset/limit
+                     content = await self._read_text_file(converted_path)
+                 else:
+                     # Page through the cached Markdown like a text file
+                     content = await self._read_text_file_with_range(converted_path, params.offset, params.limit)
             else:
                  # Use text reading logic (including reading .md cache)
                  logger.info(f"File {read_path} (original: {original_file_name}) using text reading logic")
@@ -236,6 +237,8 @@ class ReadFile(AbstractFileTool[ReadFileParams], WorkspaceGuardTool[ReadFilePara
             raw_content = content # Store original content without meta_info
             extra_info = {
                 "raw_content": raw_content,
+                # Token count of the returned content including meta info, so callers need not count again
+                "tokens": content_tokens + num_tokens_from_string(meta_info),
                 "original_file_path": str(file_path),
                 "read_path": str(read_path),
                 "cache_just_created": cache_just_created # Also include cache creation status
@@ -315,23 +318,10 @@ class ReadFile(AbstractFileTool[ReadFileParams], WorkspaceGuardTool[ReadFilePara
         Returns:
             String containing line number info and content within range, return prompt if range invalid
         """
-        # Count total lines and read specified range content
-        all_lines = []
-        target_lines = []
-
-        async with aiofiles.open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            line_idx = 0
-            async for line in f:
-                all_lines.append(line)
-                # Apply offset and limit based on line index
-                if limit > 0: # If limit is positive, read limit lines starting from offset
-                    if offset <= line_idx < offset + limit:
-                        target_lines.append(line)
-                elif offset <= line_idx: # If limit is non-positive (<=0 or None), read from offset to end
-                    target_lines.append(line)
-                line_idx += 1
-
-        total_lines = len(all_lines)
+        # Seek through the cached line offset index instead of iterating the whole file
+        line_index = await asyncio.to_thread(get_line_index, file_path)
+        target_lines = await asyncio.to_thread(line_index.read_lines, offset, limit)
+        total_lines = line_index.total_lines
         start_line = offset + 1  # Convert to 1-indexed for user understanding
 
         # Build result header information
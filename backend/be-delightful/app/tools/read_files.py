@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -7,7 +8,7 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.token_estimator import num_tokens_from_string
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.read_file import ReadFile, ReadFileParams
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
@@ -15,6 +16,10 @@ logger = get_logger(__name__)
 
 # Set maximum token limit
 MAX_TOTAL_TOKENS = 30000
+# Maximum number of files read concurrently
+MAX_CONCURRENT_READS = 8
+# Minimum content kept for the file that crosses the token budget
+MIN_TRUNCATED_FILE_TOKENS = 300
 
 class ReadFilesParams(BaseToolParams):
     """Batch file reading parameters"""
@@ -53,9 +58,13 @@ class ReadFiles(WorkspaceGuardTool[ReadFilesParams]):
     - Binary files may not be read correctly
     - Oversized files will be rejected for reading, you must read parts of the content in segments to understand the file overview
     - For Excel and CSV files, it is recommended to use code to process data rather than using text content directly
-    - To avoid long content, the total token count exceeding 30000 will be automatically truncated
+    - To avoid long content, the total token count exceeding 30000 will be automatically truncated; files after the limit is reached are not read
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    path_params = ("files",)
+    eager_safe = True
+
     async def execute(self, tool_context: ToolContext, params: ReadFilesParams) -> ToolResult:
         """
         Execute batch file reading operation
@@ -70,139 +79,172 @@ class ReadFiles(WorkspaceGuardTool[ReadFilesParams]):
         if not params.files:
             return ToolResult(error="No files specified to read")
 
-        results = []
         read_file_tool = ReadFile()
-        read_failure_count = 0
-        has_truncation = False
-
-        # Process each file in batch and collect results
-        for filepath in params.files:
-            try:
-                # Construct single file reading parameters
-                file_params = ReadFileParams(
-                    file_path=filepath,
-                    offset=params.offset,
-                    limit=params.limit,
-                    explanation=params.explanation if hasattr(params, 'explanation') else ""
-                )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
 
-                # Call ReadFile tool to read single file
-                result = await read_file_tool.execute(tool_context, file_params)
+        async def read_one(filepath: str) -> FileReadingResult:
+            async with semaphore:
+                return await self._read_single_file(read_file_tool, tool_context, params, filepath)
 
-                if result.ok:
-                    # Directly use complete content returned by ReadFile (including metadata)
-                    content = result.content
-                    tokens = num_tokens_from_string(content)
-
-                    # Create file reading result object
-                    file_result = FileReadingResult(
-                        file_path=filepath,
-                        content=content,
-                        is_success=True,
-                        tokens=tokens
-                    )
-
-                    results.append(file_result)
-                else:
-                    results.append(FileReadingResult(
-                        file_path=filepath,
-                        content="",
-                        is_success=False,
-                        error_message=result.content,  # When failed, content is actually error message
-                        tokens=0
-                    ))
-                    read_failure_count += 1
-            except Exception as e:
-                logger.exception(f"Failed to read file: {e!s}")
-                results.append(FileReadingResult(
-                    file_path=filepath,
-                    content="",
-                    is_success=False,
-                    error_message=f"File reading exception: {e!s}",
-                    tokens=0
-                ))
-                read_failure_count += 1
-
-        # Check if content needs to be truncated to comply with token limit
-        total_content_tokens = sum(result.tokens for result in results if result.is_success)
+        # Start all reads with bounded parallelism, then consume results in request order
+        tasks = [asyncio.create_task(read_one(filepath)) for filepath in params.files]
 
         # Reserve tokens for summary
         header_tokens = 500  # Tokens reserved for header
         available_tokens = MAX_TOTAL_TOKENS - header_tokens
 
-        # If content tokens exceed limit, perform truncation
-        if total_content_tokens > available_tokens:
-            has_truncation = True
-            logger.info(f"Total content tokens ({total_content_tokens}) exceed limit ({available_tokens}), performing truncation")
-            results = self._truncate_contents(results, available_tokens)
+        results: List[FileReadingResult] = []
+        used_tokens = 0
+        read_failure_count = 0
+        skipped_count = 0
+        has_truncation = False
+
+        try:
+            for idx, task in enumerate(tasks):
+                if used_tokens >= available_tokens:
+                    # Budget spent: stop reading, remaining files are reported as skipped
+                    for pending, filepath in zip(tasks[idx:], params.files[idx:]):
+                        pending.cancel()
+                        results.append(FileReadingResult(
+                            file_path=filepath,
+                            content="",
+                            is_success=False,
+                            error_message=f"Not read: token budget of {MAX_TOTAL_TOKENS} exhausted by previous files, read it separately",
+                            tokens=0
+                        ))
+                        skipped_count += 1
+                    has_truncation = True
+                    logger.info(f"Token budget ({available_tokens}) exhausted, skipped {skipped_count} files")
+                    break
+
+                result = await task
+                if not result.is_success:
+                    read_failure_count += 1
+                elif used_tokens + result.tokens > available_tokens:
+                    has_truncation = True
+                    remaining = max(MIN_TRUNCATED_FILE_TOKENS, available_tokens - used_tokens)
+                    logger.info(f"File {result.file_path} ({result.tokens} tokens) exceeds remaining budget ({remaining}), truncating")
+                    self._truncate_content(result, remaining)
+                used_tokens += result.tokens
+                results.append(result)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
         # Generate summary information
         total_files = len(params.files)
-        success_count = total_files - read_failure_count
+        success_count = total_files - read_failure_count - skipped_count
+        skipped_info = f", Skipped: {skipped_count}" if skipped_count else ""
         truncation_info = ", content truncated" if has_truncation else ""
-        summary = f"Total {total_files} files read, Success: {success_count}, Failed: {read_failure_count}{truncation_info}"
+        summary = f"Total {total_files} files read, Success: {success_count}, Failed: {read_failure_count}{skipped_info}{truncation_info}"
 
         # Format final result
         formatted_result = self._format_results(results, summary, has_truncation)
 
-        # Record actual token count
-        actual_tokens = num_tokens_from_string(formatted_result)
-        logger.info(f"Final output tokens: {actual_tokens}")
+        # Estimate output tokens from per-file counts instead of re-tokenizing the whole output
+        logger.info(f"Final output tokens (estimated): {used_tokens + num_tokens_from_string(summary)}")
 
         return ToolResult(
             content=formatted_result,
             system=summary
         )
 
-    def _truncate_contents(self, results: List[FileReadingResult], available_tokens: int) -> List[FileReadingResult]:
+    async def _read_single_file(
+        self, read_file_tool: ReadFile, tool_context: ToolContext, params: ReadFilesParams, filepath: str
+    ) -> FileReadingResult:
         """
-        Truncate content proportionally to comply with token limit
+        Read one file through ReadFile
 
         Args:
-            results: List of file reading results
-            available_tokens: Number of available tokens
+            read_file_tool: Shared ReadFile instance
+            tool_context: Tool context
+            params: Batch file reading parameters
+            filepath: File path to read
 
         Returns:
-            List of truncated results
+            FileReadingResult: Reading result with token count
         """
-        successful_files = [r for r in results if r.is_success]
-
-        if not successful_files:
-            return results
+        try:
+            # Construct single file reading parameters
+            file_params = ReadFileParams(
+                file_path=filepath,
+                offset=params.offset,
+                limit=params.limit,
+                explanation=params.explanation if hasattr(params, 'explanation') else ""
+            )
 
-        # Calculate total tokens to be truncated
-        total_tokens = sum(r.tokens for r in successful_files)
-        ratio = available_tokens / total_tokens
+            # Call ReadFile tool to read single file
+            result = await read_file_tool.execute(tool_context, file_params)
 
-        # Allocate tokens proportionally
-        for result in successful_files:
-            allocated_tokens = max(300, int(result.tokens * ratio))  # Ensure each file has at least some content
-            if result.tokens > allocated_tokens:
-                # Try to keep only the beginning of the file (including metadata and partial content)
+            if result.ok:
+                # Directly use complete content returned by ReadFile (including metadata)
                 content = result.content
+                # Reuse the token count ReadFile already computed
+                tokens = (result.extra_info or {}).get("tokens")
+                if tokens is None:
+                    tokens = num_tokens_from_string(content)
 
-                # Find suitable truncation point through binary search
-                left, right = 0, len(content)
-                best_content = ""
-                best_tokens = 0
+                return FileReadingResult(
+                    file_path=filepath,
+                    content=content,
+                    is_success=True,
+                    tokens=tokens
+                )
 
-                while left <= right:
-                    mid = (left + right) // 2
-                    truncated = content[:mid]
-                    tokens = num_tokens_from_string(truncated)
+            return FileReadingResult(
+                file_path=filepath,
+                content="",
+                is_success=False,
+                error_message=result.content,  # When failed, content is actually error message
+                tokens=0
+            )
+        except Exception as e:
+            logger.exception(f"Failed to read file: {e!s}")
+            return FileReadingResult(
+                file_path=filepath,
+                content="",
+                is_success=False,
+                error_message=f"File reading exception: {e!s}",
+                tokens=0
+            )
 
-                    if tokens <= allocated_tokens:
-                        best_content = truncated
-                        best_tokens = tokens
-                        left = mid + 1
-                    else:
-                        right = mid - 1
+    def _truncate_content(self, result: FileReadingResult, allocated_tokens: int) -> None:
+        """
+        Truncate a file's content in place to fit the allocated tokens
 
-                # Update result
-                result.content = best_content + "\n\n[Content truncated...]"
-                result.tokens = best_tokens + 10  # Add some tokens for truncation notice
+        Args:
+            result: File reading result to truncate
+            allocated_tokens: Number of tokens the content may use
+        """
+        if result.tokens <= allocated_tokens:
+            return
+
+        # Try to keep only the beginning of the file (including metadata and partial content)
+        content = result.content
+
+        # Start the search near the expected cut point, estimated from the average characters per token
+        right = min(len(content), int(len(content) * allocated_tokens / result.tokens * 1.2) + 1)
+        left = 0
+        best_content = ""
+        best_tokens = 0
+
+        # Find suitable truncation point through binary search
+        while left <= right:
+            mid = (left + right) // 2
+            truncated = content[:mid]
+            tokens = num_tokens_from_string(truncated)
+
+            if tokens <= allocated_tokens:
+                best_content = truncated
+                best_tokens = tokens
+                left = mid + 1
+            else:
+                right = mid - 1
 
-        return results
+        # Update result
+        result.content = best_content + "\n\n[Content truncated...]"
+        result.tokens = best_tokens + 10  # Add some tokens for truncation notice
 
     def _format_results(self, results: List[FileReadingResult], summary: str, has_truncation: bool) -> str:
         """
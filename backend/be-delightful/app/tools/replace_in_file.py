@@ -13,7 +13,7 @@ from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.syntax_checker import SyntaxChecker
 from app.core.entity.message.server_message import FileContent, ToolDetail
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
@@ -51,6 +51,9 @@ class ReplaceResult(NamedTuple):
 
 @tool()
 class ReplaceInFile(AbstractFileTool[ReplaceInFileParams], WorkspaceGuardTool[ReplaceInFileParams]):
+    concurrency = ToolConcurrency.PATH_MUTATING
+    path_params = ("file_path",)
+
     # Diff view configuration
     DEFAULT_DIFF_CONTEXT_LINES = 5  # Number of context lines to show in diffs
     DEFAULT_DIFF_OMIT_THRESHOLD = 10  # If a hunk exceeds this length, omit the middle
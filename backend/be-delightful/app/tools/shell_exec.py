@@ -11,7 +11,7 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from app.core.entity.message.server_message import DisplayType, TerminalContent, ToolDetail
 from app.core.entity.tool.tool_result import TerminalToolResult
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
 
 logger = get_logger(__name__)
@@ -54,6 +54,8 @@ class ShellExec(WorkspaceGuardTool[ShellExecParams]):
     - Try to execute only one command at a time, avoid executing composite commands
     """
 
+    concurrency = ToolConcurrency.EXCLUSIVE
+
     # Command whitelist configuration
     SAFE_COMMANDS: Dict[str, Set[str]] = {
         # File and directory operations
@@ -393,14 +395,12 @@ class ShellExec(WorkspaceGuardTool[ShellExecParams]):
                 env=env_vars,
             )
 
+            # Read output incrementally, forwarding it to the client and keeping head and tail within the budget
+            output = self.create_output_collector(tool_context, cleaned_command)
             try:
-                # Wait for process to complete with timeout
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=params.timeout
-                )
-                stdout_str = stdout.decode().strip() if stdout else ""
-                stderr_str = stderr.decode().strip() if stderr else ""
-                exit_code = process.returncode
+                exit_code = await output.read_process(process, timeout=params.timeout)
+                stdout_str = output.stdout.strip()
+                stderr_str = output.stderr.strip()
 
                 # Set exit code
                 result.set_exit_code(exit_code)
@@ -446,11 +446,22 @@ class ShellExec(WorkspaceGuardTool[ShellExecParams]):
                     except:
                         pass
 
+                error_message = f"Command execution timeout ({params.timeout} seconds): {cleaned_command}"
+                # Output produced before the timeout often shows where the command got stuck
+                partial_stdout = output.stdout.strip()
+                partial_stderr = output.stderr.strip()
+                if partial_stdout:
+                    error_message += f"\nstdout before timeout:\n{partial_stdout}"
+                if partial_stderr:
+                    error_message += f"\nstderr before timeout:\n{partial_stderr}"
+
                 return TerminalToolResult(
-                    error=f"Command execution timeout ({params.timeout} seconds): {cleaned_command}",
+                    error=error_message,
                     command=cleaned_command,
                     exit_code=-1  # Use -1 to indicate timeout
                 )
+            finally:
+                output.close()
 
         except Exception as e:
             logger.exception(f"Error executing command: {e}")
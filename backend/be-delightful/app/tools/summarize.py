@@ -9,7 +9,7 @@ from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from agentlang.utils.token_estimator import truncate_text_by_token
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 from app.tools.read_file import ReadFile, ReadFileParams
 
 logger = get_logger(__name__)
@@ -54,6 +54,9 @@ class Summarize(BaseTool[SummarizeParams]):
     ```
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    path_params = ("file_path",)
+
     async def execute(
         self,
         tool_context: ToolContext,
@@ -11,7 +11,7 @@ from pydantic import Field
 
 from agentlang.context.tool_context import ToolContext
 from agentlang.tools.tool_result import ToolResult
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 
 
 class ThinkingParams(BaseToolParams):
@@ -55,6 +55,8 @@ Applicable scenarios: complex decision analysis, project planning, root cause an
 risk assessment, solution comparison, etc.
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+
     async def execute(self, tool_context: ToolContext, params: ThinkingParams) -> ToolResult:
         """
         Execute thinking process and return result
@@ -68,7 +68,7 @@ from app.core.entity.event.event_context import EventContext
 from app.core.entity.message.server_message import BrowserContent, DisplayType, ToolDetail
 from app.core.entity.tool.browser_opration import BrowserOperationNames
 from app.tools.abstract_file_tool import AbstractFileTool
-from app.tools.core import BaseToolParams, tool
+from app.tools.core import BaseToolParams, ToolConcurrency, tool
 from app.tools.use_browser_operations.operations_registry import operations_registry
 from app.tools.visual_understanding import VisualUnderstanding, VisualUnderstandingParams
 from app.tools.workspace_guard_tool import WorkspaceGuardTool
@@ -132,6 +132,9 @@ class UseBrowser(WorkspaceGuardTool[UseBrowserParams], AbstractFileTool):
     use_browser(operation="read_as_markdown")
     """
 
+    concurrency = ToolConcurrency.EXCLUSIVE  # Clicks and inputs act on live pages, screenshots are written to the workspace
+    max_concurrent_calls = 1  # All operations drive the same browser
+
     def __init__(self, **data):
         super().__init__(**data)
         # No longer dynamically generate description here
@@ -286,6 +289,12 @@ class UseBrowser(WorkspaceGuardTool[UseBrowserParams], AbstractFileTool):
             browser_config.user_agent = config.get("browser.user_agent")
         if config.get("browser.browser_type") is not None:
             browser_config.browser_type = config.get("browser.browser_type")
+        if config.get("browser.context_pool_size") is not None:
+            browser_config.context_pool_size = config.get("browser.context_pool_size")
+        if config.get("browser.context_max_navigations") is not None:
+            browser_config.context_max_navigations = config.get("browser.context_max_navigations")
+        if config.get("browser.pool_max_memory_mb") is not None:
+            browser_config.pool_max_memory_mb = config.get("browser.pool_max_memory_mb")
 
         # Create browser instance
         browser = DelightfulBrowser(config=browser_config)
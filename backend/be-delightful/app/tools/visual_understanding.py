@@ -12,7 +12,7 @@ from agentlang.llms.factory import LLMFactory
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from app.core.entity.message.server_message import DisplayType, FileContent, ToolDetail
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 
 logger = get_logger(__name__)
 
@@ -62,6 +62,9 @@ class VisualUnderstanding(BaseTool[VisualUnderstandingParams]):
     ```
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    path_params = ("images",)
+
     async def execute(
         self,
         tool_context: ToolContext,
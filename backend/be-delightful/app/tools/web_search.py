@@ -1,9 +1,8 @@
 import asyncio
 import json
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import aiohttp
 from pydantic import Field
 
 from agentlang.config.config import config
@@ -13,7 +12,9 @@ from agentlang.tools.tool_result import ToolResult
 from app.core.entity.factory.tool_detail_factory import ToolDetailFactory
 from app.core.entity.message.server_message import ToolDetail
 from app.core.entity.tool.tool_result import WebSearchToolResult
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
+from app.utils.http_client import get_http_session
+from app.utils.search_cache import CACHE_COALESCED, CACHE_HIT, CACHE_MISS, SearchResultCache
 
 logger = get_logger(__name__)
 
@@ -137,28 +138,28 @@ class WebSearchAPI:
 
         try:
             # Send HTTP request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.search_url, headers=headers, params=params) as response:
-                    if response.status != 200:
-                        error_detail = await response.text()
-                        logger.error(f"Bing Search API requestfailed: {response.status} {error_detail}")
-                        return []
-
-                    data = await response.json()
-
-                    # Parse response data
-                    if "webPages" not in data or "value" not in data["webPages"]:
-                        return []
-
-                    results = []
-                    for item in data["webPages"]["value"]:
-                        results.append({
-                            "title": item.get("name", ""),
-                            "link": item.get("url", ""),
-                            "snippet": item.get("snippet", "")
-                        })
-
-                    return results[:limit or self.k]
+            session = get_http_session()
+            async with session.get(self.search_url, headers=headers, params=params) as response:
+                if response.status != 200:
+                    error_detail = await response.text()
+                    logger.error(f"Bing Search API requestfailed: {response.status} {error_detail}")
+                    return []
+
+                data = await response.json()
+
+                # Parse response data
+                if "webPages" not in data or "value" not in data["webPages"]:
+                    return []
+
+                results = []
+                for item in data["webPages"]["value"]:
+                    results.append({
+                        "title": item.get("name", ""),
+                        "link": item.get("url", ""),
+                        "snippet": item.get("snippet", "")
+                    })
+
+                return results[:limit or self.k]
         except Exception as e:
             logger.error(f"Bing Search API request error: {e}")
             return []
@@ -273,14 +274,14 @@ class TavilySearchAPI:
 
         try:
             # Send HTTP request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.search_url, headers=headers, json=data) as response:
-                    if response.status != 200:
-                        error_detail = await response.text()
-                        logger.error(f"Tavily Search API requestfailed: {response.status} {error_detail}")
-                        return {}
-
-                    return await response.json()
+            session = get_http_session()
+            async with session.post(self.search_url, headers=headers, json=data) as response:
+                if response.status != 200:
+                    error_detail = await response.text()
+                    logger.error(f"Tavily Search API requestfailed: {response.status} {error_detail}")
+                    return {}
+
+                return await response.json()
         except Exception as e:
             logger.error(f"Tavily Search API request error: {e}")
             return {}
@@ -321,6 +322,9 @@ class WebSearch(BaseTool[WebSearchParams]):
     - For complex queries, break into simpler ones and leverage parallel searches
     """
 
+    concurrency = ToolConcurrency.READ_ONLY
+    eager_safe = True
+
     def __init__(self, **data):
         super().__init__(**data)
         # Load API keys and endpoints
@@ -444,9 +448,9 @@ class WebSearch(BaseTool[WebSearchParams]):
             api_type = "Tavily" if self.use_tavily else "Bing"
             logger.info(f"Executing {api_type} web search: query_count={len(query)}, results_per_query={num_results}")
 
-            # Execute all queries in parallel
+            # Execute all queries in parallel, identical queries share one request
             tasks = [
-                self._perform_search(
+                self._perform_cached_search(
                     query=q,
                     num_results=num_results,
                     language=language,
@@ -456,10 +460,19 @@ class WebSearch(BaseTool[WebSearchParams]):
                 )
                 for q in query
             ]
-            all_results = await asyncio.gather(*tasks)
+            searches = await asyncio.gather(*tasks)
+            all_results = [results for results, _ in searches]
+            cache_statuses = [status for _, status in searches]
 
             # Build structured result
             result = self._handle_queries_results(query, all_results)
+            result.extra_info = {
+                "cache": {
+                    "hits": cache_statuses.count(CACHE_HIT),
+                    "misses": cache_statuses.count(CACHE_MISS),
+                    "coalesced": cache_statuses.count(CACHE_COALESCED),
+                }
+            }
 
             if len(query) > 1:
                 message = f"Searched individually for: {', '.join(query)}"
@@ -498,6 +511,36 @@ class WebSearch(BaseTool[WebSearchParams]):
 
         return result
 
+    async def _perform_cached_search(
+        self, query: str, num_results: int, language: str, region: str, safe_search: bool, time_period: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Perform a search through the search result cache
+
+        Returns:
+            Tuple[List[Dict[str, Any]], str]: (search results, cache status)
+        """
+        key = SearchResultCache.make_key(
+            "tavily" if self.use_tavily else "bing",
+            query,
+            num_results=num_results,
+            language=language,
+            region=region,
+            safe_search=safe_search,
+            time_period=time_period,
+        )
+        return await SearchResultCache.get_instance().get_or_fetch(
+            key,
+            lambda: self._perform_search(
+                query=query,
+                num_results=num_results,
+                language=language,
+                region=region,
+                safe_search=safe_search,
+                time_period=time_period,
+            ),
+        )
+
     async def _perform_search(
         self, query: str, num_results: int, language: str, region: str, safe_search: bool, time_period: Optional[str]
     ) -> List[Dict[str, Any]]:
@@ -2,9 +2,13 @@ from pathlib import Path
 from typing import Optional, TypeVar
 
 from agentlang.context.tool_context import ToolContext
+from agentlang.event.event import EventType
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
+from app.core.context.agent_context import AgentContext
+from app.core.entity.event.tool_event import ToolProgressEventData
 from app.paths import PathManager
+from app.utils.output_capture import SPILL_DIR_NAME, OutputCollector
 from app.tools.core.base_tool import BaseTool
 from app.tools.core.base_tool_params import BaseToolParams
 
@@ -63,6 +67,38 @@ class WorkspaceGuardTool(BaseTool[T]):
             logger.warning(error_msg)
             return None, error_msg
 
+    def create_output_collector(self, tool_context: ToolContext, command: str) -> OutputCollector:
+        """
+        Create an output collector for a process started by this tool
+
+        Output is forwarded to clients as TOOL_PROGRESS events while the process runs, and spilled to
+        the workspace when it exceeds the capture budget
+
+        Args:
+            tool_context: Tool context
+            command: Command or target shown with the progress output
+
+        Returns:
+            OutputCollector: Collector for the process output
+        """
+        agent_context = tool_context.get_extension_typed("agent_context", AgentContext)
+
+        async def on_progress(stream: str, output: str) -> None:
+            event_data = ToolProgressEventData(
+                tool_context=tool_context,
+                tool_name=self.name,
+                command=command,
+                stream=stream,
+                output=output,
+            )
+            await agent_context.dispatch_event(EventType.TOOL_PROGRESS, event_data)
+
+        return OutputCollector(
+            spill_dir=self.base_dir / SPILL_DIR_NAME,
+            name=self.name,
+            on_progress=on_progress if agent_context else None,
+        )
+
     async def execute(self, tool_context: ToolContext, params: T) -> ToolResult:
         """
         Default execute method; subclasses should override
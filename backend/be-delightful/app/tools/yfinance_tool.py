@@ -15,7 +15,7 @@ from agentlang.context.tool_context import ToolContext
 from agentlang.logger import get_logger
 from agentlang.tools.tool_result import ToolResult
 from app.core.entity.tool.tool_result import YFinanceToolResult
-from app.tools.core import BaseTool, BaseToolParams, tool
+from app.tools.core import BaseTool, BaseToolParams, ToolConcurrency, tool
 
 logger = get_logger(__name__)
 
@@ -108,6 +108,8 @@ class YFinanceParams(BaseToolParams):
 class YFinance(BaseTool[YFinanceParams]):
     """Yahoo Finance data tool"""
 
+    concurrency = ToolConcurrency.READ_ONLY
+
     # Set params class
     params_class = YFinanceParams
 
@@ -0,0 +1,180 @@
+"""
+Streaming zip archive utilities
+
+Writes zip archives directly from source directories without staging copies, computing the
+MD5 of the archive while it is written. Optionally only archives files that changed compared
+to a manifest of a previous archive (delta mode).
+"""
+import hashlib
+import os
+import zipfile
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from agentlang.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Manifest entry: archive path -> (size, mtime_ns)
+ArchiveManifest = Dict[str, Tuple[int, int]]
+
+# Read size used when copying file contents into the archive
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class _HashingWriter:
+    """
+    Write-only, non-seekable file wrapper that hashes everything written through it.
+
+    Being non-seekable makes zipfile stream entries with data descriptors instead of seeking
+    back to patch local headers, so the hash covers exactly the final archive bytes.
+    """
+
+    def __init__(self, fp: BinaryIO):
+        self._fp = fp
+        self._md5 = hashlib.md5()
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._fp.write(data)
+        self._md5.update(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, *args, **kwargs):
+        raise OSError("_HashingWriter is not seekable")
+
+    def seekable(self) -> bool:
+        return False
+
+    def flush(self) -> None:
+        self._fp.flush()
+
+    @property
+    def size(self) -> int:
+        return self._position
+
+    def hexdigest(self) -> str:
+        return self._md5.hexdigest()
+
+
+@dataclass
+class ArchiveResult:
+    """Result of writing an archive"""
+    path: str
+    size: int
+    md5: str
+    file_count: int
+    # Manifest of all files in the source directories at archive time (not only the archived ones)
+    manifest: ArchiveManifest = field(default_factory=dict)
+    # Paths present in the base manifest that no longer exist (delta mode only)
+    deleted_paths: List[str] = field(default_factory=list)
+
+
+def scan_directories(directory_paths: List[str]) -> ArchiveManifest:
+    """
+    Build a manifest of all regular files under the given directories
+
+    Args:
+        directory_paths: Directories to scan; archive paths are prefixed with each directory's name
+
+    Returns:
+        ArchiveManifest: Archive path -> (size, mtime_ns)
+    """
+    manifest: ArchiveManifest = {}
+    for directory in directory_paths:
+        if not os.path.isdir(directory):
+            logger.warning(f"Directory to archive does not exist: {directory}")
+            continue
+        base_name = os.path.basename(os.path.normpath(directory))
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            rel_root = os.path.relpath(root, directory)
+            for name in sorted(files):
+                full_path = os.path.join(root, name)
+                try:
+                    st = os.stat(full_path, follow_symlinks=False)
+                except OSError:
+                    continue
+                if not os.path.isfile(full_path) or os.path.islink(full_path):
+                    continue
+                arcname = _arcname(base_name, rel_root, name)
+                manifest[arcname] = (st.st_size, st.st_mtime_ns)
+    return manifest
+
+
+def write_zip_archive(
+    directory_paths: List[str],
+    output_path: str,
+    base_manifest: Optional[ArchiveManifest] = None,
+) -> ArchiveResult:
+    """
+    Write a zip archive of the given directories, streaming directly from the sources
+
+    Args:
+        directory_paths: Directories to archive, stored under their own names (e.g. `.workspace/...`)
+        output_path: Path of the zip file to create
+        base_manifest: Manifest of a previous archive; when given, only new or changed files are archived
+
+    Returns:
+        ArchiveResult: Archive path, size, MD5, manifest and deleted paths
+    """
+    roots = {os.path.basename(os.path.normpath(d)): d for d in directory_paths}
+    manifest = scan_directories(directory_paths)
+
+    if base_manifest is None:
+        to_archive = list(manifest.keys())
+        deleted_paths: List[str] = []
+    else:
+        to_archive = [path for path, stat in manifest.items() if base_manifest.get(path) != stat]
+        deleted_paths = sorted(path for path in base_manifest if path not in manifest)
+
+    file_count = 0
+    with open(output_path, "wb") as raw:
+        writer = _HashingWriter(raw)
+        with zipfile.ZipFile(writer, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for arcname in to_archive:
+                base_name, _, rel_path = arcname.partition("/")
+                source_path = os.path.join(roots[base_name], rel_path)
+                try:
+                    _write_file_entry(zf, source_path, arcname)
+                    file_count += 1
+                except FileNotFoundError:
+                    # Removed between scan and archive, treat as deleted
+                    manifest.pop(arcname, None)
+                    if base_manifest is not None and arcname in base_manifest:
+                        deleted_paths.append(arcname)
+                except OSError as e:
+                    logger.warning(f"Skipping unreadable file while archiving {source_path}: {e}")
+                    manifest.pop(arcname, None)
+        writer.flush()
+
+    return ArchiveResult(
+        path=output_path,
+        size=writer.size,
+        md5=writer.hexdigest(),
+        file_count=file_count,
+        manifest=manifest,
+        deleted_paths=deleted_paths,
+    )
+
+
+def _arcname(base_name: str, rel_root: str, name: str) -> str:
+    if rel_root == ".":
+        return f"{base_name}/{name}"
+    return f"{base_name}/{rel_root.replace(os.sep, '/')}/{name}"
+
+
+def _write_file_entry(zf: zipfile.ZipFile, source_path: str, arcname: str) -> None:
+    """Copy one file into the archive in large chunks"""
+    zinfo = zipfile.ZipInfo.from_file(source_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    with open(source_path, "rb") as src, zf.open(zinfo, "w") as dest:
+        while True:
+            chunk = src.read(_COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            dest.write(chunk)
@@ -0,0 +1,178 @@
+"""
+Cached document conversion for MarkItDown formats
+
+Converts documents (Excel, CSV, Word, notebooks, ...) to Markdown in a process pool so large files do
+not block the event loop, and caches the result by content hash under the application cache directory,
+outside the user workspace. Later reads of an unchanged document reuse the cached Markdown.
+"""
+import asyncio
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import aiofiles
+import aiofiles.os
+
+from agentlang.logger import get_logger
+from app.paths import PathManager
+
+logger = get_logger(__name__)
+
+# Converters that page by rows themselves; their output depends on offset/limit, so it is cached per page
+ROW_PAGED_EXTENSIONS = {".csv", ".xlsx", ".xls"}
+# Number of worker processes used for conversion
+CONVERSION_WORKERS = 2
+# Number of cached conversions kept on disk
+MAX_CACHE_ENTRIES = 500
+# Read size used when hashing files
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+_executor: Optional[ProcessPoolExecutor] = None
+# (path, size, mtime_ns) -> content hash, so unchanged documents are not hashed again
+_hash_cache: Dict[Tuple[str, int, int], str] = {}
+
+# MarkItDown instance of the worker process, created on first use
+_worker_md = None
+
+
+def _convert_in_worker(file_path: str, extension: str, offset: int, limit: int) -> str:
+    """
+    Convert a document to Markdown, runs in a worker process
+
+    Args:
+        file_path: Document path
+        extension: File extension including the dot
+        offset: Offset passed to row-paged converters
+        limit: Limit passed to row-paged converters
+
+    Returns:
+        str: Converted Markdown, empty if the conversion produced nothing
+    """
+    global _worker_md
+    if _worker_md is None:
+        from markitdown import MarkItDown
+
+        from app.tools.markitdown_plugins.csv_plugin import CSVConverter
+        from app.tools.markitdown_plugins.excel_plugin import ExcelConverter
+
+        _worker_md = MarkItDown()
+        _worker_md.register_converter(ExcelConverter())
+        _worker_md.register_converter(CSVConverter())
+
+    from markitdown import StreamInfo
+
+    with open(file_path, "rb") as f:
+        result = _worker_md.convert(f, stream_info=StreamInfo(extension=extension), offset=offset, limit=limit)
+    return result.markdown if result and result.markdown else ""
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn avoids forking the event loop and its threads into the workers
+        _executor = ProcessPoolExecutor(
+            max_workers=CONVERSION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _hash_file(file_path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+async def _get_content_hash(file_path: Path) -> str:
+    st = await aiofiles.os.stat(file_path)
+    key = (str(file_path), st.st_size, st.st_mtime_ns)
+    content_hash = _hash_cache.get(key)
+    if content_hash is None:
+        content_hash = await asyncio.to_thread(_hash_file, file_path)
+        _hash_cache[key] = content_hash
+    return content_hash
+
+
+def get_conversion_cache_dir() -> Path:
+    """Get the directory holding cached conversions"""
+    cache_dir = PathManager.get_cache_dir() / "document_conversion"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def is_row_paged(extension: str) -> bool:
+    """Check whether the converter for an extension applies offset/limit itself"""
+    return extension.lower() in ROW_PAGED_EXTENSIONS
+
+
+async def convert_document_cached(file_path: Path, extension: str, offset: int = 0, limit: int = -1) -> Path:
+    """
+    Convert a document to Markdown, reusing a cached conversion of identical content
+
+    For row-paged formats (CSV, Excel) offset/limit are passed to the converter and are part of the
+    cache key; for all other formats the whole document is converted once and callers slice the result.
+
+    Args:
+        file_path: Document path
+        extension: File extension including the dot
+        offset: Starting row for row-paged formats
+        limit: Number of rows for row-paged formats
+
+    Returns:
+        Path: Cached Markdown file
+
+    Raises:
+        Exception: If the conversion fails
+    """
+    extension = extension.lower()
+    content_hash = await _get_content_hash(file_path)
+    if is_row_paged(extension):
+        cache_name = f"{content_hash}{extension}.{offset}.{limit}.md"
+    else:
+        offset, limit = 0, -1
+        cache_name = f"{content_hash}{extension}.md"
+
+    cache_path = get_conversion_cache_dir() / cache_name
+    if await aiofiles.os.path.exists(cache_path):
+        logger.info(f"Using cached conversion {cache_path.name} for {file_path}")
+        return cache_path
+
+    logger.info(f"Converting {file_path} to Markdown in worker process")
+    loop = asyncio.get_running_loop()
+    try:
+        markdown = await loop.run_in_executor(
+            _get_executor(), _convert_in_worker, str(file_path), extension, offset, limit
+        )
+    except BrokenProcessPool:
+        # A worker died (e.g. out of memory); recreate the pool for later calls and convert in a thread now
+        global _executor
+        logger.warning("Document conversion process pool is broken, converting in a thread")
+        _executor = None
+        markdown = await asyncio.to_thread(_convert_in_worker, str(file_path), extension, offset, limit)
+
+    tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+    async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
+        await f.write(markdown)
+    await aiofiles.os.replace(tmp_path, cache_path)
+
+    await asyncio.to_thread(_prune_cache)
+    return cache_path
+
+
+def _prune_cache() -> None:
+    """Remove the oldest cached conversions beyond MAX_CACHE_ENTRIES"""
+    try:
+        entries = [entry for entry in os.scandir(get_conversion_cache_dir()) if entry.name.endswith(".md")]
+        if len(entries) <= MAX_CACHE_ENTRIES:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - MAX_CACHE_ENTRIES]:
+            os.remove(entry.path)
+    except OSError as e:
+        logger.warning(f"Failed to prune document conversion cache: {e}")
@@ -0,0 +1,127 @@
+"""
+Shared HTTP client
+
+One pooled aiohttp session per event loop, shared by tools and storage clients so repeated requests to the
+same host reuse keep-alive connections and cached DNS results instead of paying DNS, TCP and TLS setup
+for every call.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from agentlang.config.config import config
+from agentlang.logger import get_logger
+
+logger = get_logger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_stats: Dict[str, int] = {
+    "requests": 0,
+    "request_errors": 0,
+    "connections_created": 0,
+    "connections_reused": 0,
+    "dns_cache_hits": 0,
+    "dns_cache_misses": 0,
+    "sessions_created": 0,
+}
+
+
+def _create_trace_config() -> aiohttp.TraceConfig:
+    """Count requests, connection reuse and DNS cache hits"""
+    trace_config = aiohttp.TraceConfig()
+
+    def counter(name: str):
+        async def on_event(session, trace_config_ctx, params):
+            _stats[name] += 1
+        return on_event
+
+    trace_config.on_request_start.append(counter("requests"))
+    trace_config.on_request_exception.append(counter("request_errors"))
+    trace_config.on_connection_create_end.append(counter("connections_created"))
+    trace_config.on_connection_reuseconn.append(counter("connections_reused"))
+    trace_config.on_dns_cache_hit.append(counter("dns_cache_hits"))
+    trace_config.on_dns_cache_miss.append(counter("dns_cache_misses"))
+    return trace_config
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session of the running event loop, creating it on first use
+
+    The session must not be closed by callers. It keeps no cookies, so requests of different tools do not
+    leak state into each other; use create_cookie_session for requests that need cookies.
+
+    Returns:
+        aiohttp.ClientSession: Shared session
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is not None and not _session.closed and _session_loop is loop:
+        return _session
+
+    connector = aiohttp.TCPConnector(
+        limit=int(config.get("http_client.max_connections", 100)),
+        limit_per_host=int(config.get("http_client.max_connections_per_host", 10)),
+        ttl_dns_cache=int(config.get("http_client.dns_cache_ttl", 300)),
+        keepalive_timeout=float(config.get("http_client.keepalive_timeout", 30)),
+        enable_cleanup_closed=True,
+    )
+    _session = aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        trace_configs=[_create_trace_config()],
+    )
+    _session_loop = loop
+    _stats["sessions_created"] += 1
+    logger.info(f"Created shared HTTP session, max connections: {connector.limit}, per host: {connector.limit_per_host}")
+    return _session
+
+
+def create_cookie_session() -> aiohttp.ClientSession:
+    """
+    Create a session with its own cookie jar on the shared connection pool
+
+    For requests relying on cookies set along a redirect chain (auth or CDN hand-offs). The caller must
+    close the session, which drops its cookies but keeps the pooled connections open.
+
+    Returns:
+        aiohttp.ClientSession: New session sharing the connector of the shared session
+    """
+    return aiohttp.ClientSession(
+        connector=get_http_session().connector,
+        connector_owner=False,
+        cookie_jar=aiohttp.CookieJar(),
+        trace_configs=[_create_trace_config()],
+    )
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session and its connections"""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("Closed shared HTTP session")
+    _session = None
+    _session_loop = None
+
+
+def get_http_client_stats() -> Dict[str, Any]:
+    """
+    Get shared HTTP client metrics
+
+    Returns:
+        Dict: Request, connection reuse and DNS cache counters plus pool limits
+    """
+    stats: Dict[str, Any] = dict(_stats)
+    stats["active"] = _session is not None and not _session.closed
+    if stats["active"]:
+        connector = _session.connector
+        stats["max_connections"] = connector.limit
+        stats["max_connections_per_host"] = connector.limit_per_host
+    created = stats["connections_created"]
+    reused = stats["connections_reused"]
+    stats["connection_reuse_ratio"] = round(reused / (created + reused), 3) if created + reused else 0.0
+    return stats
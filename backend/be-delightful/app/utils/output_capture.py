@@ -0,0 +1,215 @@
+"""
+Streaming capture of process output
+
+Reads stdout/stderr incrementally instead of buffering them until the process exits. Each stream keeps
+its head and tail within a byte budget; once a stream exceeds the budget its complete output is written
+to a spill file in the workspace. Output is also forwarded, throttled, to a progress callback so clients
+can show it while the command is still running.
+"""
+import asyncio
+import time
+import uuid
+from pathlib import Path
+from typing import Awaitable, BinaryIO, Callable, Dict, Optional
+
+from agentlang.config.config import config
+from agentlang.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Directory (relative to the workspace) holding the full output of commands that exceeded the budget
+SPILL_DIR_NAME = ".tool_output"
+# Read size for process pipes
+_READ_SIZE = 64 * 1024
+
+# Receives (stream, text) with output produced since the previous call
+ProgressCallback = Callable[[str, str], Awaitable[None]]
+
+
+class OutputBuffer:
+    """Head + tail of one output stream within a byte budget, spilling to a file on overflow"""
+
+    def __init__(self, max_bytes: int, spill_path: Path):
+        """
+        Initialize the buffer
+
+        Args:
+            max_bytes: Maximum number of bytes kept in memory
+            spill_path: File receiving the complete output once the budget is exceeded
+        """
+        self.head_limit = max_bytes // 4
+        self.tail_limit = max_bytes - self.head_limit
+        self.spill_path = spill_path
+        self.total_bytes = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._spill_file: Optional[BinaryIO] = None
+        self.spilled = False
+
+    @property
+    def truncated(self) -> bool:
+        """Whether part of the output was dropped from memory"""
+        return self.total_bytes > len(self._head) + len(self._tail)
+
+    def write(self, data: bytes) -> None:
+        """Append output"""
+        self.total_bytes += len(data)
+        if self._spill_file:
+            self._spill_file.write(data)
+
+        if len(self._head) < self.head_limit:
+            take = self.head_limit - len(self._head)
+            self._head.extend(data[:take])
+            data = data[take:]
+        if not data:
+            return
+
+        self._tail.extend(data)
+        if len(self._tail) > self.tail_limit:
+            if not self.spilled:
+                # Everything so far is still in memory, so the spill file starts complete
+                self._open_spill_file()
+            del self._tail[:len(self._tail) - self.tail_limit]
+
+    def getvalue(self) -> str:
+        """
+        Get the captured output
+
+        Returns:
+            str: Complete output, or head and tail around an omission notice when truncated
+        """
+        head = self._head.decode("utf-8", errors="replace")
+        if not self.truncated:
+            return head + self._tail.decode("utf-8", errors="replace")
+
+        omitted = self.total_bytes - len(self._head) - len(self._tail)
+        notice = f"\n\n... [{omitted} bytes omitted"
+        if self.spilled:
+            notice += f", full output saved to {self.spill_path}"
+        notice += "] ...\n\n"
+        return head + notice + self._tail.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Close the spill file"""
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def _open_spill_file(self) -> None:
+        self.spilled = True
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = open(self.spill_path, "wb")
+            self._spill_file.write(self._head)
+            self._spill_file.write(self._tail)
+            logger.info(f"Output exceeded {self.head_limit + self.tail_limit} bytes, writing full output to {self.spill_path}")
+        except OSError as e:
+            logger.warning(f"Failed to create output spill file {self.spill_path}: {e}")
+            self.spilled = False
+            self._spill_file = None
+
+
+class OutputCollector:
+    """Captures stdout and stderr of one execution and forwards throttled progress"""
+
+    def __init__(self, spill_dir: Path, name: str, on_progress: Optional[ProgressCallback] = None):
+        """
+        Initialize the collector
+
+        Args:
+            spill_dir: Directory for spill files
+            name: Prefix of the spill file names
+            on_progress: Called with output produced since the previous call (optional)
+        """
+        max_bytes = int(config.get("tool_output.max_capture_bytes", 128 * 1024))
+        spill_prefix = f"{name}_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self.buffers: Dict[str, OutputBuffer] = {
+            stream: OutputBuffer(max_bytes, spill_dir / f"{spill_prefix}.{stream}.log")
+            for stream in ("stdout", "stderr")
+        }
+        self.on_progress = on_progress
+        self.progress_interval = float(config.get("tool_output.progress_interval", 0.5))
+        self.max_progress_chars = int(config.get("tool_output.max_progress_chars", 8192))
+        self._pending: Dict[str, bytearray] = {"stdout": bytearray(), "stderr": bytearray()}
+        self._last_progress = 0.0
+
+    @property
+    def stdout(self) -> str:
+        """Captured standard output"""
+        return self.buffers["stdout"].getvalue()
+
+    @property
+    def stderr(self) -> str:
+        """Captured standard error"""
+        return self.buffers["stderr"].getvalue()
+
+    async def feed(self, stream: str, data: bytes) -> None:
+        """
+        Record output of a stream
+
+        Args:
+            stream: "stdout" or "stderr"
+            data: Output bytes
+        """
+        self.buffers[stream].write(data)
+        if not self.on_progress:
+            return
+        pending = self._pending[stream]
+        pending.extend(data)
+        # Only the latest output is worth showing, keep the pending chunk bounded
+        if len(pending) > self.max_progress_chars * 4:
+            del pending[:len(pending) - self.max_progress_chars * 4]
+        if time.monotonic() - self._last_progress >= self.progress_interval:
+            await self.flush_progress()
+
+    async def flush_progress(self) -> None:
+        """Forward pending output to the progress callback"""
+        if not self.on_progress:
+            return
+        self._last_progress = time.monotonic()
+        for stream, pending in self._pending.items():
+            if not pending:
+                continue
+            text = pending.decode("utf-8", errors="replace")
+            pending.clear()
+            if len(text) > self.max_progress_chars:
+                text = "..." + text[-self.max_progress_chars:]
+            try:
+                await self.on_progress(stream, text)
+            except Exception as e:
+                logger.warning(f"Failed to forward output progress: {e}")
+
+    async def read_process(self, process: asyncio.subprocess.Process, timeout: float) -> int:
+        """
+        Read the output of a process started with stdout/stderr pipes until it exits
+
+        Args:
+            process: Running process
+            timeout: Timeout in seconds
+
+        Returns:
+            int: Process exit code
+
+        Raises:
+            asyncio.TimeoutError: If the process did not finish within the timeout, the process is left running
+        """
+        async def pump(stream_name: str, reader: asyncio.StreamReader) -> None:
+            while True:
+                data = await reader.read(_READ_SIZE)
+                if not data:
+                    break
+                await self.feed(stream_name, data)
+
+        async def run() -> int:
+            await asyncio.gather(pump("stdout", process.stdout), pump("stderr", process.stderr))
+            return await process.wait()
+
+        try:
+            return await asyncio.wait_for(run(), timeout=timeout)
+        finally:
+            await self.flush_progress()
+
+    def close(self) -> None:
+        """Close spill files"""
+        for buffer in self.buffers.values():
+            buffer.close()
@@ -0,0 +1,227 @@
+"""
+Persistent Python kernel
+
+A long-lived Python interpreter, registered with ProcessManager, that keeps globals between executions
+so multi-step analyses do not pay interpreter startup, imports and data loading on every call.
+The kernel runs python_kernel_worker.py in a fresh interpreter; it is restarted after a crash, a timeout
+or when it exceeds its memory limit, in which case its state is lost.
+"""
+import asyncio
+import multiprocessing
+import os
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from agentlang.config.config import config
+from agentlang.logger import get_logger
+from agentlang.utils.process_manager import ProcessManager
+from app.utils.output_capture import OutputCollector
+
+logger = get_logger(__name__)
+
+KERNEL_PROCESS_NAME = "python_kernel"
+# Seconds to wait for a new kernel to report ready
+KERNEL_STARTUP_TIMEOUT = 30
+# Seconds to wait for a pending receive to end after the kernel was stopped
+KERNEL_RECV_DRAIN_TIMEOUT = 5
+_WORKER_SCRIPT = Path(__file__).with_name("python_kernel_worker.py")
+
+
+@dataclass
+class KernelExecutionResult:
+    """Result of running code in the kernel, output goes to the OutputCollector passed to execute"""
+    exit_code: int
+    timed_out: bool = False
+    crashed: bool = False
+    # The kernel was (re)started for this execution, so earlier state is gone
+    fresh_kernel: bool = False
+
+
+def _exec_kernel_process(conn_fd: int, memory_limit_mb: int, cwd: str, env: Dict[str, str]) -> None:
+    """Replace the ProcessManager worker process with a clean interpreter running the kernel worker"""
+    os.set_inheritable(conn_fd, True)
+    os.chdir(cwd)
+    os.execvpe("python", ["python", str(_WORKER_SCRIPT), str(conn_fd), str(memory_limit_mb)], env)
+
+
+class PythonKernel:
+    """Session-scoped persistent Python kernel"""
+
+    _instance: Optional["PythonKernel"] = None
+
+    @classmethod
+    def get_instance(cls) -> "PythonKernel":
+        """Get the kernel shared by all PythonExecute calls of this process"""
+        if cls._instance is None:
+            cls._instance = PythonKernel(memory_limit_mb=int(config.get("python_execute.kernel_memory_limit_mb", 4096)))
+        return cls._instance
+
+    def __init__(self, memory_limit_mb: int):
+        """
+        Initialize the kernel, the process is started on first execution
+
+        Args:
+            memory_limit_mb: Address space limit of the kernel process, 0 for no limit
+        """
+        self.memory_limit_mb = memory_limit_mb
+        self._conn: Optional[Connection] = None
+        # Receive running in a worker thread, kept until it returns so the connection is never closed under it
+        self._pending_recv: Optional[asyncio.Future] = None
+        self._lock = asyncio.Lock()
+        self._request_id = 0
+        self.restarts = 0
+
+    def is_alive(self) -> bool:
+        """Check whether the kernel process is running"""
+        worker = ProcessManager.get_instance().workers.get(KERNEL_PROCESS_NAME)
+        return self._conn is not None and worker is not None and worker.is_alive()
+
+    async def execute(
+        self,
+        code: str,
+        cwd: Path,
+        timeout: float,
+        env: Dict[str, str],
+        output: OutputCollector,
+        file_path: Optional[Path] = None,
+        args: Optional[List[str]] = None,
+    ) -> KernelExecutionResult:
+        """
+        Run code in the kernel, starting or restarting it if needed
+
+        Args:
+            code: Source code to run
+            cwd: Working directory for the execution
+            timeout: Execution timeout in seconds; the kernel is restarted when it is exceeded
+            env: Environment for a newly started kernel
+            output: Collector receiving the output as it arrives
+            file_path: Script path when running a file, sets __file__, sys.argv[0] and sys.path[0]
+            args: Command line arguments exposed as sys.argv[1:]
+
+        Returns:
+            KernelExecutionResult: Execution status
+        """
+        async with self._lock:
+            fresh_kernel = False
+            if not self.is_alive():
+                await self._start(cwd, env)
+                fresh_kernel = True
+
+            self._request_id += 1
+            request = {
+                "type": "execute",
+                "id": self._request_id,
+                "code": code,
+                "cwd": str(cwd),
+                "file_path": str(file_path) if file_path else None,
+                "args": args or [],
+            }
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            try:
+                await asyncio.to_thread(self._conn.send, request)
+                while True:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    message = await self._recv(timeout=remaining)
+                    if message.get("type") == "output":
+                        await output.feed(message["stream"], message["data"])
+                    elif message.get("type") == "result" and message.get("id") == request["id"]:
+                        return KernelExecutionResult(exit_code=message["exit_code"], fresh_kernel=fresh_kernel)
+            except asyncio.TimeoutError:
+                logger.warning(f"Python kernel execution timed out after {timeout} seconds, restarting kernel")
+                await self.shutdown()
+                return KernelExecutionResult(exit_code=-1, timed_out=True, fresh_kernel=fresh_kernel)
+            except (EOFError, OSError) as e:
+                # The kernel died, most likely killed for exceeding the memory limit
+                logger.error(f"Python kernel exited during execution: {e!s}")
+                await self.shutdown()
+                return KernelExecutionResult(exit_code=-1, crashed=True, fresh_kernel=fresh_kernel)
+            finally:
+                await output.flush_progress()
+
+    async def _recv(self, timeout: float) -> Dict:
+        """
+        Receive the next message from the kernel
+
+        Unlike asyncio.wait_for, a timeout leaves the receive running in its thread; it is picked up again by
+        the next call or drained by shutdown before the connection is closed.
+
+        Args:
+            timeout: Seconds to wait for a message
+
+        Returns:
+            Dict: Message sent by the kernel
+
+        Raises:
+            asyncio.TimeoutError: No message arrived in time
+        """
+        if self._pending_recv is None:
+            self._pending_recv = asyncio.ensure_future(asyncio.to_thread(self._conn.recv))
+        pending = self._pending_recv
+        done, _ = await asyncio.wait({pending}, timeout=timeout)
+        if not done:
+            raise asyncio.TimeoutError()
+        self._pending_recv = None
+        return pending.result()
+
+    async def shutdown(self) -> None:
+        """Stop the kernel process, dropping its state"""
+        # Stop the process first: a receive blocked on the connection only returns (with EOFError) once
+        # the peer is gone, and closing the connection under it would let its fd be reused meanwhile
+        process_manager = ProcessManager.get_instance()
+        if KERNEL_PROCESS_NAME in process_manager.workers:
+            await process_manager.stop_worker(KERNEL_PROCESS_NAME, timeout=2)
+
+        pending, self._pending_recv = self._pending_recv, None
+        if pending is not None:
+            done, _ = await asyncio.wait({pending}, timeout=KERNEL_RECV_DRAIN_TIMEOUT)
+            if not done:
+                # Something else still holds the kernel end open; leave the connection to be closed
+                # when the receive returns and it is garbage collected
+                logger.warning("Pending receive from the Python kernel did not end, leaving its connection open")
+                self._conn = None
+                return
+            if not pending.cancelled():
+                pending.exception()  # Expected EOFError, retrieved so it is not reported as unhandled
+
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+    async def _start(self, cwd: Path, env: Dict[str, str]) -> None:
+        """Start a new kernel process and wait until it is ready"""
+        await self.shutdown()
+        parent_conn, child_conn = multiprocessing.Pipe()
+        try:
+            await ProcessManager.get_instance().start_worker(
+                KERNEL_PROCESS_NAME,
+                _exec_kernel_process,
+                child_conn.fileno(),
+                self.memory_limit_mb,
+                str(cwd),
+                env,
+            )
+        finally:
+            # The worker process holds its own copy of the child end
+            child_conn.close()
+
+        self._conn = parent_conn
+        try:
+            message = await self._recv(timeout=KERNEL_STARTUP_TIMEOUT)
+        except (asyncio.TimeoutError, EOFError, OSError) as e:
+            await self.shutdown()
+            raise RuntimeError(f"Python kernel failed to start: {e!r}")
+        if message.get("type") != "ready":
+            await self.shutdown()
+            raise RuntimeError(f"Python kernel sent unexpected startup message: {message!r}")
+
+        self.restarts += 1
+        logger.info(f"Python kernel started, PID={message.get('pid')}, starts so far: {self.restarts}")
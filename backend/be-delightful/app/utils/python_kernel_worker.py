@@ -0,0 +1,159 @@
+"""
+Persistent Python kernel worker
+
+Standalone script (standard library only) executed in a fresh interpreter by PythonKernel. It receives
+execution requests over an inherited multiprocessing connection, runs them in one persistent globals
+namespace and streams everything written to file descriptors 1 and 2 back to the parent, including output
+of subprocesses started by user code.
+
+Usage: python python_kernel_worker.py <connection_fd> <memory_limit_mb>
+"""
+import os
+import sys
+import threading
+import traceback
+from multiprocessing.connection import Connection
+
+# Written to both output streams after each execution so the parent knows all output has been forwarded
+_END_MARKER = b"\x00__python_kernel_end__\x00"
+_READ_SIZE = 64 * 1024
+
+
+class _OutputForwarder:
+    """Forwards everything written to a file descriptor to the parent connection"""
+
+    def __init__(self, conn: Connection, send_lock: threading.Lock, stream: str, target_fd: int):
+        self.conn = conn
+        self.send_lock = send_lock
+        self.stream = stream
+        self.marker_seen = threading.Event()
+        read_fd, write_fd = os.pipe()
+        os.dup2(write_fd, target_fd)
+        os.close(write_fd)
+        self._read_fd = read_fd
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _send(self, data: bytes) -> None:
+        if data:
+            with self.send_lock:
+                self.conn.send({"type": "output", "stream": self.stream, "data": data})
+
+    def _run(self) -> None:
+        keep = len(_END_MARKER) - 1
+        buffer = b""
+        while True:
+            data = os.read(self._read_fd, _READ_SIZE)
+            if not data:
+                break
+            buffer += data
+            while True:
+                index = buffer.find(_END_MARKER)
+                if index == -1:
+                    break
+                self._send(buffer[:index])
+                buffer = buffer[index + len(_END_MARKER):]
+                self.marker_seen.set()
+            # Keep a possible partial marker at the end of the buffer
+            if len(buffer) > keep:
+                self._send(buffer[:-keep] if keep else buffer)
+                buffer = buffer[-keep:] if keep else b""
+
+
+def _apply_memory_limit(memory_limit_mb: int) -> None:
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except Exception as e:
+        print(f"Unable to apply kernel memory limit: {e}", file=sys.__stderr__)
+
+
+def _execute(request: dict, namespace: dict) -> dict:
+    """Run one request in the persistent namespace and return its result message"""
+    cwd = request.get("cwd")
+    if cwd:
+        os.chdir(cwd)
+    file_path = request.get("file_path")
+    # Match `python script.py args`: argv and sys.path[0] follow the script
+    sys.argv = [file_path or "-c"] + list(request.get("args") or [])
+    sys.path[0] = os.path.dirname(file_path) if file_path else os.getcwd()
+    namespace["__file__"] = file_path or "<kernel>"
+
+    exit_code = 0
+    try:
+        code = compile(request["code"], file_path or "<kernel>", "exec")
+        exec(code, namespace)
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as e:
+        # Skip the worker frame so the traceback starts at user code
+        tb = e.__traceback__
+        traceback.print_exception(type(e), e, tb.tb_next if tb else None)
+        exit_code = 1
+    return {"type": "result", "id": request.get("id"), "exit_code": exit_code}
+
+
+def main() -> None:
+    conn_fd = int(sys.argv[1])
+    memory_limit_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    conn = Connection(conn_fd)
+    send_lock = threading.Lock()
+
+    _apply_memory_limit(memory_limit_mb)
+
+    forwarders = [
+        _OutputForwarder(conn, send_lock, "stdout", 1),
+        _OutputForwarder(conn, send_lock, "stderr", 2),
+    ]
+    # Line-buffered text streams on the redirected descriptors, so print() and subprocess output share one path
+    sys.stdout = open(1, "w", encoding="utf-8", errors="replace", buffering=1, closefd=False)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="replace", buffering=1, closefd=False)
+
+    stdout, stderr = sys.stdout, sys.stderr
+    namespace = {"__name__": "__main__", "__builtins__": __builtins__}
+    # Replace the worker script directory, user code should not see it on the import path
+    sys.path[0] = os.getcwd()
+
+    with send_lock:
+        conn.send({"type": "ready", "pid": os.getpid()})
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request.get("type") == "shutdown":
+            break
+
+        result = _execute(request, namespace)
+        # User code may have replaced the streams
+        sys.stdout, sys.stderr = stdout, stderr
+
+        # Flush and wait until the forwarders have sent everything written during this execution
+        for stream in (stdout, stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        for forwarder in forwarders:
+            forwarder.marker_seen.clear()
+        os.write(1, _END_MARKER)
+        os.write(2, _END_MARKER)
+        for forwarder in forwarders:
+            forwarder.marker_seen.wait(timeout=5)
+
+        with send_lock:
+            conn.send(result)
+
+
+if __name__ == "__main__":
+    main()
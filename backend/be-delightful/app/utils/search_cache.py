@@ -0,0 +1,233 @@
+"""
+Search result cache
+
+Caches web search results by normalized query and search options with a TTL and LRU eviction, optionally
+persisted to a SQLite file under the application cache directory so results survive restarts. Concurrent
+lookups of the same query share one upstream request.
+"""
+import asyncio
+import copy
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from agentlang.config.config import config
+from agentlang.logger import get_logger
+from app.paths import PathManager
+
+logger = get_logger(__name__)
+
+SearchResults = List[Dict[str, Any]]
+
+# Lookup outcomes
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+# Joined a request for the same key that was already running
+CACHE_COALESCED = "coalesced"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query so case and whitespace variants share a cache entry"""
+    return " ".join(query.lower().split())
+
+
+class SearchResultCache:
+    """TTL + LRU cache of search results with in-flight request coalescing"""
+
+    _instance: Optional["SearchResultCache"] = None
+
+    @classmethod
+    def get_instance(cls) -> "SearchResultCache":
+        """Get the cache shared by all WebSearch calls of this process"""
+        if cls._instance is None:
+            db_path = None
+            if config.get("web_search.cache.persist", False):
+                db_path = PathManager.get_cache_dir() / "web_search_cache.sqlite3"
+            cls._instance = SearchResultCache(
+                ttl=float(config.get("web_search.cache.ttl", 3600)),
+                max_entries=int(config.get("web_search.cache.max_entries", 512)),
+                db_path=db_path,
+            )
+        return cls._instance
+
+    def __init__(self, ttl: float, max_entries: int, db_path: Optional[Path] = None):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds a result stays valid, 0 disables caching (coalescing still applies)
+            max_entries: Maximum number of results kept in memory and on disk
+            db_path: SQLite file for persistence (optional)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> (expires_at, results), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, SearchResults]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path is not None and ttl > 0:
+            self._open_db(db_path)
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(engine: str, query: str, **options: Any) -> str:
+        """
+        Build the cache key of a search
+
+        Args:
+            engine: Search engine name
+            query: Search query
+            **options: Options that change the results (result count, language, region, ...)
+
+        Returns:
+            str: Cache key
+        """
+        return json.dumps([engine, normalize_query(query), options], sort_keys=True, ensure_ascii=False)
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[SearchResults]]) -> Tuple[SearchResults, str]:
+        """
+        Get cached results, or fetch them once for all concurrent callers of the same key
+
+        Empty results are not cached since the search wrappers also return them on errors.
+
+        Args:
+            key: Cache key from make_key
+            fetch: Performs the upstream search
+
+        Returns:
+            Tuple[SearchResults, str]: (results, CACHE_HIT / CACHE_MISS / CACHE_COALESCED)
+        """
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            return copy.deepcopy(cached), CACHE_HIT
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            try:
+                # shield: a cancelled waiter must not cancel the request shared with others
+                results = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The caller that started the request was cancelled, start a new one
+                return await self.get_or_fetch(key, fetch)
+            return copy.deepcopy(results), CACHE_COALESCED
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            results = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve the exception so a future nobody waited for does not log it
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        if results:
+            self._put(key, results)
+        future.set_result(results)
+        return copy.deepcopy(results), CACHE_MISS
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict: Entry count and hit/miss counters
+        """
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "persistent": self._db is not None,
+        }
+
+    def _get(self, key: str) -> Optional[SearchResults]:
+        if self.ttl <= 0:
+            return None
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is None and self._db is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._entries[key] = entry
+                self._evict()
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if expires_at <= now:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    def _put(self, key: str, results: SearchResults) -> None:
+        if self.ttl <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        self._entries[key] = (expires_at, results)
+        self._entries.move_to_end(key)
+        self._evict()
+        if self._db is not None:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO search_results (key, expires_at, results) VALUES (?, ?, ?)",
+                    (key, expires_at, json.dumps(results, ensure_ascii=False)),
+                )
+                # Keep the newest max_entries rows
+                self._db.execute(
+                    "DELETE FROM search_results WHERE expires_at <= ? OR key NOT IN "
+                    "(SELECT key FROM search_results ORDER BY expires_at DESC LIMIT ?)",
+                    (time.time(), self.max_entries),
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to persist search result cache entry: {e}")
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Tuple[float, SearchResults]]:
+        try:
+            row = self._db.execute(
+                "SELECT expires_at, results FROM search_results WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read search result cache: {e}")
+            return None
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _open_db(self, db_path: Path) -> None:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS search_results (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, results TEXT NOT NULL)"
+            )
+            self._db.execute("DELETE FROM search_results WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+            logger.info(f"Search result cache persisted to {db_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to open search result cache {db_path}, using memory only: {e}")
+            self._db = None
@@ -8,11 +8,14 @@ provides browser initialization, context creation and lifecycle management funct
 import asyncio
 import logging
 import os
-from typing import Dict, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from playwright.async_api import Browser, BrowserContext, async_playwright
+import psutil
+from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
 from delightful_use.delightful_browser_config import DelightfulBrowserConfig
+from delightful_use.js_loader import PRELOADED_MODULES, build_module_bundle
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -40,11 +43,25 @@ class BrowserManager:
         self._browser = None
         self._initialized = False
         self._contexts: Dict[str, BrowserContext] = {}  # Context ID to object mapping
+        self._preloaded_modules: Dict[str, Tuple[str, ...]] = {}  # Context ID to JS modules injected by init script
         self._context_counter = 0  # Context ID counter
         self._lock = asyncio.Lock()  # Lock for protecting concurrent initialization
         self._storage_save_tasks = {}  # Storage state periodic save tasks
         self._client_refs = 0  # Client reference count
 
+        # Pre-warmed contexts not yet handed out: (context ID, config they were created with)
+        self._context_pool: List[Tuple[str, DelightfulBrowserConfig]] = []
+        self._warm_pages: Dict[str, Page] = {}  # Context ID to blank page created with the context
+        self._navigation_counts: Dict[str, int] = {}  # Context ID to number of navigations
+        self._pooled_storage_states: Dict[str, Optional[int]] = {}  # Context ID to mtime (ns) of the storage state file it loaded
+        self._pool_fill_task: Optional[asyncio.Task] = None
+
+        # Pool metrics
+        self._pool_hits = 0
+        self._pool_misses = 0
+        self._contexts_recycled = 0
+        self._first_page_latencies: List[float] = []  # Recent time to first usable page, seconds
+
         BrowserManager._initialized = True
 
     async def register_client(self) -> None:
@@ -66,7 +83,11 @@ class BrowserManager:
 
             # Auto close browser if no active clients
             if self._client_refs == 0 and self._initialized:
-                await self.close()
+                if self.config.context_pool_size > 0 and self._context_pool:
+                    # Keep the browser and its pre-warmed contexts for the next client
+                    await self._close_unpooled_contexts()
+                else:
+                    await self.close()
 
     async def initialize(self, config: DelightfulBrowserConfig = None) -> None:
         """Initialize browser instance
@@ -111,6 +132,12 @@ class BrowserManager:
 
                 logger.info(f"Browser started: {self.config.browser_type}")
                 self._initialized = True
+
+                # Resolve the JS module bundle once instead of per context
+                try:
+                    build_module_bundle()
+                except Exception as e:
+                    logger.error(f"Failed to build JavaScript module bundle: {e}")
             except Exception as e:
                 logger.error(f"Failed to start browser: {e}")
                 if self._playwright:
@@ -121,7 +148,8 @@ class BrowserManager:
     async def get_context(self, config: Optional[DelightfulBrowserConfig] = None) -> tuple[str, BrowserContext]:
         """Get or create browser context
 
-        If browser is not initialized yet, initialize it first
+        If browser is not initialized yet, initialize it first. A pre-warmed context created with the same
+        configuration is handed out when available, and the pool is refilled in the background.
 
         Args:
             config: Browser configuration, if None use manager's default configuration
@@ -132,10 +160,37 @@ class BrowserManager:
         if not self._initialized:
             await self.initialize(config)
 
-        # Create a new context
-        context_id = self._generate_context_id()
         context_config = config or self.config
+        await self._discard_stale_pooled_contexts(context_config)
+        pooled = self._take_pooled_context(context_config)
+        if pooled:
+            context_id, context = pooled
+            self._pool_hits += 1
+            self._start_storage_state_saving(context_id, context_config)
+            logger.info(f"Using pre-warmed browser context: {context_id}")
+        else:
+            if context_config.context_pool_size > 0:
+                self._pool_misses += 1
+            context_id, context = await self._create_context(context_config)
+
+        self._schedule_pool_fill(context_config)
+        return context_id, context
+
+    async def _create_context(self, context_config: DelightfulBrowserConfig, pooled: bool = False) -> tuple[str, BrowserContext]:
+        """Create and register a browser context with init scripts injected
+
+        Args:
+            context_config: Browser configuration
+            pooled: Whether the context is created for the pool
+
+        Returns:
+            tuple: (context ID, context object)
+        """
+        context_id = self._generate_context_id()
         context_options = await context_config.to_context_options()
+        if pooled:
+            # Remember which version of the storage state the context starts from
+            self._pooled_storage_states[context_id] = self._get_storage_state_mtime(context_config)
 
         # Create context
         context = await self._browser.new_context(**context_options)
@@ -202,22 +257,195 @@ class BrowserManager:
         except Exception as e:
             logger.error(f"Failed to inject anti-fingerprint JS: {e}")
 
+        # Preload JS modules into every page of the context
+        try:
+            await context.add_init_script(build_module_bundle())
+            self._preloaded_modules[context_id] = PRELOADED_MODULES
+        except Exception as e:
+            logger.error(f"Failed to inject JavaScript module bundle, modules will be loaded per page: {e}")
+
         # Register context
         self._contexts[context_id] = context
 
-        # Schedule periodic storage state saving
+        # Idle pooled contexts must not overwrite the storage state of contexts in use
+        if not pooled:
+            self._start_storage_state_saving(context_id, context_config)
+
+        logger.info(f"Created browser context: {context_id}{' (pooled)' if pooled else ''}")
+        return context_id, context
+
+    def _start_storage_state_saving(self, context_id: str, context_config: DelightfulBrowserConfig) -> None:
+        """Schedule periodic storage state saving for a context in use"""
         if context_config.storage_state_file:
             save_task = asyncio.create_task(self._periodic_save_storage_state(context_id))
             self._storage_save_tasks[context_id] = save_task
 
-        logger.info(f"Created browser context: {context_id}")
-        return context_id, context
+    @staticmethod
+    def _get_storage_state_mtime(context_config: DelightfulBrowserConfig) -> Optional[int]:
+        """Get the modification time (ns) of the storage state file, None if there is none"""
+        if not context_config.storage_state_file:
+            return None
+        try:
+            return os.stat(context_config.storage_state_file).st_mtime_ns
+        except OSError:
+            return None
+
+    async def _discard_stale_pooled_contexts(self, context_config: DelightfulBrowserConfig) -> None:
+        """Close pooled contexts whose storage state file was saved again after they were created
+
+        Contexts in use keep saving cookies and logins until they are closed, a context pre-warmed before
+        those saves would hand out (and later write back) the older state.
+        """
+        if not context_config.storage_state_file:
+            return
+        current_mtime = self._get_storage_state_mtime(context_config)
+        for context_id, pooled_config in list(self._context_pool):
+            if pooled_config == context_config and self._pooled_storage_states.get(context_id) != current_mtime:
+                logger.info(f"Storage state changed since pre-warming context {context_id}, discarding it")
+                await self.close_context(context_id)
+
+    def _take_pooled_context(self, context_config: DelightfulBrowserConfig) -> Optional[tuple[str, BrowserContext]]:
+        """Take a pre-warmed context created with an equal configuration from the pool"""
+        for index, (context_id, pooled_config) in enumerate(self._context_pool):
+            context = self._contexts.get(context_id)
+            if context is None:
+                continue
+            if pooled_config == context_config:
+                del self._context_pool[index]
+                self._pooled_storage_states.pop(context_id, None)
+                return context_id, context
+        return None
+
+    def _schedule_pool_fill(self, context_config: DelightfulBrowserConfig) -> None:
+        """Refill the context pool in the background"""
+        if context_config.context_pool_size <= 0:
+            return
+        if self._pool_fill_task and not self._pool_fill_task.done():
+            return
+        self._pool_fill_task = asyncio.create_task(self._fill_pool(context_config))
+
+    async def _fill_pool(self, context_config: DelightfulBrowserConfig) -> None:
+        """Create pre-warmed contexts, each with a blank page, until the pool is full or memory is exhausted"""
+        try:
+            while self._initialized and self._browser:
+                # Drop entries whose context was closed meanwhile
+                self._context_pool = [entry for entry in self._context_pool if entry[0] in self._contexts]
+                if sum(1 for _, pooled_config in self._context_pool if pooled_config == context_config) >= context_config.context_pool_size:
+                    return
+
+                memory_mb = self._get_browser_memory_mb()
+                if context_config.pool_max_memory_mb and memory_mb > context_config.pool_max_memory_mb:
+                    logger.info(f"Browser memory {memory_mb:.0f}MB exceeds {context_config.pool_max_memory_mb}MB, not refilling context pool")
+                    return
+
+                started_at = time.monotonic()
+                context_id, context = await self._create_context(context_config, pooled=True)
+                self._warm_pages[context_id] = await context.new_page()
+                self._context_pool.append((context_id, context_config))
+                logger.debug(f"Pre-warmed browser context {context_id} in {time.monotonic() - started_at:.2f}s")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to pre-warm browser context: {e}")
+
+    def _get_browser_memory_mb(self) -> float:
+        """Get the RSS of all browser processes started by Playwright, in MB"""
+        total = 0
+        try:
+            for process in psutil.Process().children(recursive=True):
+                try:
+                    name = process.name().lower()
+                    if "chrom" in name or "headless_shell" in name or "firefox" in name or "webkit" in name:
+                        total += process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+        except psutil.Error as e:
+            logger.debug(f"Failed to measure browser memory: {e}")
+        return total / (1024 * 1024)
+
+    def take_warm_page(self, context_id: str) -> Optional[Page]:
+        """Take the blank page pre-created with a pooled context
+
+        Args:
+            context_id: Context ID
+
+        Returns:
+            Optional[Page]: Page, None if the context has no unused warm page
+        """
+        page = self._warm_pages.pop(context_id, None)
+        if page and page.is_closed():
+            return None
+        return page
+
+    def record_navigation(self, context_id: str) -> None:
+        """Count a navigation in a context
+
+        Args:
+            context_id: Context ID
+        """
+        self._navigation_counts[context_id] = self._navigation_counts.get(context_id, 0) + 1
+
+    def should_recycle(self, context_id: str, config: Optional[DelightfulBrowserConfig] = None) -> bool:
+        """Check whether a context reached its navigation limit and new pages should use a fresh context
+
+        Args:
+            context_id: Context ID
+            config: Browser configuration, if None use manager's default configuration
+
+        Returns:
+            bool: True if the context should be recycled
+        """
+        max_navigations = (config or self.config).context_max_navigations
+        return max_navigations > 0 and self._navigation_counts.get(context_id, 0) >= max_navigations
+
+    def record_context_recycled(self) -> None:
+        """Count a context retired for reaching its navigation limit"""
+        self._contexts_recycled += 1
+
+    def record_first_page_latency(self, seconds: float) -> None:
+        """Record the time a browser client waited for its first usable page
+
+        Args:
+            seconds: Latency in seconds
+        """
+        self._first_page_latencies.append(seconds)
+        # Keep recent samples only
+        del self._first_page_latencies[:-100]
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get context pool statistics
+
+        Returns:
+            Dict: Pool size, hit/miss counters, recycling and first page latency metrics
+        """
+        latencies = self._first_page_latencies
+        return {
+            "contexts": len(self._contexts),
+            "pooled_contexts": len(self._context_pool),
+            "pool_hits": self._pool_hits,
+            "pool_misses": self._pool_misses,
+            "contexts_recycled": self._contexts_recycled,
+            "browser_memory_mb": round(self._get_browser_memory_mb(), 1) if self._initialized else 0.0,
+            "first_page_latency_last": round(latencies[-1], 3) if latencies else None,
+            "first_page_latency_avg": round(sum(latencies) / len(latencies), 3) if latencies else None,
+        }
 
     def _generate_context_id(self) -> str:
         """Generate unique context ID"""
         self._context_counter += 1
         return f"ctx_{self._context_counter}"
 
+    def get_preloaded_modules(self, context_id: str) -> Tuple[str, ...]:
+        """Get JS modules preloaded into the pages of a context
+
+        Args:
+            context_id: Context ID
+
+        Returns:
+            Tuple[str, ...]: Module names, empty if the bundle was not injected
+        """
+        return self._preloaded_modules.get(context_id, ())
+
     async def get_context_by_id(self, context_id: str) -> Optional[BrowserContext]:
         """Get browser context by ID
 
@@ -288,8 +516,11 @@ class BrowserManager:
                 except Exception as e:
                     logger.error(f"Error while waiting for save task of context {context_id}: {e}")
 
-            # Save final storage state before removal
-            if self.config and self.config.storage_state_file:
+            # Save final storage state before removal, idle pooled contexts hold no newer state
+            pooled = any(entry[0] == context_id for entry in self._context_pool)
+            if pooled:
+                logger.debug(f"Context {context_id} is an unused pooled context; skipping final state save.")
+            elif self.config and self.config.storage_state_file:
                 try:
                     logger.debug(f"Attempting to save final storage state for context {context_id}...")
                     # Save using the context object directly
@@ -302,6 +533,11 @@ class BrowserManager:
 
             # Remove context ID from dictionary
             self._contexts.pop(context_id, None)
+            self._preloaded_modules.pop(context_id, None)
+            self._navigation_counts.pop(context_id, None)
+            self._warm_pages.pop(context_id, None)
+            self._pooled_storage_states.pop(context_id, None)
+            self._context_pool = [entry for entry in self._context_pool if entry[0] != context_id]
 
             # Close context
             try:
@@ -312,6 +548,14 @@ class BrowserManager:
         else:
             logger.warning(f"Attempted to close a non-existent or already closed context: {context_id}")
 
+    async def _close_unpooled_contexts(self) -> None:
+        """Close all contexts that were handed out to clients"""
+        pooled_ids = {context_id for context_id, _ in self._context_pool}
+        for context_id in list(self._contexts.keys()):
+            if context_id not in pooled_ids:
+                await self.close_context(context_id)
+        logger.info(f"All browser clients released, keeping {len(pooled_ids)} pre-warmed contexts")
+
     async def close(self) -> None:
         """Close the browser and Playwright
 
@@ -321,6 +565,15 @@ class BrowserManager:
             return
 
         try:
+            # Stop refilling the pool before its contexts are closed
+            if self._pool_fill_task and not self._pool_fill_task.done():
+                self._pool_fill_task.cancel()
+                try:
+                    await self._pool_fill_task
+                except asyncio.CancelledError:
+                    pass
+            self._pool_fill_task = None
+
             # Close all contexts
             context_ids = list(self._contexts.keys())
             for context_id in context_ids:
@@ -11,6 +11,7 @@ import logging
 import os
 import re
 import tempfile
+import time
 import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Literal
@@ -129,6 +130,9 @@ class DelightfulBrowser:
         self._managed_page_ids: set[str] = set()
         self._initialized: bool = False
         self._temp_files: List[Path] = [] # For managing temporary screenshot files
+        self._retired_context_id: Optional[str] = None # Context replaced after reaching its navigation limit
+        self._init_started_at: Optional[float] = None # For the time to first usable page metric
+        self._first_page_ready: bool = False
 
         # --- Temporary screenshot directory ---
         self._TEMP_SCREENSHOT_DIR: Optional[Path] = None
@@ -152,6 +156,7 @@ class DelightfulBrowser:
         if self._initialized:
             return
 
+        self._init_started_at = time.monotonic()
         try:
             # Initialize browser manager
             await self._browser_manager.initialize(self.config)
@@ -194,24 +199,65 @@ class DelightfulBrowser:
                 logger.warning("No context ID specified and no active context, creating new context")
                 use_context_id = await self.new_context()
 
+            # Move new pages to a fresh context once the active one reached its navigation limit
+            if not context_id and self._browser_manager.should_recycle(use_context_id, self.config):
+                use_context_id = await self._recycle_active_context()
+
             context = await self._browser_manager.get_context_by_id(use_context_id)
             if not context:
                 raise ValueError(f"Context does not exist: {use_context_id}")
 
-            page = await context.new_page()
-            page_id = await self._page_registry.register_page(page, use_context_id)
+            # Use the blank page pre-created with a pooled context when available
+            page = self._browser_manager.take_warm_page(use_context_id) or await context.new_page()
+            page_id = await self._page_registry.register_page(
+                page, use_context_id, self._browser_manager.get_preloaded_modules(use_context_id)
+            )
             self._managed_page_ids.add(page_id)
             self._active_page_id = page_id
             self._active_context_id = use_context_id # Update active context ID
 
             # PageRegistry's internal handle_page_load_and_script_injection will handle JS loading
 
+            if not self._first_page_ready and self._init_started_at is not None:
+                self._first_page_ready = True
+                latency = time.monotonic() - self._init_started_at
+                self._browser_manager.record_first_page_latency(latency)
+                logger.info(f"Time to first usable page: {latency:.3f}s")
+
             logger.info(f"Created new page and set as active: {page_id} (context: {use_context_id})")
             return page_id
         except Exception as e:
             logger.error(f"Failed to create page: {e}", exc_info=True)
             raise # Page creation failure is considered a critical error
 
+    async def _recycle_active_context(self) -> str:
+        """Switch to a fresh context, carrying over cookies, to cap the memory growth of long-lived contexts
+
+        The replaced context stays open so its pages remain usable; the context replaced before it is closed.
+
+        Returns:
+            str: ID of the new active context
+        """
+        old_context_id = self._active_context_id
+        old_context = await self._browser_manager.get_context_by_id(old_context_id)
+        new_context_id = await self.new_context()
+
+        if old_context:
+            try:
+                new_context = await self._browser_manager.get_context_by_id(new_context_id)
+                cookies = await old_context.cookies()
+                if cookies:
+                    await new_context.add_cookies(cookies)
+            except Exception as e:
+                logger.warning(f"Failed to carry cookies over to recycled context {new_context_id}: {e}")
+
+        if self._retired_context_id:
+            await self._browser_manager.close_context(self._retired_context_id)
+        self._retired_context_id = old_context_id
+        self._browser_manager.record_context_recycled()
+        logger.info(f"Context {old_context_id} reached its navigation limit, new pages use context {new_context_id}")
+        return new_context_id
+
     async def ensure_js_module_loaded(self, page_id: str, module_names: Union[str, List[str]]) -> Dict[str, bool]:
         """Ensure specified page has loaded JS modules
 
@@ -296,6 +342,8 @@ class DelightfulBrowser:
             if context_id: self._active_context_id = context_id
 
             logger.info(f"{operation_name}: Page {actual_page_id} navigating to {url}")
+            if self._active_context_id:
+                self._browser_manager.record_navigation(self._active_context_id)
             await page.goto(url, wait_until=wait_until, timeout=60000) # Increase timeout
             await self._wait_for_stable_network(page)
 
@@ -799,6 +847,10 @@ class DelightfulBrowser:
             self._active_page_id = None
             logger.info("All managed pages requested to close and unregistered.")
 
+            if self._retired_context_id:
+                await self._browser_manager.close_context(self._retired_context_id)
+                self._retired_context_id = None
+
             # Unregister browser client reference
             await self._browser_manager.unregister_client()
             self._active_context_id = None
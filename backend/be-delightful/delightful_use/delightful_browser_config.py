@@ -126,6 +126,15 @@ class DelightfulBrowserConfig:
     # Browser permissions list
     permissions: Optional[List[str]] = None
 
+    # Number of pre-warmed contexts (each with a blank page) kept ready, 0 disables the pool
+    context_pool_size: int = 1
+
+    # Navigations after which new pages move to a fresh context, 0 disables recycling
+    context_max_navigations: int = 50
+
+    # Browser memory (RSS of all browser processes, MB) above which the pool is not refilled, 0 for no limit
+    pool_max_memory_mb: int = 2048
+
     def __post_init__(self):
         """Post-initialization processing"""
         # Set default download path
@@ -630,7 +630,7 @@
                   .replace(/\s+/g, ' ')  // Merge multiple spaces
                   .trim();
               }
-            } catch (e) { /* Process
+            } catch (e) { /* Invalid URL, ignore */ }
           }
           return null; // Extract
         }
@@ -8,28 +8,151 @@ import glob
 import logging
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from playwright.async_api import Page
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# JS file directory
+JS_DIR = Path(__file__).parent / "js"
+# Modules preloaded into every page of a browser context through the init script bundle
+PRELOADED_MODULES: Tuple[str, ...] = ("lens", "marker", "pure", "touch")
+# Pages where context init scripts do not run, modules are loaded on demand there
+_BUILTIN_URL_PREFIXES = ('chrome://', 'chrome-error://', 'about:', 'edge://', 'firefox://')
+
+
+def parse_dependencies(js_code: str) -> List[str]:
+    """Parse dependency declarations from JS code.
+
+    Looks for comments like // @depends: module1, module2
+
+    Args:
+        js_code: JavaScript code
+
+    Returns:
+        List of dependency module names
+    """
+    dependencies = []
+    # Regex to match dependency declaration comment
+    pattern = r'//\s*@depends:\s*([\w\s,]+)'
+    matches = re.search(pattern, js_code)
+
+    if matches:
+        # Parse and trim dependency names
+        deps_str = matches.group(1)
+        for dep in deps_str.split(','):
+            dep_name = dep.strip()
+            if dep_name:
+                dependencies.append(dep_name)
+
+    return dependencies
+
+
+@lru_cache(maxsize=None)
+def read_module_source(module_name: str) -> str:
+    """Read the code of a JS module, cached for the lifetime of the process.
+
+    Args:
+        module_name: Module name, matching filename under js/ (without .js extension)
+
+    Returns:
+        str: Module code
+
+    Raises:
+        FileNotFoundError: If the module file does not exist
+    """
+    js_path = JS_DIR / f"{module_name}.js"
+    if not js_path.exists():
+        logger.error(f"JavaScript module file not found: {js_path}")
+        raise FileNotFoundError(f"JavaScript module file not found: {js_path}")
+    return js_path.read_text(encoding="utf-8")
+
+
+def resolve_module_order(module_names: Iterable[str]) -> List[str]:
+    """Resolve modules and their dependencies into load order, dependencies first.
+
+    Args:
+        module_names: Modules to load
+
+    Returns:
+        List of module names in load order
+
+    Raises:
+        ValueError: If the dependencies are circular
+    """
+    ordered: List[str] = []
+    visiting: Set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in ordered:
+            return
+        if name in visiting:
+            raise ValueError(f"Circular dependency detected: {name}")
+        visiting.add(name)
+        for dep in parse_dependencies(read_module_source(name)):
+            visit(dep)
+        visiting.remove(name)
+        ordered.append(name)
+
+    for module_name in module_names:
+        visit(module_name)
+    return ordered
+
+
+@lru_cache(maxsize=None)
+def build_module_bundle(module_names: Tuple[str, ...] = PRELOADED_MODULES) -> str:
+    """Build an init script that defines modules and their dependencies in every new document.
+
+    Registered with BrowserContext.add_init_script, so the modules exist before page scripts run and
+    no per-page evaluate round-trips are needed. Init scripts are not subject to the page CSP.
+    Runs in the top frame only, like modules loaded with page.evaluate.
+
+    Args:
+        module_names: Modules to include
+
+    Returns:
+        str: Bundle script
+    """
+    parts = [
+        "(function() {",
+        "    if (window !== window.top) return;",
+        "    window.BeDelightful = window.BeDelightful || { 'version': '0.0.1' };",
+        "    window.DelightfulUse = window.DelightfulUse || {};",
+    ]
+    for module_name in resolve_module_order(module_names):
+        parts.append(f"""    try {{
+        (function() {{
+{read_module_source(module_name)}
+        }})();
+        window.DelightfulUse['{module_name}'] = true;
+    }} catch (error) {{
+        console.error('Error executing module {module_name}:', error);
+    }}""")
+    parts.append("})();")
+    bundle = "\n".join(parts)
+    logger.info(f"Built JavaScript module bundle: {', '.join(module_names)} ({len(bundle)} chars)")
+    return bundle
+
 
 class JSLoader:
     """JavaScript loader responsible for loading and managing JS code."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, preloaded_modules: Iterable[str] = ()):
         """Initialize the JS loader.
 
         Args:
             page: Playwright page object
+            preloaded_modules: Modules injected by the context init script, no existence check is needed for them
         """
         self.page = page
         self._js_code = {}    # Store code for each module
-        self._js_dir = Path(__file__).parent / "js"  # JS file directory
+        self._js_dir = JS_DIR  # JS file directory
         self._loading_modules = set()  # Modules currently loading, used to detect circular dependencies
+        self._preloaded_modules = frozenset(preloaded_modules)
 
         # Ensure JS directory exists
         os.makedirs(self._js_dir, exist_ok=True)
@@ -45,20 +168,7 @@ class JSLoader:
         Returns:
             List of dependency module names
         """
-        dependencies = []
-        # Regex to match dependency declaration comment
-        pattern = r'//\s*@depends:\s*([\w\s,]+)'
-        matches = re.search(pattern, js_code)
-
-        if matches:
-            # Parse and trim dependency names
-            deps_str = matches.group(1)
-            for dep in deps_str.split(','):
-                dep_name = dep.strip()
-                if dep_name:
-                    dependencies.append(dep_name)
-
-        return dependencies
+        return parse_dependencies(js_code)
 
     async def load_module(self, module_name: str, force_reload: bool = False) -> bool:
         """Load a JavaScript module; by default load only if missing.
@@ -77,6 +187,14 @@ class JSLoader:
                 logger.error(f"Circular dependency detected: {module_name}")
                 return False
 
+            # Modules from the init script bundle exist in every regular document of the page
+            if (
+                not force_reload
+                and module_name in self._preloaded_modules
+                and not self.page.url.startswith(_BUILTIN_URL_PREFIXES)
+            ):
+                return True
+
             # Check if module already loaded unless forcing reload
             if not force_reload:
                 check_exists_script = f"""() => {{
@@ -90,12 +208,7 @@ class JSLoader:
                     return True
 
             # Load JavaScript code from file
-            js_path = self._js_dir / f"{module_name}.js"
-            if not js_path.exists():
-                logger.error(f"JavaScript module file not found: {js_path}")
-                raise FileNotFoundError(f"JavaScript module file not found: {js_path}")
-
-            js_code = js_path.read_text(encoding="utf-8")
+            js_code = read_module_source(module_name)
             self._js_code[module_name] = js_code
 
             # Parse dependencies
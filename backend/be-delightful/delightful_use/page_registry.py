@@ -8,7 +8,7 @@ responsible for page registration, unregistration and state tracking.
 import asyncio
 import logging
 import math
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 
 from pydantic import BaseModel, Field
 from playwright.async_api import Page
@@ -99,12 +99,13 @@ class PageRegistry:
         self._page_counter += 1
         return f"page_{self._page_counter}"
 
-    async def register_page(self, page: Page, context_id: Optional[str] = None) -> str:
+    async def register_page(self, page: Page, context_id: Optional[str] = None, preloaded_modules: Iterable[str] = ()) -> str:
         """Register page
 
         Args:
             page: Playwright page object
             context_id: Context ID to which the page belongs, can be None
+            preloaded_modules: JS modules injected into the page by the context init script
 
         Returns:
             str: Page ID
@@ -114,7 +115,7 @@ class PageRegistry:
             self._pages[page_id] = page
 
             # Create and associate JS loader
-            self._js_loaders[page_id] = JSLoader(page)
+            self._js_loaders[page_id] = JSLoader(page, preloaded_modules)
 
             # Record the context to which the page belongs, if any
             if context_id:
@@ -4,6 +4,7 @@ Configuration package
 from app.config.constants import (
     SANDBOX_LABEL,
     AGENT_LABEL_PREFIX,
+    POOL_AGENT_LABEL_PREFIX,
     QDRANT_LABEL,
     QDRANT_LABEL_PREFIX,
     WS_MESSAGE_TYPE_ERROR,
@@ -20,6 +21,7 @@ __all__ = [
     "settings",
     "SANDBOX_LABEL",
     "AGENT_LABEL_PREFIX",
+    "POOL_AGENT_LABEL_PREFIX",
     "QDRANT_LABEL",
     "QDRANT_LABEL_PREFIX",
     "WS_MESSAGE_TYPE_ERROR",
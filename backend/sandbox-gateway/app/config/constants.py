@@ -8,6 +8,8 @@ SANDBOX_LABEL = "sandbox_id"
 
 AGENT_LABEL = "agent_id"
 AGENT_LABEL_PREFIX = "sandbox-agent-"
+# Name prefix of pre-started agent containers that have not been claimed yet
+POOL_AGENT_LABEL_PREFIX = "sandbox-pool-"
 
 # Qdrant container labels
 QDRANT_LABEL = "qdrant_id"
@@ -47,6 +47,18 @@ class Settings(BaseSettings):
     qdrant_grpc_port: int = Field(6334, env="QDRANT_GRPC_PORT")
     qdrant_label: str = Field("qdrant", env="QDRANT_LABEL")
     
+    # Maximum number of threads running blocking Docker SDK calls
+    docker_executor_workers: int = Field(8, env="DOCKER_EXECUTOR_WORKERS")
+    # Maximum age of the cached container inventory before a full re-scan (seconds)
+    container_inventory_ttl: float = Field(5.0, env="CONTAINER_INVENTORY_TTL")
+
+    # Warm sandbox pool configuration, 0 disables the pool
+    sandbox_pool_size: int = Field(0, env="SANDBOX_POOL_SIZE")
+    # Maximum age of an unclaimed pooled sandbox before it is recycled (seconds)
+    sandbox_pool_max_age: int = Field(3600, env="SANDBOX_POOL_MAX_AGE")
+    # Interval of the pool health check and refill loop (seconds)
+    sandbox_pool_check_interval: int = Field(30, env="SANDBOX_POOL_CHECK_INTERVAL")
+
     # Agent environment file configuration - required
     agent_env_file_path: str = Field(..., env="AGENT_ENV_FILE_PATH")
     
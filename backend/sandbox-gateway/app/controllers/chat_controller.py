@@ -31,13 +31,13 @@ async def proxy_chat_history_download(request: Request, sandbox_id: str) -> Stre
     """
     try:
         # Get sandbox container
-        container = sandbox_service._get_agent_container_by_sandbox_id(sandbox_id)
-        if not container:
+        entry = await sandbox_service.inventory.get_agent(sandbox_id)
+        if not entry:
             logger.error(f"Cannot find sandbox container: {sandbox_id}")
             raise HTTPException(status_code=404, detail=f"Cannot find sandbox {sandbox_id}")
             
         # Get container information
-        container_info = sandbox_service._get_container_info(container)
+        container_info = entry.info
         
         # Build API request URL
         target_url = f"http://{container_info.ip}:{container_info.ws_port}/api/chat-history/download"
@@ -2,10 +2,12 @@
 Health check controller
 """
 import logging
-from typing import Dict
+from typing import Any, Dict
 
 from fastapi import APIRouter
 
+from app.services.sandbox_service import sandbox_service
+
 logger = logging.getLogger("sandbox_gateway")
 
 # Create API router
@@ -38,4 +40,15 @@ async def health_check() -> Dict[str, str]:
     return {
         "status": "healthy",
         "message": "Service is running normally"
-    } 
\ No newline at end of file
+    }
+
+
+@router.get("/health/pool")
+async def pool_stats() -> Dict[str, Any]:
+    """
+    Warm sandbox pool metrics
+
+    Returns:
+        Dict: Pool size, hits, misses and claim latency
+    """
+    return sandbox_service.pool.get_stats()
@@ -50,7 +50,7 @@ async def list_sandboxes() -> SandboxListResponse:
     Returns:
         SandboxListResponse: Sandbox container list response
     """
-    sandboxes = sandbox_service.list_sandboxes()
+    sandboxes = await sandbox_service.list_sandboxes()
     return SandboxListResponse(data=sandboxes)
 
 
@@ -65,7 +65,7 @@ async def get_agent_container(sandbox_id: str) -> SandboxDetailResponse:
     Returns:
         SandboxDetailResponse: Sandbox container information response
     """
-    sandbox = sandbox_service.get_agent_container(sandbox_id)
+    sandbox = await sandbox_service.get_agent_container(sandbox_id)
     if not sandbox:
         return SandboxDetailResponse(
             code=4004,
@@ -85,7 +85,7 @@ async def delete_sandbox(sandbox_id: str) -> SandboxDeleteResponse:
     Returns:
         SandboxDeleteResponse: Delete operation response
     """
-    sandbox_service.delete_sandbox(sandbox_id)
+    await sandbox_service.delete_sandbox(sandbox_id)
     return SandboxDeleteResponse(
         data=DeleteResponse(
             message=f"Sandbox {sandbox_id} deleted successfully"
@@ -0,0 +1,185 @@
+"""
+Container inventory
+
+Caches sandbox containers indexed by their agent and Qdrant labels, so read-only endpoints do not
+issue a Docker `containers.list` per request. The inventory is refreshed with one full scan when it
+is older than the configured TTL, and single sandboxes are re-scanned after the gateway changes them.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import docker
+
+from app.config import QDRANT_LABEL, SANDBOX_LABEL
+from app.config.constants import AGENT_LABEL
+from app.models.sandbox import ContainerInfo
+
+if TYPE_CHECKING:
+    from app.services.sandbox_service import SandboxService
+
+logger = logging.getLogger("sandbox_gateway")
+
+
+@dataclass
+class InventoryEntry:
+    """Cached container together with the information derived from its last inspect"""
+    container: docker.models.containers.Container
+    info: ContainerInfo
+
+    @property
+    def name(self) -> str:
+        return self.container.name
+
+
+class ContainerInventory:
+    """Label-indexed cache of sandbox containers"""
+
+    def __init__(self, service: "SandboxService", ttl: float):
+        """
+        Initialize container inventory
+
+        Args:
+            service: Sandbox service providing the Docker client and executor
+            ttl: Maximum age of the inventory before a full re-scan (seconds)
+        """
+        self.service = service
+        self.ttl = ttl
+        self._agents: Dict[str, InventoryEntry] = {}
+        self._qdrants: Dict[str, InventoryEntry] = {}
+        self._refreshed_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+
+    async def get_agent(self, sandbox_id: str) -> Optional[InventoryEntry]:
+        """
+        Get the agent container of a sandbox
+
+        A miss triggers a targeted re-scan, so containers created by another process are still found.
+
+        Args:
+            sandbox_id: Sandbox ID
+
+        Returns:
+            Optional[InventoryEntry]: Cached agent container, None if the sandbox does not exist
+        """
+        await self.ensure_fresh()
+        entry = self._agents.get(sandbox_id)
+        if entry is None:
+            await self.refresh_sandbox(sandbox_id)
+            entry = self._agents.get(sandbox_id)
+        return entry
+
+    async def get_qdrant(self, sandbox_id: str) -> Optional[InventoryEntry]:
+        """
+        Get the Qdrant container of a sandbox
+
+        Args:
+            sandbox_id: Sandbox ID
+
+        Returns:
+            Optional[InventoryEntry]: Cached Qdrant container, None if it does not exist
+        """
+        await self.ensure_fresh()
+        return self._qdrants.get(sandbox_id)
+
+    async def list_agents(self) -> Dict[str, InventoryEntry]:
+        """
+        List all agent containers
+
+        Returns:
+            Dict[str, InventoryEntry]: Agent containers keyed by sandbox ID
+        """
+        await self.ensure_fresh()
+        return dict(self._agents)
+
+    async def list_all(self) -> List[InventoryEntry]:
+        """
+        List all sandbox containers, agent and Qdrant
+
+        Returns:
+            List[InventoryEntry]: Cached containers
+        """
+        await self.ensure_fresh()
+        return list(self._agents.values()) + list(self._qdrants.values())
+
+    async def ensure_fresh(self) -> None:
+        """Re-scan all containers if the inventory is older than the TTL"""
+        if time.monotonic() - self._refreshed_at > self.ttl:
+            await self.refresh()
+
+    async def refresh(self) -> None:
+        """Re-scan all sandbox containers"""
+        requested_at = time.monotonic()
+        async with self._refresh_lock:
+            # Another caller finished a full scan while we were waiting
+            if self._refreshed_at >= requested_at:
+                return
+            try:
+                agents, qdrants = await self.service._docker(self._scan, {"label": [SANDBOX_LABEL]})
+            except Exception as e:
+                logger.error(f"Error refreshing container inventory: {e}")
+                return
+            self._agents = agents
+            self._qdrants = qdrants
+            self._refreshed_at = time.monotonic()
+
+    async def refresh_sandbox(self, sandbox_id: str) -> None:
+        """
+        Re-scan the containers of one sandbox
+
+        Args:
+            sandbox_id: Sandbox ID
+        """
+        try:
+            agents, qdrants = await self.service._docker(self._scan, {"label": [f"{SANDBOX_LABEL}={sandbox_id}"]})
+        except Exception as e:
+            logger.error(f"Error refreshing containers of sandbox {sandbox_id}: {e}")
+            return
+        self._update_entry(self._agents, sandbox_id, agents.get(sandbox_id))
+        self._update_entry(self._qdrants, sandbox_id, qdrants.get(sandbox_id))
+
+    def discard(self, sandbox_id: str) -> None:
+        """
+        Drop a sandbox from the inventory
+
+        Args:
+            sandbox_id: Sandbox ID
+        """
+        self._agents.pop(sandbox_id, None)
+        self._qdrants.pop(sandbox_id, None)
+
+    @staticmethod
+    def _update_entry(index: Dict[str, InventoryEntry], sandbox_id: str, entry: Optional[InventoryEntry]) -> None:
+        if entry is None:
+            index.pop(sandbox_id, None)
+        else:
+            index[sandbox_id] = entry
+
+    def _scan(self, filters: Dict) -> Tuple[Dict[str, InventoryEntry], Dict[str, InventoryEntry]]:
+        """
+        List containers and build label indexes, runs in the Docker executor
+
+        Args:
+            filters: Docker list filters
+
+        Returns:
+            Tuple: (agent entries, Qdrant entries), both keyed by sandbox ID
+        """
+        agents: Dict[str, InventoryEntry] = {}
+        qdrants: Dict[str, InventoryEntry] = {}
+        # containers.list already inspects every container, no reload needed
+        for container in self.service.docker_client.containers.list(all=True, filters=filters):
+            try:
+                info = self.service._get_container_info(container, reload=False)
+            except Exception as e:
+                logger.error(f"Error reading container {container.name}: {e}")
+                continue
+            labels = container.labels or {}
+            if labels.get(AGENT_LABEL):
+                agents[labels[AGENT_LABEL]] = InventoryEntry(container=container, info=info)
+            elif labels.get(QDRANT_LABEL):
+                qdrants[labels[QDRANT_LABEL]] = InventoryEntry(container=container, info=info)
+        return agents, qdrants
+
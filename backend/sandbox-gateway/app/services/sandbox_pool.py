@@ -0,0 +1,291 @@
+"""
+Warm sandbox pool
+
+Keeps a number of pre-started, health-checked agent and Qdrant container pairs so that
+create_sandbox does not pay container cold start. A pooled sandbox already owns its sandbox ID
+(container labels, environment and the Qdrant host name are bound to it at creation), so the pool
+serves requests that do not ask for a specific sandbox ID.
+
+Unclaimed agent containers are named with POOL_AGENT_LABEL_PREFIX and renamed to AGENT_LABEL_PREFIX
+on claim, which keeps them out of sandbox listings and idle cleanup until they are handed out.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Set
+
+from app.config import (
+    AGENT_LABEL_PREFIX,
+    POOL_AGENT_LABEL_PREFIX,
+    QDRANT_LABEL,
+    settings
+)
+from app.config.constants import AGENT_LABEL
+
+if TYPE_CHECKING:
+    from app.services.sandbox_service import SandboxService
+
+logger = logging.getLogger("sandbox_gateway")
+
+
+@dataclass
+class PooledSandbox:
+    """Pre-started sandbox waiting to be claimed"""
+    sandbox_id: str
+    created_at: float
+
+
+class SandboxPool:
+    """Pool of pre-started sandboxes, refilled in the background"""
+
+    def __init__(self, service: "SandboxService", size: int):
+        """
+        Initialize sandbox pool
+
+        Args:
+            service: Sandbox service used to create and remove containers
+            size: Number of sandboxes to keep ready, 0 disables the pool
+        """
+        self.service = service
+        self.size = max(0, size)
+        self.max_age = settings.sandbox_pool_max_age
+        self.check_interval = settings.sandbox_pool_check_interval
+
+        self._ready: Deque[PooledSandbox] = deque()
+        # Sandboxes owned by the pool, from creation until they are claimed or discarded
+        self._unclaimed: Set[str] = set()
+        self._creating = 0
+        self._refill_event = asyncio.Event()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._create_tasks: Set[asyncio.Task] = set()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.create_failures = 0
+        self.recycled = 0
+        self._claim_count = 0
+        self._claim_latency_total_ms = 0.0
+        self._claim_latency_max_ms = 0.0
+        self._last_claim_latency_ms = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the pool is configured"""
+        return self.size > 0
+
+    def start(self) -> None:
+        """Remove leftovers from a previous run and start the background refill loop"""
+        if not self.enabled or self._refill_task:
+            return
+        self._refill_task = asyncio.create_task(self._refill_loop())
+        logger.info(f"Sandbox pool started, target size: {self.size}")
+
+    async def stop(self) -> None:
+        """Stop the refill loop and remove unclaimed sandboxes"""
+        if self._refill_task:
+            self._refill_task.cancel()
+            try:
+                await self._refill_task
+            except asyncio.CancelledError:
+                pass
+            self._refill_task = None
+        for task in list(self._create_tasks):
+            task.cancel()
+        while self._ready:
+            await self._discard(self._ready.popleft().sandbox_id)
+
+    def is_unclaimed(self, sandbox_id: str) -> bool:
+        """
+        Check whether a sandbox belongs to the pool and has not been claimed yet
+
+        Args:
+            sandbox_id: Sandbox ID
+
+        Returns:
+            bool: True for sandboxes being created or waiting in the pool
+        """
+        return sandbox_id in self._unclaimed
+
+    async def claim(self) -> Optional[str]:
+        """
+        Claim a pre-started sandbox
+
+        Returns:
+            Optional[str]: Sandbox ID, or None if no healthy sandbox is ready
+        """
+        start_time = time.monotonic()
+        sandbox_id = None
+
+        while self._ready:
+            # popleft is atomic on the event loop, so two requests never get the same entry
+            pooled = self._ready.popleft()
+            if await self.service._docker(self._activate, pooled.sandbox_id):
+                sandbox_id = pooled.sandbox_id
+                self._unclaimed.discard(sandbox_id)
+                await self.service.inventory.refresh_sandbox(sandbox_id)
+                break
+            await self._discard(pooled.sandbox_id)
+
+        self._refill_event.set()
+
+        if not sandbox_id:
+            self.misses += 1
+            logger.info("Sandbox pool miss, falling back to cold start")
+            return None
+
+        latency_ms = (time.monotonic() - start_time) * 1000
+        self.hits += 1
+        self._claim_count += 1
+        self._claim_latency_total_ms += latency_ms
+        self._claim_latency_max_ms = max(self._claim_latency_max_ms, latency_ms)
+        self._last_claim_latency_ms = latency_ms
+        logger.info(f"Claimed pooled sandbox: {sandbox_id}, claim latency: {latency_ms:.1f} ms")
+        return sandbox_id
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool metrics
+
+        Returns:
+            Dict: Pool size, hit/miss counters and claim latency
+        """
+        claims = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "target_size": self.size,
+            "ready": len(self._ready),
+            "creating": self._creating,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / claims, 4) if claims else 0.0,
+            "create_failures": self.create_failures,
+            "recycled": self.recycled,
+            "claim_latency_ms": {
+                "last": round(self._last_claim_latency_ms, 2),
+                "avg": round(self._claim_latency_total_ms / self._claim_count, 2) if self._claim_count else 0.0,
+                "max": round(self._claim_latency_max_ms, 2),
+            },
+        }
+
+    def _activate(self, sandbox_id: str) -> bool:
+        """
+        Check a pooled sandbox is still running and give its agent container the regular name,
+        runs in the Docker executor
+
+        Args:
+            sandbox_id: Sandbox ID
+
+        Returns:
+            bool: Whether the sandbox can be handed out
+        """
+        try:
+            container = self.service._get_agent_container_by_sandbox_id(sandbox_id)
+            qdrant_container = self.service._get_qdrant_container_by_sandbox_id(sandbox_id)
+            if not container or not qdrant_container:
+                logger.warning(f"Pooled sandbox {sandbox_id} is missing containers, discarding")
+                return False
+            if container.status != "running" or qdrant_container.status != "running":
+                logger.warning(
+                    f"Pooled sandbox {sandbox_id} is not running (agent: {container.status}, "
+                    f"qdrant: {qdrant_container.status}), discarding"
+                )
+                return False
+            container.rename(f"{AGENT_LABEL_PREFIX}{sandbox_id}")
+            return True
+        except Exception as e:
+            logger.error(f"Error activating pooled sandbox {sandbox_id}: {e}")
+            return False
+
+    async def _refill_loop(self) -> None:
+        """Keep the pool at its target size and recycle sandboxes that are too old"""
+        await self.service._docker(self._remove_stale_pool_containers)
+        while True:
+            try:
+                await self._recycle_expired()
+                while len(self._ready) + self._creating < self.size:
+                    self._creating += 1
+                    task = asyncio.create_task(self._create_pooled_sandbox())
+                    self._create_tasks.add(task)
+                    task.add_done_callback(self._create_tasks.discard)
+
+                self._refill_event.clear()
+                try:
+                    await asyncio.wait_for(self._refill_event.wait(), timeout=self.check_interval)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error during sandbox pool refill: {e}")
+                await asyncio.sleep(self.check_interval)
+
+    async def _create_pooled_sandbox(self) -> None:
+        """Start one agent and Qdrant pair and add it to the pool once healthy"""
+        sandbox_id = str(uuid.uuid4())[:8]
+        self._unclaimed.add(sandbox_id)
+        try:
+            await self.service._create_qdrant_container(sandbox_id)
+            await self.service._create_agent_container(
+                sandbox_id,
+                container_name=f"{POOL_AGENT_LABEL_PREFIX}{sandbox_id}"
+            )
+            self._ready.append(PooledSandbox(sandbox_id=sandbox_id, created_at=time.time()))
+            logger.info(f"Pooled sandbox ready: {sandbox_id}, ready: {len(self._ready)}/{self.size}")
+        except Exception as e:
+            self.create_failures += 1
+            logger.error(f"Error creating pooled sandbox {sandbox_id}: {e}")
+            await self._discard(sandbox_id)
+            # Avoid a tight retry loop when the Docker daemon or image is broken
+            await asyncio.sleep(self.check_interval)
+        finally:
+            self._creating -= 1
+            self._refill_event.set()
+
+    async def _recycle_expired(self) -> None:
+        """Remove unclaimed sandboxes older than max_age"""
+        now = time.time()
+        while self._ready and now - self._ready[0].created_at > self.max_age:
+            pooled = self._ready.popleft()
+            logger.info(f"Recycling expired pooled sandbox: {pooled.sandbox_id}")
+            await self._discard(pooled.sandbox_id)
+            self.recycled += 1
+
+    async def _discard(self, sandbox_id: str) -> None:
+        """Remove a pooled sandbox and drop it from the container inventory"""
+        await self.service._docker(self._remove_pooled_sandbox, sandbox_id)
+        self.service.inventory.discard(sandbox_id)
+        self._unclaimed.discard(sandbox_id)
+
+    def _remove_pooled_sandbox(self, sandbox_id: str) -> None:
+        """Force-remove both containers of a pooled sandbox, runs in the Docker executor"""
+        for label in (AGENT_LABEL, QDRANT_LABEL):
+            try:
+                containers = self.service.docker_client.containers.list(
+                    all=True,
+                    filters={"label": f"{label}={sandbox_id}"}
+                )
+                for container in containers:
+                    container.remove(force=True)
+            except Exception as e:
+                logger.error(f"Error removing pooled sandbox container {sandbox_id} ({label}): {e}")
+
+    def _remove_stale_pool_containers(self) -> None:
+        """Remove unclaimed pooled sandboxes left over by a previous gateway process, runs in the Docker executor"""
+        try:
+            containers = self.service.docker_client.containers.list(
+                all=True,
+                filters={"name": POOL_AGENT_LABEL_PREFIX}
+            )
+            for container in containers:
+                if not container.name.startswith(POOL_AGENT_LABEL_PREFIX):
+                    continue
+                sandbox_id = container.labels.get(AGENT_LABEL)
+                if sandbox_id:
+                    logger.info(f"Removing stale pooled sandbox: {sandbox_id}")
+                    self._remove_pooled_sandbox(sandbox_id)
+        except Exception as e:
+            logger.error(f"Error removing stale pooled sandboxes: {e}")
@@ -2,12 +2,14 @@
 Sandbox service core logic
 """
 import asyncio
+import functools
 import json
 import logging
 import time
 import uuid
 import os
-from typing import Dict, List, Optional, Tuple, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
 import docker
 import websockets
@@ -28,15 +30,18 @@ from app.config import (
 )
 from app.config.constants import AGENT_LABEL
 from app.models.sandbox import ContainerInfo, SandboxInfo
+from app.services.container_inventory import ContainerInventory
+from app.services.sandbox_pool import SandboxPool
 from app.utils.exceptions import (
     ContainerOperationError,
     SandboxNotFoundError,
-    handle_exceptions,
     async_handle_exceptions
 )
 
 logger = logging.getLogger("sandbox_gateway")
 
+T = TypeVar("T")
+
 
 class SandboxService:
     """Sandbox service responsible for managing Docker containers and WebSocket communication"""
@@ -54,6 +59,15 @@ class SandboxService:
             self.qdrant_grpc_port = settings.qdrant_grpc_port
             # Get network configuration, default to 'bridge'
             self.network_name = os.environ.get('SANDBOX_NETWORK', 'bridge')
+            # The Docker SDK is blocking, all calls from async code go through this executor
+            self._docker_executor = ThreadPoolExecutor(
+                max_workers=settings.docker_executor_workers,
+                thread_name_prefix="docker"
+            )
+            # Label-indexed container cache serving lookups and listings
+            self.inventory = ContainerInventory(self, settings.container_inventory_ttl)
+            # Pre-started sandboxes claimed by create_sandbox
+            self.pool = SandboxPool(self, settings.sandbox_pool_size)
             logger.info(
                 f"Docker client initialized successfully, using image: {self.image_name}, "
                 f"running container timeout: {self.running_container_expire_time} seconds, "
@@ -65,6 +79,21 @@ class SandboxService:
             logger.error(f"Docker client initialization failed: {e}")
             raise
 
+    async def _docker(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking Docker SDK call in the bounded Docker executor
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._docker_executor, functools.partial(func, *args, **kwargs))
+
     def _get_agent_container_by_sandbox_id(self, sandbox_id: str) -> Optional[docker.models.containers.Container]:
         """
         Get the corresponding container by sandbox ID
@@ -107,17 +136,19 @@ class SandboxService:
             logger.error(f"Error querying Qdrant container: {e}")
             return None
 
-    def _get_container_info(self, container: docker.models.containers.Container) -> ContainerInfo:
+    def _get_container_info(self, container: docker.models.containers.Container, reload: bool = True) -> ContainerInfo:
         """
         Get detailed information about the container
 
         Args:
             container: Docker container object
+            reload: Whether to re-inspect the container first
 
         Returns:
             ContainerInfo: Container information
         """
-        container.reload()
+        if reload:
+            container.reload()
 
         # Get container information and network settings
         network_settings = container.attrs['NetworkSettings']
@@ -256,12 +287,13 @@ class SandboxService:
             raise ContainerOperationError(error_msg)
 
     @async_handle_exceptions
-    async def _create_agent_container(self, sandbox_id: str) -> str:
+    async def _create_agent_container(self, sandbox_id: str, container_name: Optional[str] = None) -> str:
         """
         Create new sandbox container and perform health check
 
         Args:
-            container_id: Container ID
+            sandbox_id: Sandbox ID
+            container_name: Container name, defaults to AGENT_LABEL_PREFIX + sandbox_id
 
         Returns:
             str: Docker container ID
@@ -271,7 +303,7 @@ class SandboxService:
         """
         try:
             # Check if there's already an exited container
-            container = self._get_agent_container_by_sandbox_id(sandbox_id)
+            container = await self._docker(self._get_agent_container_by_sandbox_id, sandbox_id)
 
             if container:
                 if container.status == "running":
@@ -279,13 +311,13 @@ class SandboxService:
                 elif container.status == "exited":
                     logger.info(f"Found exited Agent container: {container.name}, attempting to restart")
                     # Start existing container
-                    container.start()
+                    await self._docker(container.start)
                 else:
                     raise ContainerOperationError(f"Agent container status abnormal: {container.status}")
             else:
                 # Check if image exists
                 try:
-                    self.docker_client.images.get(self.image_name)
+                    await self._docker(self.docker_client.images.get, self.image_name)
                     logger.info(f"Using image: {self.image_name}")
                 except ImageNotFound:
                     raise ContainerOperationError(f"Image does not exist: {self.image_name}")
@@ -327,11 +359,12 @@ class SandboxService:
                     volumes = {}
 
                 # Mount config file
-                container = self.docker_client.containers.run(
+                container = await self._docker(
+                    self.docker_client.containers.run,
                     self.image_name,
                     detach=True,
                     environment=environment,
-                    name=f"{AGENT_LABEL_PREFIX}{sandbox_id}",
+                    name=container_name or f"{AGENT_LABEL_PREFIX}{sandbox_id}",
                     labels={
                         AGENT_LABEL: sandbox_id,
                         SANDBOX_LABEL: sandbox_id
@@ -342,38 +375,27 @@ class SandboxService:
                 logger.info(f"Container created: {container.name}, using network: {self.network_name}")
 
             # The following code is the same whether starting an existing container or creating a new one
-            # Wait for container to start
-            container.reload()
-
-            # Get container information
-            container_info = self._get_container_info(container)
+            # Wait for container to start and get container information
+            container_info = await self._docker(self._get_container_info, container)
 
             # Use health check endpoint to confirm container is ready
             container_ready = await self._wait_for_container_ready(container_info)
             if not container_ready:
                 # Get container logs
-                container_logs = self._get_container_logs(container)
+                container_logs = await self._docker(self._get_container_logs, container)
                 error_msg = "Container startup timeout, health check failed"
                 logger.error(f"{error_msg}\nContainer logs:\n{container_logs}")
                 # Clean up container
-                try:
-                    container.stop()
-                    container.remove()
-                except Exception as e:
-                    logger.error(f"Error cleaning up failed container: {e}")
+                await self._stop_and_remove(container, "Error cleaning up failed container")
                 raise ContainerOperationError(f"{error_msg}, see logs for detailed error information")
 
             if not container_info.ip:
                 # Get container logs
-                container_logs = self._get_container_logs(container)
+                container_logs = await self._docker(self._get_container_logs, container)
                 error_msg = "Unable to get container IP address"
                 logger.error(f"{error_msg}\nContainer logs:\n{container_logs}")
                 # Clean up container
-                try:
-                    container.stop()
-                    container.remove()
-                except Exception as e:
-                    logger.error(f"Error cleaning up failed container: {e}")
+                await self._stop_and_remove(container, "Error cleaning up failed container")
                 raise ContainerOperationError(error_msg)
 
             # Print sandbox container IP
@@ -412,8 +434,12 @@ class SandboxService:
         Raises:
             ContainerOperationError: Container operation failed
         """
-        # If no sandbox_id is provided, generate a random ID
+        # If no sandbox_id is provided, try a pre-started sandbox first, then generate a random ID
         if not sandbox_id:
+            if self.pool.enabled:
+                pooled_sandbox_id = await self.pool.claim()
+                if pooled_sandbox_id:
+                    return pooled_sandbox_id
             sandbox_id = str(uuid.uuid4())[:8]
 
         try:
@@ -423,6 +449,7 @@ class SandboxService:
             await self._create_agent_container(sandbox_id)
             logger.info(f"Agent container created, associated sandbox ID: {sandbox_id}")
 
+            await self.inventory.refresh_sandbox(sandbox_id)
             return sandbox_id
 
         except ContainerOperationError:
@@ -452,7 +479,7 @@ class SandboxService:
         """
         try:
             # Check if there's already an exited Qdrant container
-            qdrant_container = self._get_qdrant_container_by_sandbox_id(sandbox_id)
+            qdrant_container = await self._docker(self._get_qdrant_container_by_sandbox_id, sandbox_id)
 
             if qdrant_container:
                 if qdrant_container.status == "running":
@@ -461,13 +488,13 @@ class SandboxService:
                 elif qdrant_container.status == "exited":
                     logger.info(f"Found exited Qdrant container: {qdrant_container.name}, attempting to restart")
                     # Start existing container
-                    qdrant_container.start()
+                    await self._docker(qdrant_container.start)
                 else:
                     raise ContainerOperationError(f"Qdrant container status abnormal: {qdrant_container.status}")
             else:
                 # Check if Qdrant image exists
                 try:
-                    self.docker_client.images.get(self.qdrant_image_name)
+                    await self._docker(self.docker_client.images.get, self.qdrant_image_name)
                     logger.info(f"Using Qdrant image: {self.qdrant_image_name}")
                 except ImageNotFound:
                     raise ContainerOperationError(f"Qdrant image does not exist: {self.qdrant_image_name}")
@@ -476,7 +503,8 @@ class SandboxService:
                 qdrant_name = f"{QDRANT_LABEL_PREFIX}{sandbox_id}"
 
                 # Create and start Qdrant container
-                qdrant_container = self.docker_client.containers.run(
+                qdrant_container = await self._docker(
+                    self.docker_client.containers.run,
                     self.qdrant_image_name,
                     detach=True,
                     environment={},
@@ -490,25 +518,18 @@ class SandboxService:
                 logger.info(f"Qdrant container created: {qdrant_container.name}, associated sandbox ID: {sandbox_id}, using network: {self.network_name}")
 
             # The following code is the same whether starting an existing container or creating a new one
-            # Wait for container to start
-            qdrant_container.reload()
-
-            # Get container information
-            container_info = self._get_container_info(qdrant_container)
+            # Wait for container to start and get container information
+            container_info = await self._docker(self._get_container_info, qdrant_container)
 
             # Check if Qdrant container is ready
             qdrant_ready = await self._wait_for_qdrant_ready(container_info)
             if not qdrant_ready:
                 # Get container logs
-                container_logs = self._get_container_logs(qdrant_container)
+                container_logs = await self._docker(self._get_container_logs, qdrant_container)
                 error_msg = "Qdrant container startup timeout, health check failed"
                 logger.error(f"{error_msg}\nContainer logs:\n{container_logs}")
                 # Clean up container
-                try:
-                    qdrant_container.stop()
-                    qdrant_container.remove()
-                except Exception as e:
-                    logger.error(f"Error cleaning up failed Qdrant container: {e}")
+                await self._stop_and_remove(qdrant_container, "Error cleaning up failed Qdrant container")
                 raise ContainerOperationError(f"{error_msg}, see logs for detailed error information")
 
             # Record container status
@@ -563,8 +584,22 @@ class SandboxService:
         logger.warning(f"Qdrant container health check failed, reached maximum attempts: {max_attempts}")
         return False
 
-    @handle_exceptions
-    def get_agent_container(self, sandbox_id: str) -> Optional[SandboxInfo]:
+    async def _stop_and_remove(self, container: docker.models.containers.Container, error_prefix: str) -> None:
+        """
+        Stop and remove a container, logging instead of raising on failure
+
+        Args:
+            container: Docker container object
+            error_prefix: Log message prefix used on failure
+        """
+        try:
+            await self._docker(container.stop)
+            await self._docker(container.remove)
+        except Exception as e:
+            logger.error(f"{error_prefix}: {e}")
+
+    @async_handle_exceptions
+    async def get_agent_container(self, sandbox_id: str) -> Optional[SandboxInfo]:
         """
         Get sandbox information
 
@@ -574,12 +609,12 @@ class SandboxService:
         Returns:
             SandboxInfo: Sandbox information, returns None if sandbox doesn't exist
         """
-        container = self._get_agent_container_by_sandbox_id(sandbox_id)
+        entry = await self.inventory.get_agent(sandbox_id)
 
-        if not container:
+        if not entry:
             return None
 
-        container_info = self._get_container_info(container)
+        container_info = entry.info
 
         return SandboxInfo(
             sandbox_id=sandbox_id,
@@ -589,8 +624,8 @@ class SandboxService:
             ip_address=container_info.ip
         )
 
-    @handle_exceptions
-    def list_sandboxes(self) -> List[SandboxInfo]:
+    @async_handle_exceptions
+    async def list_sandboxes(self) -> List[SandboxInfo]:
         """
         List all sandbox containers
 
@@ -599,17 +634,12 @@ class SandboxService:
         """
         result = []
         try:
-            # Get all containers with sandbox label
-            containers = self.docker_client.containers.list(
-                all=True,
-                filters={"label": [f"{SANDBOX_LABEL}"]}
-            )
+            agents = await self.inventory.list_agents()
 
-            for container in containers:
-                sandbox_id = container.labels.get(SANDBOX_LABEL)
-                # Exclude Qdrant containers
-                if sandbox_id and container.name.startswith(AGENT_LABEL_PREFIX):
-                    container_info = self._get_container_info(container)
+            for sandbox_id, entry in agents.items():
+                # Exclude unclaimed pooled containers
+                if entry.name.startswith(AGENT_LABEL_PREFIX):
+                    container_info = entry.info
                     result.append(SandboxInfo(
                         sandbox_id=sandbox_id,
                         status=container_info.status,
@@ -622,8 +652,8 @@ class SandboxService:
 
         return result
 
-    @handle_exceptions
-    def delete_sandbox(self, sandbox_id: str) -> bool:
+    @async_handle_exceptions
+    async def delete_sandbox(self, sandbox_id: str) -> bool:
         """
         Delete sandbox container
 
@@ -637,31 +667,34 @@ class SandboxService:
             SandboxNotFoundError: Sandbox doesn't exist
             ContainerOperationError: Container operation failed
         """
-        container = self._get_agent_container_by_sandbox_id(sandbox_id)
+        container = await self._docker(self._get_agent_container_by_sandbox_id, sandbox_id)
 
         if not container:
+            self.inventory.discard(sandbox_id)
             raise SandboxNotFoundError(sandbox_id)
 
         try:
             # Delete corresponding Qdrant container first
-            qdrant_container = self._get_qdrant_container_by_sandbox_id(sandbox_id)
+            qdrant_container = await self._docker(self._get_qdrant_container_by_sandbox_id, sandbox_id)
             if qdrant_container:
                 try:
-                    qdrant_container.stop()
-                    qdrant_container.remove()
+                    await self._docker(qdrant_container.stop)
+                    await self._docker(qdrant_container.remove)
                     logger.info(f"Qdrant container deleted, associated sandbox ID: {sandbox_id}")
                 except Exception as e:
                     logger.error(f"Error deleting Qdrant container {sandbox_id}: {e}")
 
             # Delete sandbox container
-            container.stop()
-            container.remove()
+            await self._docker(container.stop)
+            await self._docker(container.remove)
             logger.info(f"Sandbox container deleted: {sandbox_id}")
             return True
         except Exception as e:
             error_msg = f"Error deleting sandbox container {sandbox_id}: {e}"
             logger.error(error_msg)
             raise ContainerOperationError(error_msg)
+        finally:
+            await self.inventory.refresh_sandbox(sandbox_id)
 
     @async_handle_exceptions
     async def handle_websocket(self, websocket: WebSocket, sandbox_id: str) -> None:
@@ -680,9 +713,9 @@ class SandboxService:
         logger.info(f"Sandbox WebSocket connection accepted, connecting to sandbox: {sandbox_id}")
 
         # Check if sandbox exists
-        container = self._get_agent_container_by_sandbox_id(sandbox_id)
+        entry = await self.inventory.get_agent(sandbox_id)
 
-        if not container:
+        if not entry:
             error_msg = f"Sandbox {sandbox_id} does not exist or has expired"
             logger.error(error_msg)
             await websocket.send_text(json.dumps({
@@ -694,7 +727,7 @@ class SandboxService:
 
         try:
             # Get container information
-            container_info = self._get_container_info(container)
+            container_info = entry.info
             container_ip = container_info.ip
             ws_port = container_info.ws_port
 
@@ -825,23 +858,21 @@ class SandboxService:
         Returns:
             Tuple[bool, str]: (is healthy, status information)
         """
-        container = self._get_agent_container_by_sandbox_id(container_id)
+        container = await self._docker(self._get_agent_container_by_sandbox_id, container_id)
         if not container:
             return False, "Container does not exist"
 
         try:
-            container.reload()
+            # Get container information
+            container_info = await self._docker(self._get_container_info, container)
 
             # Check if container is running
             if container.status != "running":
                 # Get container logs to understand failure reason
-                container_logs = self._get_container_logs(container)
+                container_logs = await self._docker(self._get_container_logs, container)
                 logger.error(f"Container status abnormal: {container.status}\nContainer logs:\n{container_logs}")
                 return False, f"Container status: {container.status}"
 
-            # Get container information
-            container_info = self._get_container_info(container)
-
             # Try to connect to container WebSocket service
             container_ws_url = f"ws://{container_info.ip}:{container_info.ws_port}/ws"
 
@@ -851,14 +882,14 @@ class SandboxService:
                     return True, "Container healthy"
             except Exception as e:
                 # Get container logs to understand why WebSocket service failed to start
-                container_logs = self._get_container_logs(container)
+                container_logs = await self._docker(self._get_container_logs, container)
                 logger.error(f"WebSocket connection failed: {e}\nContainer logs:\n{container_logs}")
                 return False, f"WebSocket connection failed: {e}"
 
         except Exception as e:
             # Try to get container logs, even if an exception occurred during health check
             try:
-                container_logs = self._get_container_logs(container)
+                container_logs = await self._docker(self._get_container_logs, container)
                 logger.error(f"Health check failed: {e}\nContainer logs:\n{container_logs}")
             except Exception as log_error:
                 logger.error(f"Health check failed: {e}, and unable to get container logs: {log_error}")
@@ -872,14 +903,17 @@ class SandboxService:
             current_time: Current timestamp
         """
         try:
-            # Get all running containers with sandbox labels
-            running_containers = self.docker_client.containers.list(
-                filters={"label": [f"{SANDBOX_LABEL}"], "status": "running"}
-            )
-
-            for container in running_containers:
+            # Get all running containers with sandbox labels from a fresh inventory scan
+            await self.inventory.refresh()
+            running_entries = [entry for entry in await self.inventory.list_all() if entry.info.status == "running"]
+
+            for entry in running_entries:
+                container = entry.container
+                # Unclaimed pooled sandboxes (agent and Qdrant containers) are recycled by the pool itself
+                if self.pool.is_unclaimed(container.labels.get(SANDBOX_LABEL, "")):
+                    continue
                 try:
-                    container_info = self._get_container_info(container)
+                    container_info = entry.info
 
                     # Use start time instead of creation time
                     started_at = container_info.started_at
@@ -898,7 +932,7 @@ class SandboxService:
                     # Check if exceeded running time limit
                     if running_seconds > self.running_container_expire_time:
                         logger.info(f"Starting to pause expired container: {container.name}, running time: {running_seconds:.2f} seconds")
-                        container.stop()
+                        await self._docker(container.stop)
                         logger.info(f"Successfully paused container: {container.name}")
                 except Exception as e:
                     logger.error(f"Error pausing container: {container.name}, {e}")
@@ -913,15 +947,14 @@ class SandboxService:
             current_time: Current timestamp
         """
         try:
-            # Get all exited containers with sandbox labels
-            exited_containers = self.docker_client.containers.list(
-                all=True,  # Include containers of all statuses
-                filters={"label": [f"{SANDBOX_LABEL}"], "status": "exited"}
-            )
+            # Get all exited containers with sandbox labels from a fresh inventory scan
+            await self.inventory.refresh()
+            exited_entries = [entry for entry in await self.inventory.list_all() if entry.info.status == "exited"]
 
-            for container in exited_containers:
+            for entry in exited_entries:
+                container = entry.container
                 try:
-                    container_info = self._get_container_info(container)
+                    container_info = entry.info
                     created_at = container_info.created_at
                     exited_at = container_info.exited_at
 
@@ -935,7 +968,7 @@ class SandboxService:
                     # Check if exceeded exited container retention time
                     if idle_seconds > self.exited_container_expire_time:
                         logger.info(f"Starting to delete expired exited container: {container.name}, exited time: {idle_seconds:.2f} seconds")
-                        container.remove()
+                        await self._docker(container.remove)
                         logger.info(f"Successfully deleted exited container: {container.name}")
                 except Exception as e:
                     logger.error(f"Error processing exited container: {container.name} - {e}")
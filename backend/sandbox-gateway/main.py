@@ -98,7 +98,7 @@ async def startup_event() -> None:
     # Check if Docker image exists
     try:
         image_name = sandbox_service.image_name
-        sandbox_service.docker_client.images.get(image_name)
+        await sandbox_service._docker(sandbox_service.docker_client.images.get, image_name)
         logger.info(f"Sandbox container image '{image_name}' is ready")
     except Exception as e:
         logger.warning(f"Warning: Sandbox container image check failed: {str(e)}")
@@ -108,6 +108,15 @@ async def startup_event() -> None:
     asyncio.create_task(sandbox_service.cleanup_idle_containers())
     logger.info("Sandbox gateway started, beginning periodic cleanup of idle sandbox containers")
 
+    # Start warm sandbox pool
+    sandbox_service.pool.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Execute on application shutdown"""
+    await sandbox_service.pool.stop()
+
 
 async def start_async() -> None:
     """Asynchronously start sandbox gateway service"""